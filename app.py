@@ -1,54 +1,37 @@
 import os
+from typing import Optional
 
-import flet
-
-from src.agent.domain.action.action_repository import ActionRepository
-from src.agent.domain.action.action_configuration import ActionConfiguration
-from src.agent.domain.action.move_down_action import MoveDownAction
-from src.agent.domain.action.move_left_action import MoveLeftAction
-from src.agent.domain.action.move_right_action import MoveRightAction
-from src.agent.domain.action.move_up_action import MoveUpAction
-from src.agent.domain.agent import Agent
-from src.agent.domain.sensor.down_directional_sensor import DownDirectionalSensor
-from src.agent.domain.sensor.left_directional_sensor import LeftDirectionalSensor
-from src.agent.domain.sensor.merged_sensor import MergedSensor
-from src.agent.domain.sensor.right_directional_sensor import RightDirectionalSensor
-from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
-from src.agent.domain.sensor.sensor_repository import SensorRepository
-from src.agent.domain.sensor.up_directional_sensor import UpDirectionalSensor
-from src.environment.application.environment_agent_service import EnvironmentAgentService, ExecuteActionResult, ResultCode, ExecuteSensorResult
+from src.agent.domain.default_agents import DefaultAgents
+from src.environment.application.environment_agent_service import EnvironmentAgentService
 from src.environment.application.environment_service import EnvironmentService
 from src.environment.domain.terrain.terrain_repository import TerrainRepository
 from src.map.domain.map_repository import MapRepository
-from ui.app_ui import AppUi
+from src.profiling.application.profiling_service import ProfilingService
 
-if __name__ == '__main__':
-  project_root = os.path.dirname(os.path.abspath(__file__))
 
+def create_services(project_root: str) -> tuple[EnvironmentAgentService, EnvironmentService, MapRepository, TerrainRepository]:
+  """
+  Creates the services of the application, without loading the user interface.
+
+  Args:
+    project_root (str): The directory of the project, with the resources directory.
+
+  Returns:
+    tuple[EnvironmentAgentService, EnvironmentService, MapRepository, TerrainRepository]: The services and repositories.
+  """
   terrain_repository: TerrainRepository = TerrainRepository(f'{project_root}/resources/terrain')
   map_repository: MapRepository = MapRepository(f'{project_root}/resources/map')
   environment_service: EnvironmentService = EnvironmentService(map_repository, terrain_repository)
+  environment_agent_service: EnvironmentAgentService = EnvironmentAgentService(DefaultAgents.create_action_repository(), DefaultAgents.create_sensor_repository())
+  return environment_agent_service, environment_service, map_repository, terrain_repository
 
-  action_repository: ActionRepository = ActionRepository()
-  action_repository.add_actions(MoveUpAction(), MoveDownAction(), MoveLeftAction(), MoveRightAction())
-
-  sensor_repository: SensorRepository = SensorRepository()
-  up_directional_sensor: UpDirectionalSensor = UpDirectionalSensor()
-  down_directional_sensor: DownDirectionalSensor = DownDirectionalSensor()
-  left_directional_sensor: LeftDirectionalSensor = LeftDirectionalSensor()
-  right_directional_sensor: RightDirectionalSensor = RightDirectionalSensor()
-
-  sensor_repository.add_sensors(
-    up_directional_sensor,
-    down_directional_sensor,
-    left_directional_sensor,
-    right_directional_sensor,
-    MergedSensor('up_down', [up_directional_sensor, down_directional_sensor]),
-    MergedSensor('left_right', [left_directional_sensor, right_directional_sensor]),
-    MergedSensor('every_direction', [up_directional_sensor, down_directional_sensor, left_directional_sensor, right_directional_sensor])
-  )
 
-  environment_agent_service: EnvironmentAgentService = EnvironmentAgentService(action_repository, sensor_repository)
+def main() -> None:
+  """
+  Starts the user interface, importing flet and the views only once the services are ready.
+  """
+  project_root = os.path.dirname(os.path.abspath(__file__))
+  environment_agent_service, environment_service, map_repository, terrain_repository = create_services(project_root)
 
   # environment.add_agent(human_agent)
   #
@@ -96,6 +79,24 @@ if __name__ == '__main__':
   #
   # environment.print_discovered_map()
 
-  app_ui: AppUi = AppUi(environment_agent_service, environment_service, map_repository, terrain_repository)
+  # Profiling is switched with F9 while the app runs, and starts enabled if PROFILE_OUTPUT is set. The timers are written
+  # on exit to PROFILE_OUTPUT, profile.json if unset, as Prometheus text for .prom files.
+  profiling_service: ProfilingService = ProfilingService()
+  profile_output: Optional[str] = os.environ.get('PROFILE_OUTPUT')
+  if profile_output:
+    profiling_service.enable()
+
+  import flet
+  from ui.app_ui import AppUi
+
+  app_ui: AppUi = AppUi(environment_agent_service, environment_service, map_repository, terrain_repository, profiling_service)
 
   flet.app(target=app_ui.start)
+
+  if profiling_service.get_registry().get_timers():
+    profile_output = profile_output or 'profile.json'
+    with open(profile_output, 'w') as profile_file:
+      profile_file.write(profiling_service.export_prometheus() if profile_output.endswith('.prom') else profiling_service.export_json())
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from benchmark.benchmark_result import BenchmarkResult
+from benchmark.benchmark_runner import BenchmarkRunner
+from benchmark.benchmark_suite import BenchmarkSuite
+from benchmark.synthetic_map import SyntheticMap
+
+SHIPPED_MAPS: list[tuple[str, str]] = [('maze.csv', 'maze.json'), ('terrain.csv', 'terrain.json'), ('terrain_500x500.csv', 'terrain.json')]
+SYNTHETIC_TERRAIN: str = 'terrain.json'
+
+
+def format_table(results: list[BenchmarkResult]) -> str:
+  """
+  Formats the results as a plain text table.
+
+  Args:
+    results (list[BenchmarkResult]): The results to format.
+
+  Returns:
+    str: The table, one line per result after the header.
+  """
+  lines: list[tuple[str, ...]] = [('Map', 'Benchmark', 'Calls', 'Ops/s', 'p50 (us)', 'p90 (us)', 'p99 (us)', 'Peak (KiB)')]
+  for result in results:
+    peak_memory = result.get_peak_memory()
+    lines.append((
+      result.get_map_name(),
+      result.get_name(),
+      str(result.get_calls()),
+      f'{result.get_ops_per_second():.1f}',
+      f'{result.get_percentile(50) / 1e3:.1f}',
+      f'{result.get_percentile(90) / 1e3:.1f}',
+      f'{result.get_percentile(99) / 1e3:.1f}',
+      f'{peak_memory / 1024:.1f}' if peak_memory is not None else '-'))
+  widths: list[int] = [max(len(line[column]) for line in lines) for column in range(len(lines[0]))]
+  table: list[str] = [' | '.join(value.ljust(width) for value, width in zip(line, widths)).rstrip() for line in lines]
+  table.insert(1, '-+-'.join('-' * width for width in widths))
+  return '\n'.join(table)
+
+
+if __name__ == '__main__':
+  project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+  parser = argparse.ArgumentParser(prog='python -m benchmark', description='Benchmarks map loading, environment creation, sensors, actions and episodes.')
+  parser.add_argument('--sizes', type=lambda value: [int(size) for size in value.split(',') if size], default=[1000, 2000, 5000], help='Comma separated sizes of the synthetic square maps, empty to skip them.')
+  parser.add_argument('--no-shipped', action='store_true', help='Skip the maps shipped in resources/map.')
+  parser.add_argument('--time-budget', type=float, default=1.0, help='Seconds spent measuring each benchmark once the minimum calls are made.')
+  parser.add_argument('--min-calls', type=int, default=3, help='Minimum measured calls of each benchmark.')
+  parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic maps, positions and moves.')
+  parser.add_argument('--output', help='Path of the JSON report, - to print it instead of the table.')
+  arguments = parser.parse_args()
+
+  suite: BenchmarkSuite = BenchmarkSuite(BenchmarkRunner(min_calls=arguments.min_calls, time_budget=arguments.time_budget), f'{project_root}/resources/terrain', arguments.seed)
+  results: list[BenchmarkResult] = []
+  if not arguments.no_shipped:
+    for map_name, terrain_name in SHIPPED_MAPS:
+      print(f'Benchmarking {map_name}...', file=sys.stderr)
+      results.extend(suite.run(f'{project_root}/resources/map', map_name, terrain_name))
+  with tempfile.TemporaryDirectory() as synthetic_directory_path:
+    for size in arguments.sizes:
+      map_name: str = f'synthetic_{size}x{size}.csv'
+      print(f'Benchmarking {map_name}...', file=sys.stderr)
+      SyntheticMap.write_csv(f'{synthetic_directory_path}/{map_name}', size, [1, 2, 3, 4, 5, 6, 7], arguments.seed)
+      results.extend(suite.run(synthetic_directory_path, map_name, SYNTHETIC_TERRAIN))
+
+  report: dict[str, any] = {
+    'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    'python': platform.python_version(),
+    'platform': platform.platform(),
+    'results': [result.to_dict() for result in results]
+  }
+  if arguments.output == '-':
+    print(json.dumps(report, indent=2))
+  else:
+    print(format_table(results))
+    if arguments.output is not None:
+      with open(arguments.output, 'w') as file:
+        json.dump(report, file, indent=2)
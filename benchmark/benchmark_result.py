@@ -0,0 +1,113 @@
+import math
+from typing import Optional
+
+
+class BenchmarkResult:
+  """
+  Measurements of a benchmark: throughput, latency percentiles and peak memory.
+
+  Attributes:
+    __calls (int): The number of measured calls.
+    __latencies (list[int]): The latency of every measured call in nanoseconds, sorted.
+    __map_name (str): The name of the map the benchmark ran on.
+    __name (str): The name of the benchmark.
+    __peak_memory (Optional[int]): The peak of memory allocated by a call in bytes, if it was measured.
+  """
+
+  def __init__(self, name: str, map_name: str, latencies: list[int], peak_memory: Optional[int]):
+    """
+    Initializes a BenchmarkResult instance.
+
+    Args:
+      name (str): The name of the benchmark.
+      map_name (str): The name of the map the benchmark ran on.
+      latencies (list[int]): The latency of every measured call in nanoseconds.
+      peak_memory (Optional[int]): The peak of memory allocated by a call in bytes, if it was measured.
+    """
+    self.__calls: int = len(latencies)
+    self.__latencies: list[int] = sorted(latencies)
+    self.__map_name: str = map_name
+    self.__name: str = name
+    self.__peak_memory: Optional[int] = peak_memory
+
+  def get_name(self) -> str:
+    """
+    Returns the name of the benchmark.
+
+    Returns:
+      str: The name of the benchmark.
+    """
+    return self.__name
+
+  def get_map_name(self) -> str:
+    """
+    Returns the name of the map the benchmark ran on.
+
+    Returns:
+      str: The name of the map.
+    """
+    return self.__map_name
+
+  def get_calls(self) -> int:
+    """
+    Returns the number of measured calls.
+
+    Returns:
+      int: The number of calls.
+    """
+    return self.__calls
+
+  def get_ops_per_second(self) -> float:
+    """
+    Returns the number of calls per second.
+
+    Returns:
+      float: The calls per second.
+    """
+    total: int = sum(self.__latencies)
+    return self.__calls * 1e9 / total if total > 0 else float('inf')
+
+  def get_percentile(self, percentile: float) -> int:
+    """
+    Returns a latency percentile, using the nearest-rank method.
+
+    Args:
+      percentile (float): The percentile, between 0 and 100.
+
+    Returns:
+      int: The latency in nanoseconds.
+    """
+    rank: int = min(self.__calls, max(1, math.ceil(self.__calls * percentile / 100)))
+    return self.__latencies[rank - 1]
+
+  def get_peak_memory(self) -> Optional[int]:
+    """
+    Returns the peak of memory allocated by a call.
+
+    Returns:
+      Optional[int]: The peak in bytes, or None if it was not measured.
+    """
+    return self.__peak_memory
+
+  def to_dict(self) -> dict[str, any]:
+    """
+    Converts the result to a dictionary that can be serialized to JSON.
+
+    Returns:
+      dict[str, any]: The result, with the latencies in nanoseconds.
+    """
+    return {
+      'benchmark': self.__name,
+      'map': self.__map_name,
+      'calls': self.__calls,
+      'ops_per_second': self.get_ops_per_second(),
+      'latency_ns': {
+        'min': self.__latencies[0],
+        'p50': self.get_percentile(50),
+        'p90': self.get_percentile(90),
+        'p99': self.get_percentile(99),
+        'max': self.__latencies[-1],
+        'mean': sum(self.__latencies) / self.__calls
+      },
+      'peak_memory_bytes': self.__peak_memory
+    }
@@ -0,0 +1,75 @@
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+from benchmark.benchmark_result import BenchmarkResult
+
+
+class BenchmarkRunner:
+  """
+  Times operations call by call and measures the peak memory they allocate.
+
+  Every operation is called until it reaches the minimum number of calls and the time budget, or the maximum number
+  of calls. The peak memory is measured in a separate call under tracemalloc, so the tracing overhead does not affect
+  the latencies.
+
+  Attributes:
+    __max_calls (int): The maximum number of measured calls of an operation.
+    __min_calls (int): The minimum number of measured calls of an operation.
+    __time_budget (float): The time in seconds after which no more calls are started, once the minimum is reached.
+    __warmup_calls (int): The number of calls made before measuring.
+  """
+
+  def __init__(self, min_calls: int = 5, max_calls: int = 10000, time_budget: float = 1.0, warmup_calls: int = 1):
+    """
+    Initializes a BenchmarkRunner instance.
+
+    Args:
+      min_calls (int): The minimum number of measured calls of an operation.
+      max_calls (int): The maximum number of measured calls of an operation.
+      time_budget (float): The time in seconds after which no more calls are started, once the minimum is reached.
+      warmup_calls (int): The number of calls made before measuring.
+    """
+    self.__max_calls: int = max_calls
+    self.__min_calls: int = min_calls
+    self.__time_budget: float = time_budget
+    self.__warmup_calls: int = warmup_calls
+
+  def measure(self, name: str, map_name: str, operation: Callable[[], object], setup: Optional[Callable[[], object]] = None, max_calls: Optional[int] = None) -> BenchmarkResult:
+    """
+    Measures an operation.
+
+    Args:
+      name (str): The name of the benchmark.
+      map_name (str): The name of the map the benchmark runs on.
+      operation (Callable[[], object]): The operation to measure.
+      setup (Optional[Callable[[], object]]): Called before every call of the operation, out of the measurements.
+      max_calls (Optional[int]): The maximum number of measured calls, instead of the one of the runner.
+
+    Returns:
+      BenchmarkResult: The measurements of the operation.
+    """
+    for _ in range(self.__warmup_calls):
+      if setup is not None:
+        setup()
+      operation()
+
+    if setup is not None:
+      setup()
+    tracemalloc.start()
+    try:
+      operation()
+      _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+      tracemalloc.stop()
+
+    latencies: list[int] = []
+    max_calls = min(max_calls or self.__max_calls, self.__max_calls)
+    deadline: float = time.perf_counter() + self.__time_budget
+    while len(latencies) < max_calls and (len(latencies) < self.__min_calls or time.perf_counter() < deadline):
+      if setup is not None:
+        setup()
+      start: int = time.perf_counter_ns()
+      operation()
+      latencies.append(time.perf_counter_ns() - start)
+    return BenchmarkResult(name, map_name, latencies, peak_memory)
@@ -0,0 +1,126 @@
+import random
+
+from benchmark.benchmark_result import BenchmarkResult
+from benchmark.benchmark_runner import BenchmarkRunner
+from src.agent.domain.action.action import Action
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.action_repository import ActionRepository
+from src.agent.domain.agent import Agent
+from src.agent.domain.default_agents import DefaultAgents
+from src.agent.domain.sensor.sensor import Sensor
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.agent.domain.sensor.sensor_repository import SensorRepository
+from src.agent.domain.sensor.up_directional_sensor import UpDirectionalSensor
+from src.environment.application.environment_service import EnvironmentService
+from src.environment.domain.environment import Environment
+from src.environment.domain.terrain.terrain_repository import TerrainRepository
+from src.map.domain.map_repository import MapRepository
+from src.position.domain.position import Position
+from src.simulation.application.batch_simulation_service import BatchSimulationService
+from src.simulation.domain.episode_configuration import EpisodeConfiguration
+from src.simulation.domain.random_walk_policy import RandomWalkPolicy
+
+
+class BenchmarkSuite:
+  """
+  Benchmarks of map loading, environment creation, sensors, actions and random walk episodes over a map.
+
+  Attributes:
+    AGENT_NAME (str): The agent type used by the benchmarks.
+    EPISODE_STEPS (int): The number of decisions of a random walk episode.
+    MOVE_SEQUENCE_LENGTH (int): The number of moves of a measured move sequence.
+    __action_repository (ActionRepository): Repository for the actions of the agent.
+    __runner (BenchmarkRunner): The runner that measures the operations.
+    __seed (int): The seed of the random positions and moves.
+    __sensor_repository (SensorRepository): Repository for the sensors of the agent.
+    __terrain_directory_path (str): The directory path where terrain files are stored.
+  """
+  AGENT_NAME: str = 'human'
+  EPISODE_STEPS: int = 1000
+  MOVE_SEQUENCE_LENGTH: int = 100
+
+  def __init__(self, runner: BenchmarkRunner, terrain_directory_path: str, seed: int = 0):
+    """
+    Initializes a BenchmarkSuite instance.
+
+    Args:
+      runner (BenchmarkRunner): The runner that measures the operations.
+      terrain_directory_path (str): The directory path where terrain files are stored.
+      seed (int): The seed of the random positions and moves.
+    """
+    self.__action_repository: ActionRepository = DefaultAgents.create_action_repository()
+    self.__runner: BenchmarkRunner = runner
+    self.__seed: int = seed
+    self.__sensor_repository: SensorRepository = DefaultAgents.create_sensor_repository()
+    self.__terrain_directory_path: str = terrain_directory_path
+
+  def run(self, map_directory_path: str, map_name: str, terrain_name: str) -> list[BenchmarkResult]:
+    """
+    Runs every benchmark over a map.
+
+    Args:
+      map_directory_path (str): The directory path where the map file is stored.
+      map_name (str): The name of the map file.
+      terrain_name (str): The name of the terrain file.
+
+    Returns:
+      list[BenchmarkResult]: The result of every benchmark.
+    """
+    map_repository: MapRepository = MapRepository(map_directory_path)
+    terrain_repository: TerrainRepository = TerrainRepository(self.__terrain_directory_path)
+    terrain_repository.load(terrain_name)
+    environment_service: EnvironmentService = EnvironmentService(map_repository, terrain_repository)
+
+    results: list[BenchmarkResult] = [
+      self.__runner.measure('map_load', map_name, lambda: map_repository.load(map_name)),
+      self.__runner.measure('set_environment', map_name, environment_service.set_environment)
+    ]
+
+    environment: Environment = environment_service.get_environment()
+    agent: Agent = next(agent for agent in environment.get_agents() if agent.get_name() == self.AGENT_NAME)
+    generator: random.Random = random.Random(self.__seed)
+    rows: int = environment.get_rows()
+    columns: int = environment.get_columns()
+
+    def move_to_random_position():
+      agent.update_position(generator.randrange(columns), generator.randrange(rows))
+
+    for sensor_identifier in (UpDirectionalSensor.IDENTIFIER, 'every_direction'):
+      sensor: Sensor = self.__sensor_repository.get_sensor(sensor_identifier)
+      sensor_configuration: SensorConfiguration = agent.get_sensor(sensor_identifier)
+      results.append(self.__runner.measure(
+        f'sensor_detect[{sensor_identifier}]',
+        map_name,
+        lambda sensor=sensor, sensor_configuration=sensor_configuration: sensor.detect(agent, sensor_configuration, environment),
+        move_to_random_position))
+
+    moves: list[tuple[Action, ActionConfiguration]] = [(self.__action_repository.get_action(configuration.get_identifier()), configuration) for configuration in agent.list_actions()]
+    move_sequence: list[tuple[Action, ActionConfiguration]] = [generator.choice(moves) for _ in range(self.MOVE_SEQUENCE_LENGTH)]
+
+    def prepare_move_sequence():
+      # The moves only reach known cells, so the neighbourhood of the start is known before the sequence.
+      move_to_random_position()
+      x: int = agent.get_x()
+      y: int = agent.get_y()
+      for known_y in range(max(0, y - 10), min(rows, y + 11)):
+        for known_x in range(max(0, x - 10), min(columns, x + 11)):
+          agent.set_known(known_x, known_y)
+      agent.update_position(x, y)
+
+    def execute_move_sequence():
+      for action, action_configuration in move_sequence:
+        action.execute(agent, action_configuration, environment)
+
+    results.append(self.__runner.measure(f'move_action_execute[x{self.MOVE_SEQUENCE_LENGTH}]', map_name, execute_move_sequence, prepare_move_sequence))
+
+    batch_simulation_service: BatchSimulationService = BatchSimulationService(map_directory_path, self.__terrain_directory_path)
+    episode_seeds: list[int] = [0]
+    start: Position = Position(columns // 2, rows // 2)
+    finish: Position = Position(columns - 1, rows - 1)
+
+    def run_random_walk_episode():
+      episode_seeds[0] += 1
+      batch_simulation_service.run_episode(EpisodeConfiguration(map_name, terrain_name, self.AGENT_NAME, start, finish, RandomWalkPolicy.IDENTIFIER, self.EPISODE_STEPS, episode_seeds[0]))
+
+    results.append(self.__runner.measure(f'random_walk_episode[{self.EPISODE_STEPS}]', map_name, run_random_walk_episode))
+    return results
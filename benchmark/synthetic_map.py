@@ -0,0 +1,34 @@
+import random
+
+
+class SyntheticMap:
+  """
+  Generates square CSV maps of random terrain codes, with the same format as the shipped maps.
+  """
+
+  @staticmethod
+  def write_csv(file_path: str, size: int, codes: list[int], seed: int = 0) -> None:
+    """
+    Writes a square map where every cell has a random code, drawn uniformly from the given ones.
+
+    Args:
+      file_path (str): The path of the CSV file.
+      size (int): The number of rows and columns of the map.
+      codes (list[int]): The terrain codes to draw from, each one a single digit.
+      seed (int): The seed of the random generator.
+
+    Raises:
+      ValueError: If there are no codes or a code is not a single digit.
+    """
+    if not codes or any(code < 0 or code > 9 for code in codes):
+      raise ValueError('Synthetic maps need single digit terrain codes.')
+    # Random bytes are mapped to the ASCII digits of the codes, the small bias for some code counts is irrelevant here.
+    digits: bytes = bytes(ord('0') + codes[value % len(codes)] for value in range(256))
+    generator: random.Random = random.Random(seed)
+    row_separators: bytes = b',' * (size - 1) + b'\n'
+    with open(file_path, 'wb') as file:
+      for _ in range(size):
+        row: bytearray = bytearray(2 * size)
+        row[::2] = generator.randbytes(size).translate(digits)
+        row[1::2] = row_separators
+        file.write(row)
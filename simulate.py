@@ -0,0 +1,53 @@
+import argparse
+import os
+
+from src.position.domain.position import Position
+from src.simulation.application.batch_simulation_service import BatchSimulationService
+from src.simulation.domain.episode_configuration import EpisodeConfiguration
+
+
+def parse_position(value: str) -> Position:
+  """
+  Parses a position written as x,y.
+
+  Args:
+    value (str): The position to parse.
+
+  Returns:
+    Position: The parsed position.
+
+  Raises:
+    argparse.ArgumentTypeError: If the value is not two comma separated integers.
+  """
+  try:
+    x, y = (int(coordinate) for coordinate in value.split(','))
+  except ValueError as error:
+    raise argparse.ArgumentTypeError(f'Invalid position {value}, expected x,y.') from error
+  return Position(x, y)
+
+
+if __name__ == '__main__':
+  project_root = os.path.dirname(os.path.abspath(__file__))
+  batch_simulation_service: BatchSimulationService = BatchSimulationService(f'{project_root}/resources/map', f'{project_root}/resources/terrain')
+  policy_identifiers: str = ', '.join(policy.get_identifier() for policy in batch_simulation_service.get_policy_repository().get_policies())
+
+  parser = argparse.ArgumentParser(description='Runs batches of episodes without the user interface and prints a summary table.')
+  parser.add_argument('--map', required=True, help='Name of the map file in resources/map.')
+  parser.add_argument('--terrain', required=True, help='Name of the terrain file in resources/terrain.')
+  parser.add_argument('--agent', action='append', required=True, help='Agent type, can be repeated.')
+  parser.add_argument('--policy', action='append', required=True, help=f'Policy identifier ({policy_identifiers}), can be repeated.')
+  parser.add_argument('--start', type=parse_position, required=True, help='Start position as x,y.')
+  parser.add_argument('--finish', type=parse_position, required=True, help='Finish position as x,y.')
+  parser.add_argument('--episodes', type=int, default=100, help='Episodes per agent type and policy.')
+  parser.add_argument('--max-steps', type=int, default=10000, help='Maximum number of decisions per episode.')
+  parser.add_argument('--seed', type=int, default=0, help='Seed of the first episode, the next ones use consecutive seeds.')
+  parser.add_argument('--workers', type=int, default=None, help='Number of processes, 1 runs every episode in this process.')
+  arguments = parser.parse_args()
+
+  configurations: list[EpisodeConfiguration] = [
+    EpisodeConfiguration(arguments.map, arguments.terrain, agent_name, arguments.start, arguments.finish, policy_identifier, arguments.max_steps, arguments.seed + episode)
+    for agent_name in arguments.agent
+    for policy_identifier in arguments.policy
+    for episode in range(arguments.episodes)
+  ]
+  print(batch_simulation_service.simulate(configurations, arguments.workers).format_table())
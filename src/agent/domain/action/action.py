@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from enum import Enum
+from typing import Callable
 
 from src.agent.domain.action.action_configuration import ActionConfiguration
 from src.agent.domain.agent import Agent
@@ -68,3 +69,33 @@ class Action:
       ActionResult: The result of the action.
     """
     raise NotImplementedError('This method should be implemented by the subclass.')
+
+  def execute_batch(self, agents: list[Agent], agent_action: ActionConfiguration, environment: Environment) -> list[ActionResult]:
+    """
+    Executes the action for several agents, one after the other.
+
+    Args:
+      agents (list[Agent]): The agents performing the action.
+      agent_action (ActionConfiguration): The specific action configuration shared by the agents.
+      environment (Environment): The environment in which the action is performed.
+
+    Returns:
+      list[ActionResult]: The result of every agent, in order.
+    """
+    return [self.execute(agent, agent_action, environment) for agent in agents]
+
+  def compile(self, agent_action: ActionConfiguration, environment: Environment) -> Callable[[Agent], ActionResult]:
+    """
+    Binds the action to a configuration and an environment, for callers that execute it many times.
+
+    Subclasses can override it to validate the configuration and look up the environment once, instead of on every
+    execution.
+
+    Args:
+      agent_action (ActionConfiguration): The specific action configuration.
+      environment (Environment): The environment in which the action is performed.
+
+    Returns:
+      Callable[[Agent], ActionResult]: A function that executes the action for an agent, with the same results as execute.
+    """
+    return lambda agent: self.execute(agent, agent_action, environment)
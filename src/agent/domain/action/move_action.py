@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from array import array
+from typing import Callable, Optional
 from src.agent.domain.action.action import Action, ActionResult
 from src.agent.domain.action.action_configuration import ActionConfiguration
 from src.agent.domain.agent import Agent, Direction
-from src.environment.domain.cell.cell import Cell
 from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
 
 
 class MoveActionNewCoordinates:
@@ -111,22 +112,125 @@ class MoveAction(Action, ABC):
 
     x: int = agent.get_x() + new_coordinates.get_dx()
     y: int = agent.get_y() + new_coordinates.get_dy()
-    if not agent.is_known(x, y):
-      return ActionResult.UNKNOWN_CELL
+    columns: int = environment.get_columns()
+    movement_costs: array = environment.get_movement_costs_for(agent.get_name())
+    result: ActionResult = MoveAction.resolve_destination(agent.is_known(x, y), x, y, environment.get_rows(), columns, movement_costs)
+    if result is not ActionResult.SUCCESS:
+      return result
+    return MoveAction.move_agent(agent, x, y, new_coordinates.get_direction(), movement_costs[y * columns + x])
+
+  def execute_batch(self, agents: list[Agent], agent_action: ActionConfiguration, environment: Environment) -> list[ActionResult]:
+    """
+    Executes the move action for several agents, one after the other, with the same results as execute.
 
-    cell: Optional[Cell] = environment.get_cell(x, y)
-    if cell is None:
-      return ActionResult.OUT_OF_BOUNDS
+    The action is compiled once for the whole batch.
+
+    Args:
+      agents (list[Agent]): The agents performing the action.
+      agent_action (ActionConfiguration): The specific action configuration shared by the agents.
+      environment (Environment): The environment in which the action is performed.
 
-    movement_cost: Optional[int] = cell.get_movement_cost_for(agent.get_name())
-    if movement_cost is None:
+    Returns:
+      list[ActionResult]: The result of every agent, in order.
+    """
+    execute: Callable[[Agent], ActionResult] = self.compile(agent_action, environment)
+    return [execute(agent) for agent in agents]
+
+  @staticmethod
+  def resolve_destination(known: bool, x: int, y: int, rows: int, columns: int, movement_costs: array) -> ActionResult:
+    """
+    Checks whether an agent can move into a position, the rules shared by every way of executing a move.
+
+    Args:
+      known (bool): Whether the agent knows the position.
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+      rows (int): The number of rows of the environment.
+      columns (int): The number of columns of the environment.
+      movement_costs (array): The movement costs of the agent, indexed by y * columns + x.
+
+    Returns:
+      ActionResult: SUCCESS if the agent can move into the position, the reason it cannot otherwise.
+    """
+    if not known:
+      return ActionResult.UNKNOWN_CELL
+    if y < 0 or y >= rows or x < 0 or x >= columns:
+      return ActionResult.OUT_OF_BOUNDS
+    if movement_costs[y * columns + x] == Grid.IMPASSABLE:
       return ActionResult.HIT_OBSTACLE
+    return ActionResult.SUCCESS
+
+  @staticmethod
+  def move_agent(agent: Agent, x: int, y: int, direction: Direction, movement_cost: int) -> ActionResult:
+    """
+    Moves an agent into a position checked by resolve_destination and accounts for the move.
+
+    Args:
+      agent (Agent): The agent performing the action.
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+      direction (Direction): The direction of the move.
+      movement_cost (int): The movement cost of the position for the agent.
 
-    agent.set_direction(new_coordinates.get_direction())
+    Returns:
+      ActionResult: GOAL_REACHED if the agent is at its finish position, SUCCESS otherwise.
+    """
+    agent.set_direction(direction)
     agent.update_position(x, y)
     agent.increase_accumulated_movement_cost(movement_cost)
     agent.increase_steps()
-
     if agent.is_at_finish_position():
       return ActionResult.GOAL_REACHED
     return ActionResult.SUCCESS
+
+  def compile(self, agent_action: ActionConfiguration, environment: Environment) -> Callable[[Agent], ActionResult]:
+    """
+    Binds the move action to a configuration and an environment, for callers that execute it many times.
+
+    The configuration is validated once, the environment bounds are looked up once, and the offset of the move is
+    computed once per direction of the agent, since get_new_coordinates only depends on it. The returned function does
+    not allocate objects.
+
+    Args:
+      agent_action (ActionConfiguration): The specific action configuration.
+      environment (Environment): The environment in which the action is performed.
+
+    Returns:
+      Callable[[Agent], ActionResult]: A function that executes the action for an agent, with the same results as execute.
+    """
+    steps: int = agent_action.get_property('steps')
+    if type(steps) is not int or steps < 1:
+      return lambda agent: ActionResult.INVALID_PROPERTY
+
+    rows: int = environment.get_rows()
+    columns: int = environment.get_columns()
+    movement_costs_by_agent: dict[str, array] = {}
+    offsets: dict[Optional[Direction], Optional[tuple[int, int, Direction]]] = {}
+    resolve_destination: Callable[[bool, int, int, int, int, array], ActionResult] = MoveAction.resolve_destination
+    move_agent: Callable[[Agent, int, int, Direction, int], ActionResult] = MoveAction.move_agent
+
+    def execute(agent: Agent) -> ActionResult:
+      direction: Optional[Direction] = agent.get_direction()
+      if direction in offsets:
+        offset: Optional[tuple[int, int, Direction]] = offsets[direction]
+      else:
+        new_coordinates: Optional[MoveActionNewCoordinates] = self.get_new_coordinates(agent, steps)
+        offset = None if new_coordinates is None else (new_coordinates.get_dx(), new_coordinates.get_dy(), new_coordinates.get_direction())
+        offsets[direction] = offset
+      if offset is None:
+        return ActionResult.UNKNOWN_DIRECTION
+
+      x: int = agent.get_x() + offset[0]
+      y: int = agent.get_y() + offset[1]
+      agent_name: str = agent.get_name()
+      movement_costs: Optional[array] = movement_costs_by_agent.get(agent_name)
+      if movement_costs is None:
+        movement_costs = environment.get_movement_costs_for(agent_name)
+        movement_costs_by_agent[agent_name] = movement_costs
+      result: ActionResult = resolve_destination(agent.is_known(x, y), x, y, rows, columns, movement_costs)
+      if result is not ActionResult.SUCCESS:
+        return result
+
+      return move_agent(agent, x, y, offset[2], movement_costs[y * columns + x])
+
+    return execute
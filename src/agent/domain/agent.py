@@ -1,9 +1,9 @@
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from enum import Enum
 
 from src.agent.domain.action.action_configuration import ActionConfiguration
-from src.agent.domain.known_cell import KnownCell
+from src.agent.domain.known_map.known_map import KnownMap
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
 
 
@@ -49,6 +49,105 @@ class Direction(Enum):
       return Direction.DOWN
 
 
+class AgentSnapshot:
+  """
+  The mutable state of an agent at a point in time: position, direction, finish position, cost, steps and knowledge.
+
+  Attributes:
+    __accumulated_movement_cost (int): The accumulated cost of the agent.
+    __direction (Optional[Direction]): The direction the agent was facing.
+    __finish_position (tuple[Optional[int], Optional[int]]): The finish position of the agent.
+    __known_map (object): The snapshot of the known map of the agent.
+    __total_steps (int): The total number of steps the agent had taken.
+    __x (int): The x-coordinate of the agent's position.
+    __y (int): The y-coordinate of the agent's position.
+  """
+
+  def __init__(self, accumulated_movement_cost: int, direction: Optional[Direction], finish_position: tuple[Optional[int], Optional[int]], known_map: object, total_steps: int, x: int, y: int):
+    """
+    Initializes an AgentSnapshot instance.
+
+    Args:
+      accumulated_movement_cost (int): The accumulated cost of the agent.
+      direction (Optional[Direction]): The direction the agent was facing.
+      finish_position (tuple[Optional[int], Optional[int]]): The finish position of the agent.
+      known_map (object): The snapshot of the known map of the agent.
+      total_steps (int): The total number of steps the agent had taken.
+      x (int): The x-coordinate of the agent's position.
+      y (int): The y-coordinate of the agent's position.
+    """
+    self.__accumulated_movement_cost: int = accumulated_movement_cost
+    self.__direction: Optional[Direction] = direction
+    self.__finish_position: tuple[Optional[int], Optional[int]] = finish_position
+    self.__known_map: object = known_map
+    self.__total_steps: int = total_steps
+    self.__x: int = x
+    self.__y: int = y
+
+  def get_accumulated_movement_cost(self) -> int:
+    """
+    Returns the accumulated movement cost of the agent.
+
+    Returns:
+      int: The accumulated movement cost.
+    """
+    return self.__accumulated_movement_cost
+
+  def get_direction(self) -> Optional[Direction]:
+    """
+    Returns the direction the agent was facing.
+
+    Returns:
+      Optional[Direction]: The direction.
+    """
+    return self.__direction
+
+  def get_finish_position(self) -> tuple[Optional[int], Optional[int]]:
+    """
+    Returns the finish position of the agent.
+
+    Returns:
+      tuple[Optional[int], Optional[int]]: The finish position.
+    """
+    return self.__finish_position
+
+  def get_known_map(self) -> object:
+    """
+    Returns the snapshot of the known map of the agent.
+
+    Returns:
+      object: The snapshot created by KnownMap.create_snapshot.
+    """
+    return self.__known_map
+
+  def get_steps(self) -> int:
+    """
+    Returns the total number of steps the agent had taken.
+
+    Returns:
+      int: The total number of steps.
+    """
+    return self.__total_steps
+
+  def get_x(self) -> int:
+    """
+    Returns the x-coordinate of the agent's position.
+
+    Returns:
+      int: The x-coordinate.
+    """
+    return self.__x
+
+  def get_y(self) -> int:
+    """
+    Returns the y-coordinate of the agent's position.
+
+    Returns:
+      int: The y-coordinate.
+    """
+    return self.__y
+
+
 class Agent:
   """
   Represents an agent in the environment.
@@ -57,15 +156,16 @@ class Agent:
     __accumulated_movement_cost (int): The accumulated cost of the agent.
     __actions (dict[str, ActionConfiguration]): The list of actions the agent can perform.
     __direction (Optional[Direction]): The direction the agent is facing.
-    __known_map (list[list[KnownCell]]): The map of known cells.
+    __known_map (KnownMap): The cells the agent knows and their flags.
     __name (str): The name of the agent.
+    __position_listeners (list[Callable[[Agent, int, int], None]]): The functions called after every position update.
     __sensors (dict[str, SensorConfiguration]): The list of sensors the agent has.
     __total_steps (int): The total number of steps the agent has taken.
     __x (int): The x-coordinate of the agent's position.
     __y (int): The y-coordinate of the agent's position.
   """
 
-  def __init__(self, accumulated_movement_cost: int, actions: dict[str, ActionConfiguration], direction: Optional[Direction], known_map: list[list[Optional[KnownCell]]], name: str, sensors: dict[str, SensorConfiguration], total_steps: int, x: int, y: int):
+  def __init__(self, accumulated_movement_cost: int, actions: dict[str, ActionConfiguration], direction: Optional[Direction], known_map: KnownMap, name: str, sensors: dict[str, SensorConfiguration], total_steps: int, x: int, y: int):
     """
     Initializes an Agent instance.
 
@@ -73,7 +173,7 @@ class Agent:
       accumulated_movement_cost (int): The accumulated cost of the agent.
       actions (dict[str, ActionConfiguration]): The list of actions the agent can perform.
       direction (Optional[Direction]): The direction the agent is facing.
-      known_map (list[list[Optional[KnownCell]]]): The map of known cells.
+      known_map (KnownMap): The cells the agent knows and their flags.
       name (str): The name of the agent.
       sensors (dict[str, SensorConfiguration]): The list of sensors the agent has.
       total_steps (int): The total number of steps the agent has taken.
@@ -83,7 +183,7 @@ class Agent:
     self.__accumulated_movement_cost: int = accumulated_movement_cost
     self.__actions: dict[str, ActionConfiguration] = actions
     self.__direction: Optional[Direction] = direction
-    self.__known_map: list[list[KnownCell]] = known_map
+    self.__known_map: KnownMap = known_map
     self.__name: str = name
     self.__sensors: dict[str, SensorConfiguration] = sensors
     self.__total_steps: int = total_steps
@@ -91,6 +191,7 @@ class Agent:
     self.__y: int = y
     self.__finish_position_x: Optional[int] = None
     self.__finish_position_y: Optional[int] = None
+    self.__position_listeners: list[Callable[['Agent', int, int], None]] = []
 
   def get_name(self) -> str:
     """
@@ -169,7 +270,40 @@ class Agent:
       x (int): The x-coordinate of the cell.
       y (int): The y-coordinate of the cell.
     """
-    self.__known_map[y][x] = KnownCell([])
+    self.__known_map.set_known(x, y)
+
+  def set_known_cells(self, indices: Iterable[int]) -> list[int]:
+    """
+    Updates the known map with the unknown cells among the given ones.
+
+    Args:
+      indices (Iterable[int]): The cells, indexed by y * columns + x.
+
+    Returns:
+      list[int]: The cells that were unknown, in the given order.
+    """
+    return self.__known_map.set_known_cells(indices)
+
+  def get_known_count(self) -> int:
+    """
+    Returns the position of the end of the log of cells that became known, to pass later to get_known_since.
+
+    Returns:
+      int: The number of entries ever appended to the log.
+    """
+    return self.__known_map.get_known_count()
+
+  def get_known_since(self, count: int) -> Optional[list[int]]:
+    """
+    Returns the cells that became known after a position of the log.
+
+    Args:
+      count (int): A value returned by get_known_count.
+
+    Returns:
+      Optional[list[int]]: The cells, indexed by y * columns + x, or None if the log no longer covers them.
+    """
+    return self.__known_map.get_known_since(count)
 
   def add_flag(self, x: int, y: int, flags: list[str]) -> bool:
     """
@@ -183,9 +317,7 @@ class Agent:
     Returns:
       bool: True if the flag was added, False if it was already present.
     """
-    if not self.is_known(x, y):
-      return False
-    return self.__known_map[y][x].add_flags(flags)
+    return self.__known_map.add_flags(x, y, flags)
 
   def remove_flag(self, x: int, y: int, flag: str) -> bool:
     """
@@ -199,9 +331,7 @@ class Agent:
     Returns:
       bool: True if the flag was removed, False if it was not present.
     """
-    if not self.is_known(x, y):
-      return False
-    return self.__known_map[y][x].remove_flag(flag)
+    return self.__known_map.remove_flag(x, y, flag)
 
   def list_flags(self, x: int, y: int) -> list[str]:
     """
@@ -214,9 +344,7 @@ class Agent:
     Returns:
       list[str]: The list of flags.
     """
-    if not self.is_known(x, y):
-      return []
-    return self.__known_map[y][x].list_flags()
+    return self.__known_map.list_flags(x, y)
 
   def is_known(self, x: int, y: int) -> bool:
     """
@@ -229,11 +357,25 @@ class Agent:
     Returns:
       bool: True if the cell is known, False if it is not.
     """
-    if y < 0 or y >= len(self.__known_map):
-      return False
-    if x < 0 or x >= len(self.__known_map[y]):
-      return False
-    return self.__known_map[y][x] is not None
+    return self.__known_map.is_known(x, y)
+
+  def add_position_listener(self, listener: Callable[['Agent', int, int], None]) -> None:
+    """
+    Registers a function called after every position update with the agent and its previous coordinates.
+
+    Args:
+      listener (Callable[[Agent, int, int], None]): The function to call.
+    """
+    self.__position_listeners.append(listener)
+
+  def remove_position_listener(self, listener: Callable[['Agent', int, int], None]) -> None:
+    """
+    Unregisters a function registered with add_position_listener.
+
+    Args:
+      listener (Callable[[Agent, int, int], None]): The function to unregister.
+    """
+    self.__position_listeners.remove(listener)
 
   def update_position(self, x: int, y: int) -> None:
     """
@@ -243,13 +385,15 @@ class Agent:
       x (int): The new x-coordinate.
       y (int): The new y-coordinate.
     """
-    previous_cell: Optional[KnownCell] = self.__known_map[self.__y][self.__x]
-    if previous_cell is not None:
-      previous_cell.remove_flag('X')
+    previous_x: int = self.__x
+    previous_y: int = self.__y
+    self.__known_map.remove_flag(previous_x, previous_y, 'X')
     self.__x = x
     self.__y = y
-    self.set_known(x, y)
-    self.__known_map[y][x].add_flags(['X', 'V'])
+    self.__known_map.set_known(x, y)
+    self.__known_map.add_flags(x, y, ['X', 'V'])
+    for listener in self.__position_listeners:
+      listener(self, previous_x, previous_y)
 
   def get_x(self) -> int:
     """
@@ -349,6 +493,41 @@ class Agent:
     """
     return self.__x == self.__finish_position_x and self.__y == self.__finish_position_y
 
+  def create_snapshot(self) -> AgentSnapshot:
+    """
+    Captures the mutable state of the agent, to restore it later with restore_snapshot.
+
+    Returns:
+      AgentSnapshot: The snapshot of the agent.
+    """
+    return AgentSnapshot(
+      self.__accumulated_movement_cost,
+      self.__direction,
+      (self.__finish_position_x, self.__finish_position_y),
+      self.__known_map.create_snapshot(),
+      self.__total_steps,
+      self.__x,
+      self.__y)
+
+  def restore_snapshot(self, snapshot: AgentSnapshot) -> None:
+    """
+    Restores the mutable state captured by create_snapshot, notifying the position listeners.
+
+    Args:
+      snapshot (AgentSnapshot): The snapshot of this agent.
+    """
+    previous_x: int = self.__x
+    previous_y: int = self.__y
+    self.__accumulated_movement_cost = snapshot.get_accumulated_movement_cost()
+    self.__direction = snapshot.get_direction()
+    self.__finish_position_x, self.__finish_position_y = snapshot.get_finish_position()
+    self.__known_map.restore_snapshot(snapshot.get_known_map())
+    self.__total_steps = snapshot.get_steps()
+    self.__x = snapshot.get_x()
+    self.__y = snapshot.get_y()
+    for listener in self.__position_listeners:
+      listener(self, previous_x, previous_y)
+
   def is_in_position(self, x: int, y: int) -> bool:
     """
     Checks if the agent is in the given position.
@@ -1,13 +1,19 @@
 from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.action_repository import ActionRepository
 from src.agent.domain.action.move_down_action import MoveDownAction
 from src.agent.domain.action.move_left_action import MoveLeftAction
 from src.agent.domain.action.move_right_action import MoveRightAction
 from src.agent.domain.action.move_up_action import MoveUpAction
 from src.agent.domain.agent import Agent
+from src.agent.domain.known_map.bitset_known_map import BitsetKnownMap
+from src.agent.domain.known_map.known_map import KnownMap, KnownMapStorage
+from src.agent.domain.known_map.nested_known_map import NestedKnownMap
 from src.agent.domain.sensor.down_directional_sensor import DownDirectionalSensor
 from src.agent.domain.sensor.left_directional_sensor import LeftDirectionalSensor
+from src.agent.domain.sensor.merged_sensor import MergedSensor
 from src.agent.domain.sensor.right_directional_sensor import RightDirectionalSensor
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.agent.domain.sensor.sensor_repository import SensorRepository
 from src.agent.domain.sensor.up_directional_sensor import UpDirectionalSensor
 
 
@@ -30,14 +36,52 @@ class DefaultAgents:
   }
 
   @staticmethod
-  def create_agent(name: str, columns: int, rows: int) -> Agent:
+  def create_agent(name: str, columns: int, rows: int, known_map_storage: KnownMapStorage = KnownMapStorage.BITSET) -> Agent:
+    known_map: KnownMap = BitsetKnownMap(rows, columns) if known_map_storage == KnownMapStorage.BITSET else NestedKnownMap(rows, columns)
     return Agent(
       0,
       DefaultAgents.DEFAULT_ACTIONS,
       None,
-      [[None for _ in range(rows)] for _ in range(columns)],
+      known_map,
       name,
       DefaultAgents.DEFAULT_SENSORS,
       0,
       0,
       0)
+
+  @staticmethod
+  def create_action_repository() -> ActionRepository:
+    """
+    Creates a repository with the actions of the default agents.
+
+    Returns:
+      ActionRepository: The repository with the move actions.
+    """
+    action_repository: ActionRepository = ActionRepository()
+    action_repository.add_actions(MoveUpAction(), MoveDownAction(), MoveLeftAction(), MoveRightAction())
+    return action_repository
+
+  @staticmethod
+  def create_sensor_repository() -> SensorRepository:
+    """
+    Creates a repository with the sensors of the default agents.
+
+    Returns:
+      SensorRepository: The repository with the directional sensors and their combinations.
+    """
+    up_directional_sensor: UpDirectionalSensor = UpDirectionalSensor()
+    down_directional_sensor: DownDirectionalSensor = DownDirectionalSensor()
+    left_directional_sensor: LeftDirectionalSensor = LeftDirectionalSensor()
+    right_directional_sensor: RightDirectionalSensor = RightDirectionalSensor()
+
+    sensor_repository: SensorRepository = SensorRepository()
+    sensor_repository.add_sensors(
+      up_directional_sensor,
+      down_directional_sensor,
+      left_directional_sensor,
+      right_directional_sensor,
+      MergedSensor('up_down', [up_directional_sensor, down_directional_sensor]),
+      MergedSensor('left_right', [left_directional_sensor, right_directional_sensor]),
+      MergedSensor('every_direction', [up_directional_sensor, down_directional_sensor, left_directional_sensor, right_directional_sensor])
+    )
+    return sensor_repository
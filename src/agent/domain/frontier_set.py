@@ -0,0 +1,121 @@
+from array import array
+from typing import Optional
+
+from src.agent.domain.agent import Agent
+from src.environment.domain.grid.grid import Grid
+
+
+class FrontierSet:
+  """
+  The frontier of the knowledge of an agent: the known cells it can stand on that have at least one unknown neighbour.
+
+  The set is kept up to date from the log of cells that became known, so every update only checks the new cells and
+  their neighbours instead of scanning the whole known map. If the log no longer covers the cells since the previous
+  update, the set is rebuilt from scratch.
+
+  Cells are identified by the integer index y * columns + x.
+
+  Attributes:
+    __agent (Agent): The agent whose knowledge is tracked.
+    __cells (set[int]): The cells of the frontier.
+    __columns (int): The number of columns of the map.
+    __known_count (Optional[int]): The position of the log of known cells already consumed, None before the first update.
+    __movement_costs (array): The movement costs of the agent, with Grid.IMPASSABLE for the cells it cannot stand on.
+    __rows (int): The number of rows of the map.
+  """
+
+  def __init__(self, agent: Agent, movement_costs: array, rows: int, columns: int):
+    """
+    Initializes an empty FrontierSet instance, filled by the first update.
+
+    Args:
+      agent (Agent): The agent whose knowledge is tracked.
+      movement_costs (array): The movement costs of the agent, indexed by y * columns + x.
+      rows (int): The number of rows of the map.
+      columns (int): The number of columns of the map.
+    """
+    self.__agent: Agent = agent
+    self.__cells: set[int] = set()
+    self.__columns: int = columns
+    self.__known_count: Optional[int] = None
+    self.__movement_costs: array = movement_costs
+    self.__rows: int = rows
+
+  def get_cells(self) -> set[int]:
+    """
+    Returns the cells of the frontier, as of the last update.
+
+    Returns:
+      set[int]: The cells, indexed by y * columns + x.
+    """
+    return self.__cells
+
+  def update(self) -> None:
+    """
+    Brings the frontier up to date with the cells that became known since the previous update.
+    """
+    changed: Optional[list[int]] = None
+    if self.__known_count is not None:
+      changed = self.__agent.get_known_since(self.__known_count)
+    if changed is None:
+      self.__cells = set()
+      changed = self.__agent.get_known_since(0)
+      if changed is None:
+        columns: int = self.__columns
+        changed = [index for index in range(self.__rows * columns) if self.__agent.is_known(index % columns, index // columns)]
+    self.__known_count = self.__agent.get_known_count()
+
+    for index in changed:
+      self.refresh(index)
+      for neighbour in self.get_neighbours(index):
+        self.refresh(neighbour)
+
+  def refresh(self, index: int) -> None:
+    """
+    Adds a cell to the frontier or removes it from it, according to the current knowledge of the agent.
+
+    Args:
+      index (int): The cell, indexed by y * columns + x.
+    """
+    columns: int = self.__columns
+    if self.__movement_costs[index] != Grid.IMPASSABLE and self.__agent.is_known(index % columns, index // columns) and self.has_unknown_neighbours(index):
+      self.__cells.add(index)
+    else:
+      self.__cells.discard(index)
+
+  def has_unknown_neighbours(self, index: int) -> bool:
+    """
+    Checks if any cell next to a cell is unknown to the agent.
+
+    Args:
+      index (int): The cell, indexed by y * columns + x.
+
+    Returns:
+      bool: True if a neighbour inside the bounds of the map is unknown, False otherwise.
+    """
+    columns: int = self.__columns
+    agent: Agent = self.__agent
+    return any(not agent.is_known(neighbour % columns, neighbour // columns) for neighbour in self.get_neighbours(index))
+
+  def get_neighbours(self, index: int) -> list[int]:
+    """
+    Returns the cells next to a cell, inside the bounds of the map.
+
+    Args:
+      index (int): The cell, indexed by y * columns + x.
+
+    Returns:
+      list[int]: The neighbours, indexed by y * columns + x.
+    """
+    columns: int = self.__columns
+    y, x = divmod(index, columns)
+    neighbours: list[int] = []
+    if x > 0:
+      neighbours.append(index - 1)
+    if x < columns - 1:
+      neighbours.append(index + 1)
+    if y > 0:
+      neighbours.append(index - columns)
+    if y < self.__rows - 1:
+      neighbours.append(index + columns)
+    return neighbours
@@ -0,0 +1,190 @@
+from typing import Iterable
+
+from src.agent.domain.known_map.known_map import KnownMap
+
+
+class BitsetKnownMap(KnownMap):
+  """
+  Knowledge of an agent stored as packed bitsets indexed by y * columns + x: one for the known cells and one for every
+  flag, created the first time the flag is added. A 500x500 map needs about 31 KB per bitset.
+
+  Flags are listed in the order they were first used on the map, not in the order they were added to the cell.
+
+  Attributes:
+    __flags (dict[str, bytearray]): The bitset of every flag used so far.
+    __known (bytearray): The bitset of the known cells.
+  """
+
+  def __init__(self, rows: int, columns: int):
+    """
+    Initializes a BitsetKnownMap instance without known cells.
+
+    Args:
+      rows (int): The number of rows of the map, the bound of the y-coordinate.
+      columns (int): The number of columns of the map, the bound of the x-coordinate.
+    """
+    super().__init__(rows, columns)
+    self.__flags: dict[str, bytearray] = {}
+    self.__known: bytearray = bytearray((rows * columns + 7) >> 3)
+
+  def get_known(self) -> bytearray:
+    """
+    Returns the bitset of the known cells, bit index & 7 of byte index >> 3 is set for the known index.
+
+    Returns:
+      bytearray: The bitset of the known cells.
+    """
+    return self.__known
+
+  def is_known(self, x: int, y: int) -> bool:
+    """
+    Checks if a cell is known.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      bool: True if the cell is known, False if it is not or it is out of bounds.
+    """
+    columns: int = self.get_columns()
+    if y < 0 or y >= self.get_rows() or x < 0 or x >= columns:
+      return False
+    index: int = y * columns + x
+    return (self.__known[index >> 3] >> (index & 7)) & 1 == 1
+
+  def set_known(self, x: int, y: int) -> None:
+    """
+    Marks a cell as known, without flags.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+    """
+    index: int = y * self.get_columns() + x
+    byte: int = index >> 3
+    mask: int = 1 << (index & 7)
+    if not self.__known[byte] & mask:
+      self.__known[byte] |= mask
+      self.log_known([index])
+    for bitset in self.__flags.values():
+      bitset[byte] &= ~mask
+
+  def set_known_cells(self, indices: Iterable[int]) -> list[int]:
+    """
+    Marks as known the unknown cells among the given ones, the cells already known keep their flags.
+
+    Args:
+      indices (Iterable[int]): The cells to mark, indexed by y * columns + x.
+
+    Returns:
+      list[int]: The cells that were unknown, in the given order.
+    """
+    known: bytearray = self.__known
+    new_indices: list[int] = [index for index in indices if not (known[index >> 3] >> (index & 7)) & 1]
+    for index in new_indices:
+      known[index >> 3] |= 1 << (index & 7)
+    self.log_known(new_indices)
+    return new_indices
+
+  def add_flags(self, x: int, y: int, flags: list[str]) -> bool:
+    """
+    Adds flags to a known cell, in order, stopping at the first flag already present.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flags (list[str]): The flags to be added.
+
+    Returns:
+      bool: True if every flag was added, False if the cell is unknown or a flag was already present.
+    """
+    if not self.is_known(x, y):
+      return False
+    index: int = y * self.get_columns() + x
+    byte: int = index >> 3
+    mask: int = 1 << (index & 7)
+    for flag in flags:
+      bitset: bytearray = self.__flags.get(flag)
+      if bitset is None:
+        bitset = bytearray(len(self.__known))
+        self.__flags[flag] = bitset
+      elif bitset[byte] & mask:
+        return False
+      bitset[byte] |= mask
+    return True
+
+  def remove_flag(self, x: int, y: int, flag: str) -> bool:
+    """
+    Removes a flag from a known cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flag (str): The flag to be removed.
+
+    Returns:
+      bool: True if the flag was removed, False if the cell is unknown or the flag was not present.
+    """
+    bitset: bytearray = self.__flags.get(flag)
+    if bitset is None or not self.is_known(x, y):
+      return False
+    index: int = y * self.get_columns() + x
+    byte: int = index >> 3
+    mask: int = 1 << (index & 7)
+    if not bitset[byte] & mask:
+      return False
+    bitset[byte] &= ~mask
+    return True
+
+  def list_flags(self, x: int, y: int) -> list[str]:
+    """
+    Lists the flags of a cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      list[str]: The flags of the cell, empty if the cell is unknown.
+    """
+    if not self.is_known(x, y):
+      return []
+    index: int = y * self.get_columns() + x
+    byte: int = index >> 3
+    mask: int = 1 << (index & 7)
+    return [flag for flag, bitset in self.__flags.items() if bitset[byte] & mask]
+
+  def create_snapshot(self) -> tuple[bytes, dict[str, bytes]]:
+    """
+    Captures the known cells and their flags, to restore them later with restore_snapshot.
+
+    The bitsets are copied to immutable bytes, a copy of about 31 KB per bitset for a 500x500 map.
+
+    Returns:
+      tuple[bytes, dict[str, bytes]]: The bitset of the known cells and the bitset of every flag.
+    """
+    return bytes(self.__known), {flag: bytes(bitset) for flag, bitset in self.__flags.items()}
+
+  def restore_snapshot(self, snapshot: tuple[bytes, dict[str, bytes]]) -> None:
+    """
+    Restores the known cells and their flags captured by create_snapshot.
+
+    The bitsets are overwritten in place, so the bitset returned by get_known stays valid. The log of known cells is
+    cleared, since the snapshot may have fewer known cells.
+
+    Args:
+      snapshot (tuple[bytes, dict[str, bytes]]): The snapshot of this map or of a map of the same size.
+    """
+    known, flags = snapshot
+    self.__known[:] = known
+    restored_flags: dict[str, bytearray] = {}
+    for flag, flag_bitset in flags.items():
+      bitset: bytearray = self.__flags.get(flag)
+      if bitset is None:
+        bitset = bytearray(flag_bitset)
+      else:
+        bitset[:] = flag_bitset
+      restored_flags[flag] = bitset
+    self.__flags = restored_flags
+    self.clear_known_log()
@@ -0,0 +1,213 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Iterable, Optional
+
+
+class KnownMapStorage(Enum):
+  """
+  Enum representing the available storage modes for the knowledge of an agent.
+
+  Attributes:
+    BITSET (str): Packed bitsets, one for the known cells and one for every flag.
+    NESTED (str): A nested list with a KnownCell object for every known cell.
+  """
+  BITSET = 'bitset'
+  NESTED = 'nested'
+
+
+class KnownMap(ABC):
+  """
+  Represents the cells an agent knows and the flags it placed on them.
+
+  Setting a cell as known clears its flags. Positions out of bounds are never known and never have flags.
+
+  The cells that become known are appended to a bounded log, so incremental consumers such as path planners can ask
+  for the cells discovered since they last looked instead of scanning the whole map. When the log exceeds
+  KNOWN_LOG_LIMIT its oldest half is dropped, and consumers that fall that far behind have to scan the map again.
+
+  Attributes:
+    KNOWN_LOG_LIMIT (int): The number of entries from which the oldest half of the log is dropped.
+    __rows (int): The number of rows of the map, the bound of the y-coordinate.
+    __columns (int): The number of columns of the map, the bound of the x-coordinate.
+    __known_log (list[int]): The cells that became known, indexed by y * columns + x, in order.
+    __known_log_offset (int): The number of entries dropped from the start of the log.
+  """
+  KNOWN_LOG_LIMIT: int = 1 << 16
+
+  def __init__(self, rows: int, columns: int):
+    """
+    Initializes a KnownMap instance.
+
+    Args:
+      rows (int): The number of rows of the map, the bound of the y-coordinate.
+      columns (int): The number of columns of the map, the bound of the x-coordinate.
+    """
+    self.__rows: int = rows
+    self.__columns: int = columns
+    self.__known_log: list[int] = []
+    self.__known_log_offset: int = 0
+
+  def get_rows(self) -> int:
+    """
+    Returns the number of rows of the map.
+
+    Returns:
+      int: The number of rows.
+    """
+    return self.__rows
+
+  def get_columns(self) -> int:
+    """
+    Returns the number of columns of the map.
+
+    Returns:
+      int: The number of columns.
+    """
+    return self.__columns
+
+  def get_known_count(self) -> int:
+    """
+    Returns the position of the end of the log of known cells, to pass later to get_known_since.
+
+    Returns:
+      int: The number of entries ever appended to the log.
+    """
+    return self.__known_log_offset + len(self.__known_log)
+
+  def get_known_since(self, count: int) -> Optional[list[int]]:
+    """
+    Returns the cells that became known after a position of the log.
+
+    Args:
+      count (int): A value returned by get_known_count.
+
+    Returns:
+      Optional[list[int]]: The cells, indexed by y * columns + x, in the order they became known, or None if the
+      entries were dropped or the map was restored from a snapshot since then.
+    """
+    start: int = count - self.__known_log_offset
+    if start < 0 or start > len(self.__known_log):
+      return None
+    return self.__known_log[start:]
+
+  def log_known(self, indices: list[int]) -> None:
+    """
+    Appends to the log cells that were unknown and have just been marked as known.
+
+    Args:
+      indices (list[int]): The cells, indexed by y * columns + x.
+    """
+    self.__known_log.extend(indices)
+    if len(self.__known_log) > KnownMap.KNOWN_LOG_LIMIT:
+      dropped: int = len(self.__known_log) // 2
+      del self.__known_log[:dropped]
+      self.__known_log_offset += dropped
+
+  def clear_known_log(self) -> None:
+    """
+    Empties the log of known cells after cells became unknown again, so every previous position of the log is invalid.
+    """
+    self.__known_log_offset += len(self.__known_log) + 1
+    self.__known_log = []
+
+  @abstractmethod
+  def is_known(self, x: int, y: int) -> bool:
+    """
+    Checks if a cell is known.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      bool: True if the cell is known, False if it is not or it is out of bounds.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def set_known(self, x: int, y: int) -> None:
+    """
+    Marks a cell as known, without flags.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def set_known_cells(self, indices: Iterable[int]) -> list[int]:
+    """
+    Marks as known the unknown cells among the given ones, the cells already known keep their flags.
+
+    Args:
+      indices (Iterable[int]): The cells to mark, indexed by y * columns + x.
+
+    Returns:
+      list[int]: The cells that were unknown, in the given order.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def add_flags(self, x: int, y: int, flags: list[str]) -> bool:
+    """
+    Adds flags to a known cell, in order, stopping at the first flag already present.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flags (list[str]): The flags to be added.
+
+    Returns:
+      bool: True if every flag was added, False if the cell is unknown or a flag was already present.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def remove_flag(self, x: int, y: int, flag: str) -> bool:
+    """
+    Removes a flag from a known cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flag (str): The flag to be removed.
+
+    Returns:
+      bool: True if the flag was removed, False if the cell is unknown or the flag was not present.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def list_flags(self, x: int, y: int) -> list[str]:
+    """
+    Lists the flags of a cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      list[str]: The flags of the cell, empty if the cell is unknown.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def create_snapshot(self) -> object:
+    """
+    Captures the known cells and their flags, to restore them later with restore_snapshot.
+
+    Returns:
+      object: The snapshot, opaque and only valid for maps of the same storage and size.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def restore_snapshot(self, snapshot: object) -> None:
+    """
+    Restores the known cells and their flags captured by create_snapshot.
+
+    Args:
+      snapshot (object): The snapshot of this map or of a map of the same storage and size.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
@@ -0,0 +1,139 @@
+from typing import Iterable, Optional
+
+from src.agent.domain.known_cell import KnownCell
+from src.agent.domain.known_map.known_map import KnownMap
+
+
+class NestedKnownMap(KnownMap):
+  """
+  Knowledge of an agent stored as a nested list, with a KnownCell object for every known cell.
+
+  Attributes:
+    __cells (list[list[Optional[KnownCell]]]): The known cells indexed by [y][x], None for the unknown ones.
+  """
+
+  def __init__(self, rows: int, columns: int):
+    """
+    Initializes a NestedKnownMap instance without known cells.
+
+    Args:
+      rows (int): The number of rows of the map, the bound of the y-coordinate.
+      columns (int): The number of columns of the map, the bound of the x-coordinate.
+    """
+    super().__init__(rows, columns)
+    self.__cells: list[list[Optional[KnownCell]]] = [[None for _ in range(columns)] for _ in range(rows)]
+
+  def is_known(self, x: int, y: int) -> bool:
+    """
+    Checks if a cell is known.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      bool: True if the cell is known, False if it is not or it is out of bounds.
+    """
+    if y < 0 or y >= self.get_rows() or x < 0 or x >= self.get_columns():
+      return False
+    return self.__cells[y][x] is not None
+
+  def set_known(self, x: int, y: int) -> None:
+    """
+    Marks a cell as known, without flags.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+    """
+    if self.__cells[y][x] is None:
+      self.log_known([y * self.get_columns() + x])
+    self.__cells[y][x] = KnownCell([])
+
+  def set_known_cells(self, indices: Iterable[int]) -> list[int]:
+    """
+    Marks as known the unknown cells among the given ones, the cells already known keep their flags.
+
+    Args:
+      indices (Iterable[int]): The cells to mark, indexed by y * columns + x.
+
+    Returns:
+      list[int]: The cells that were unknown, in the given order.
+    """
+    columns: int = self.get_columns()
+    new_indices: list[int] = []
+    for index in indices:
+      row: list[Optional[KnownCell]] = self.__cells[index // columns]
+      if row[index % columns] is None:
+        row[index % columns] = KnownCell([])
+        new_indices.append(index)
+    self.log_known(new_indices)
+    return new_indices
+
+  def add_flags(self, x: int, y: int, flags: list[str]) -> bool:
+    """
+    Adds flags to a known cell, in order, stopping at the first flag already present.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flags (list[str]): The flags to be added.
+
+    Returns:
+      bool: True if every flag was added, False if the cell is unknown or a flag was already present.
+    """
+    if not self.is_known(x, y):
+      return False
+    return self.__cells[y][x].add_flags(flags)
+
+  def remove_flag(self, x: int, y: int, flag: str) -> bool:
+    """
+    Removes a flag from a known cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+      flag (str): The flag to be removed.
+
+    Returns:
+      bool: True if the flag was removed, False if the cell is unknown or the flag was not present.
+    """
+    if not self.is_known(x, y):
+      return False
+    return self.__cells[y][x].remove_flag(flag)
+
+  def list_flags(self, x: int, y: int) -> list[str]:
+    """
+    Lists the flags of a cell.
+
+    Args:
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      list[str]: The flags of the cell, empty if the cell is unknown.
+    """
+    if not self.is_known(x, y):
+      return []
+    return self.__cells[y][x].list_flags()
+
+  def create_snapshot(self) -> list[list[Optional[list[str]]]]:
+    """
+    Captures the known cells and their flags, to restore them later with restore_snapshot.
+
+    Every known cell is copied, so the cost grows with the size of the map.
+
+    Returns:
+      list[list[Optional[list[str]]]]: The flags of every known cell indexed by [y][x], None for the unknown ones.
+    """
+    return [[None if cell is None else list(cell.list_flags()) for cell in row] for row in self.__cells]
+
+  def restore_snapshot(self, snapshot: list[list[Optional[list[str]]]]) -> None:
+    """
+    Restores the known cells and their flags captured by create_snapshot, clearing the log of known cells.
+
+    Args:
+      snapshot (list[list[Optional[list[str]]]]): The snapshot of this map or of a map of the same size.
+    """
+    self.__cells = [[None if flags is None else KnownCell(list(flags)) for flags in row] for row in snapshot]
+    self.clear_known_log()
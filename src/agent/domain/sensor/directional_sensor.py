@@ -1,14 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+
 from src.agent.domain.agent import Agent
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
 from src.agent.domain.sensor.sensor import Sensor, SensorResult
+from src.agent.domain.sensor.sensor_sweep import SensorSweep
 from src.environment.domain.environment import Environment
 
 
 class DirectionalSensor(Sensor, ABC):
   """
   Represents a sensor that detects the terrain type in a specific direction around the agent.
+
+  The cells of the sensor lie on a straight line, the step i is at i times the coordinates of the first step.
   """
 
   @abstractmethod
@@ -26,6 +29,15 @@ class DirectionalSensor(Sensor, ABC):
     """
     pass
 
+  def get_direction(self) -> tuple[int, int]:
+    """
+    Gets the step of the sensor along each coordinate.
+
+    Returns:
+      tuple[int, int]: The step as (dx, dy).
+    """
+    return self.get_new_coordinates(0, 0, 1)
+
   def detect(self, agent: Agent, sensor_configuration: SensorConfiguration, environment: Environment) -> SensorResult:
     """
     Detects the terrain type in the cells in the specific direction of the agent, updating its individual knowledge and the global map of the environment.
@@ -38,18 +50,4 @@ class DirectionalSensor(Sensor, ABC):
     Returns:
       SensorResult: The result of the sensor detection.
     """
-    x: int = agent.get_x()
-    y: int = agent.get_y()
-    pass_trough: bool = sensor_configuration.can_pass_trough()
-    for i in range(1, sensor_configuration.get_radius() + 1):
-      new_x, new_y = self.get_new_coordinates(x, y, i)
-      if agent.is_known(new_x, new_y):
-        continue
-      obstacle: Optional[bool] = environment.is_obstacle_for(agent, new_x, new_y)
-      if obstacle is None:
-        return SensorResult.OUT_OF_BOUNDS
-      agent.set_known(new_x, new_y)
-      environment.update_discovered_map(new_x, new_y, True)
-      if obstacle and not pass_trough:
-        return SensorResult.HIT_OBSTACLE
-    return SensorResult.SUCCESS
+    return SensorSweep.sweep(agent, environment, [self.get_direction()], sensor_configuration.get_radius(), sensor_configuration.can_pass_trough())
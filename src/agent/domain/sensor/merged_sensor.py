@@ -1,6 +1,10 @@
+from typing import Callable, Optional
+
 from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.directional_sensor import DirectionalSensor
 from src.agent.domain.sensor.sensor import Sensor, SensorResult
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.agent.domain.sensor.sensor_sweep import SensorSweep
 from src.environment.domain.environment import Environment
 
 
@@ -8,8 +12,17 @@ class MergedSensor(Sensor):
   def __init__(self, identifier: str, sensors: list[Sensor]):
     super().__init__(identifier)
     self.__sensors: list[Sensor] = sensors
+    # When every sensor is directional, their rays are cast in a single sweep.
+    self.__directions: Optional[list[tuple[int, int]]] = None
+    if all(isinstance(sensor, DirectionalSensor) for sensor in sensors):
+      self.__directions = [sensor.get_direction() for sensor in sensors]
+
+  def get_directions(self) -> Optional[list[tuple[int, int]]]:
+    return self.__directions
 
   def detect(self, agent: Agent, sensor_configuration: SensorConfiguration, environment: Environment) -> SensorResult:
+    if self.__directions is not None:
+      return SensorSweep.sweep(agent, environment, self.__directions, sensor_configuration.get_radius(), sensor_configuration.can_pass_trough())
     sensor_result: SensorResult = SensorResult.SUCCESS
     pass_trough = sensor_configuration.can_pass_trough()
     for sensor in self.__sensors:
@@ -17,3 +30,11 @@ class MergedSensor(Sensor):
       if sensor_result == SensorResult.HIT_OBSTACLE and not pass_trough:
         return sensor_result
     return sensor_result
+
+  def compile(self, sensor_configuration: SensorConfiguration, environment: Environment) -> Callable[[Agent], SensorResult]:
+    if self.__directions is None:
+      return super().compile(sensor_configuration, environment)
+    directions: list[tuple[int, int]] = self.__directions
+    radius: int = sensor_configuration.get_radius()
+    pass_trough: bool = sensor_configuration.can_pass_trough()
+    return lambda agent: SensorSweep.sweep(agent, environment, directions, radius, pass_trough)
@@ -4,6 +4,7 @@ This module defines the Sensor class and the SensorResult enum for detecting the
 
 from abc import abstractmethod
 from enum import Enum
+from typing import Callable
 
 from src.agent.domain.agent import Agent
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
@@ -66,3 +67,18 @@ class Sensor:
       SensorResult: The result of the sensor detection.
     """
     raise NotImplementedError("This method should be implemented by the subclass.")
+
+  def compile(self, sensor_configuration: SensorConfiguration, environment: Environment) -> Callable[[Agent], SensorResult]:
+    """
+    Binds the sensor to a configuration and an environment, for callers that execute it many times.
+
+    Subclasses can override it to read the configuration once, instead of on every detection.
+
+    Args:
+      sensor_configuration (SensorConfiguration): The specific sensor configuration.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Callable[[Agent], SensorResult]: A function that runs the detection for an agent, with the same results as detect.
+    """
+    return lambda agent: self.detect(agent, sensor_configuration, environment)
@@ -0,0 +1,118 @@
+from array import array
+from typing import Callable, Optional
+
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor import SensorResult
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
+
+
+class SensorSweep:
+  """
+  Casts the rays of directional sensors over the movement cost matrix of the agent.
+
+  Every ray is resolved as a strided slice of the matrix: the bounds are computed once, the obstacles are searched with
+  array.index, and the newly known cells are applied to the agent and the environment in bulk. The Python work of a ray
+  depends on the number of obstacles it meets, not on its radius.
+
+  A ray skips the cells the agent already knows. Without pass-through, it stops at the first unknown obstacle, which
+  becomes known.
+  """
+
+  @staticmethod
+  def sweep(agent: Agent, environment: Environment, directions: list[tuple[int, int]], radius: int, pass_trough: bool) -> SensorResult:
+    """
+    Casts a ray in every direction, in order, stopping at the first ray that hits an obstacle without pass-through.
+
+    Args:
+      agent (Agent): The agent that detects the terrain.
+      environment (Environment): The environment in which the agent operates.
+      directions (list[tuple[int, int]]): The step of every ray as (dx, dy).
+      radius (int): The number of cells of every ray.
+      pass_trough (bool): Whether the rays continue after an obstacle.
+
+    Returns:
+      SensorResult: HIT_OBSTACLE if a ray stopped at an obstacle, otherwise the result of the last ray.
+    """
+    movement_costs: array = environment.get_movement_costs_for(agent.get_name())
+    sensor_result: SensorResult = SensorResult.SUCCESS
+    for dx, dy in directions:
+      sensor_result = SensorSweep.cast(agent, environment, movement_costs, dx, dy, radius, pass_trough)
+      if sensor_result == SensorResult.HIT_OBSTACLE and not pass_trough:
+        return sensor_result
+    return sensor_result
+
+  @staticmethod
+  def cast(agent: Agent, environment: Environment, movement_costs: array, dx: int, dy: int, radius: int, pass_trough: bool) -> SensorResult:
+    """
+    Casts a ray from the position of the agent, updating its knowledge and the discovered map of the environment.
+
+    Args:
+      agent (Agent): The agent that detects the terrain.
+      environment (Environment): The environment in which the agent operates.
+      movement_costs (array): The movement costs of the agent, indexed by y * columns + x.
+      dx (int): The step of the ray along the x-coordinate.
+      dy (int): The step of the ray along the y-coordinate.
+      radius (int): The number of cells of the ray.
+      pass_trough (bool): Whether the ray continues after an obstacle.
+
+    Returns:
+      SensorResult: HIT_OBSTACLE if the ray stopped at an obstacle, OUT_OF_BOUNDS if it left the environment, SUCCESS
+      otherwise.
+    """
+    columns: int = environment.get_columns()
+    cells, sensor_result = SensorSweep.trace(
+      agent.get_x(), agent.get_y(), dx, dy, radius, environment.get_rows(), columns, movement_costs, pass_trough,
+      lambda index: agent.is_known(index % columns, index // columns))
+    if cells:
+      environment.update_discovered_cells(agent.set_known_cells(cells))
+    return sensor_result
+
+  @staticmethod
+  def trace(x: int, y: int, dx: int, dy: int, radius: int, rows: int, columns: int, movement_costs: array, pass_trough: bool, is_known: Callable[[int], bool]) -> tuple[range, SensorResult]:
+    """
+    Resolves the cells reached by a ray, without updating any knowledge, so every representation of the known cells
+    follows the same rule.
+
+    Args:
+      x (int): The x-coordinate the ray starts from.
+      y (int): The y-coordinate the ray starts from.
+      dx (int): The step of the ray along the x-coordinate.
+      dy (int): The step of the ray along the y-coordinate.
+      radius (int): The number of cells of the ray.
+      rows (int): The number of rows of the environment.
+      columns (int): The number of columns of the environment.
+      movement_costs (array): The movement costs of the agent, indexed by y * columns + x.
+      pass_trough (bool): Whether the ray continues after an obstacle.
+      is_known (Callable[[int], bool]): Checks if the cell at an index is known.
+
+    Returns:
+      tuple[range, SensorResult]: The indices of the cells reached by the ray, in order, ending at the obstacle it
+      stopped at, and HIT_OBSTACLE if it stopped at an obstacle, OUT_OF_BOUNDS if it left the environment, SUCCESS
+      otherwise.
+    """
+    length: int = radius
+    if dx != 0:
+      length = min(length, (columns - 1 - x if dx > 0 else x) // abs(dx))
+    if dy != 0:
+      length = min(length, (rows - 1 - y if dy > 0 else y) // abs(dy))
+    sensor_result: SensorResult = SensorResult.OUT_OF_BOUNDS if length < radius else SensorResult.SUCCESS
+    if length <= 0:
+      return range(0), sensor_result
+
+    step: int = dy * columns + dx
+    first: int = (y + dy) * columns + x + dx
+    cells: range = range(first, first + length * step, step)
+    if not pass_trough:
+      stop: Optional[int] = cells.stop if cells.stop >= 0 else None
+      costs: array = movement_costs[first:stop:step]
+      position: int = 0
+      while True:
+        try:
+          position = costs.index(Grid.IMPASSABLE, position)
+        except ValueError:
+          break
+        if not is_known(cells[position]):
+          return cells[:position + 1], SensorResult.HIT_OBSTACLE
+        position += 1
+    return cells, sensor_result
@@ -0,0 +1,330 @@
+from array import array
+from heapq import heappop, heappush
+from typing import Optional
+
+from src.environment.domain.grid.grid import Grid
+
+
+class ClusterAbstraction:
+  """
+  Abstract graph of a movement cost matrix for hierarchical path planning (HPA*).
+
+  The matrix is partitioned in square clusters. Along the border between two neighbouring clusters, every maximal
+  segment of positions passable on both sides becomes one transition in its middle, or two at its ends when it is long.
+  The nodes of the abstract graph are the positions of the transitions, connected to their counterpart across the
+  border and to the other transitions of their cluster by the least cost of a path that stays inside the cluster.
+
+  The graph is built lazily and cached: the transitions of a border when a search first reaches one of its clusters,
+  and the edges of a node inside its cluster when the node is first expanded. Changing a position only drops the
+  caches of its cluster and of the neighbouring ones.
+
+  Nodes are identified by the integer index y * columns + x of the movement cost matrix. Moving into a position costs its
+  movement cost, so the edges are directed.
+
+  Attributes:
+    TRANSITION_SPLIT_LENGTH (int): The length from which a segment of a border gets two transitions instead of one.
+    __borders (dict[tuple[int, bool], list[tuple[int, int]]]): The transitions of the east (True) or south (False)
+      border of every cluster, as pairs of positions inside and outside the cluster.
+    __cluster_columns (int): The number of clusters along the x-coordinate.
+    __cluster_size (int): The number of positions of the side of a cluster.
+    __columns (int): The number of columns of the matrix.
+    __edges (dict[int, dict[int, list[tuple[int, int]]]]): The edges of every expanded node to the other transitions of
+      its cluster with their cost, by cluster and then by node.
+    __minimum_cost (Optional[int]): The smallest movement cost of the matrix, once computed.
+    __rows (int): The number of rows of the matrix.
+    __transitions (dict[int, dict[int, list[int]]]): The transitions of every cluster, as the positions across the
+      border reached from every position of the cluster, by cluster and then by position.
+  """
+  TRANSITION_SPLIT_LENGTH: int = 6
+
+  def __init__(self, rows: int, columns: int, cluster_size: int):
+    """
+    Initializes a ClusterAbstraction instance without cached parts.
+
+    Args:
+      rows (int): The number of rows of the matrix.
+      columns (int): The number of columns of the matrix.
+      cluster_size (int): The number of positions of the side of a cluster.
+
+    Raises:
+      ValueError: If the cluster size is less than 2.
+    """
+    if cluster_size < 2:
+      raise ValueError('The cluster size must be greater than 1')
+    self.__borders: dict[tuple[int, bool], list[tuple[int, int]]] = {}
+    self.__cluster_columns: int = -(-columns // cluster_size)
+    self.__cluster_size: int = cluster_size
+    self.__columns: int = columns
+    self.__edges: dict[int, dict[int, list[tuple[int, int]]]] = {}
+    self.__minimum_cost: Optional[int] = None
+    self.__rows: int = rows
+    self.__transitions: dict[int, dict[int, list[int]]] = {}
+
+  def get_cluster(self, node: int) -> int:
+    """
+    Returns the cluster of a position.
+
+    Args:
+      node (int): The index of the position.
+
+    Returns:
+      int: The index of the cluster, row after row of clusters.
+    """
+    y, x = divmod(node, self.__columns)
+    return (y // self.__cluster_size) * self.__cluster_columns + x // self.__cluster_size
+
+  def get_cluster_bounds(self, cluster: int) -> tuple[int, int, int, int]:
+    """
+    Returns the positions covered by a cluster.
+
+    Args:
+      cluster (int): The index of the cluster.
+
+    Returns:
+      tuple[int, int, int, int]: The minimum x, the minimum y, and the x and y past the last position of the cluster.
+    """
+    cluster_y, cluster_x = divmod(cluster, self.__cluster_columns)
+    size: int = self.__cluster_size
+    return cluster_x * size, cluster_y * size, min((cluster_x + 1) * size, self.__columns), min((cluster_y + 1) * size, self.__rows)
+
+  def get_minimum_cost(self, movement_costs: array) -> int:
+    """
+    Returns the smallest movement cost of the matrix, which makes the Manhattan heuristic admissible.
+
+    Args:
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+
+    Returns:
+      int: The smallest movement cost, or 0 if every position is impassable.
+    """
+    if self.__minimum_cost is None:
+      self.__minimum_cost = min((movement_cost for movement_cost in set(movement_costs) if movement_cost != Grid.IMPASSABLE), default=0)
+    return self.__minimum_cost
+
+  def invalidate(self, x: int, y: int) -> None:
+    """
+    Drops the cached parts of the graph that depend on the movement cost of a position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+    """
+    self.__minimum_cost = None
+    cluster: int = self.get_cluster(y * self.__columns + x)
+    cluster_y, cluster_x = divmod(cluster, self.__cluster_columns)
+    self.__borders.pop((cluster, True), None)
+    self.__borders.pop((cluster, False), None)
+    affected_clusters: list[int] = [cluster]
+    if cluster_x > 0:
+      self.__borders.pop((cluster - 1, True), None)
+      affected_clusters.append(cluster - 1)
+    if cluster_y > 0:
+      self.__borders.pop((cluster - self.__cluster_columns, False), None)
+      affected_clusters.append(cluster - self.__cluster_columns)
+    if (cluster_x + 1) * self.__cluster_size < self.__columns:
+      affected_clusters.append(cluster + 1)
+    if (cluster_y + 1) * self.__cluster_size < self.__rows:
+      affected_clusters.append(cluster + self.__cluster_columns)
+    for affected_cluster in affected_clusters:
+      self.__transitions.pop(affected_cluster, None)
+      self.__edges.pop(affected_cluster, None)
+
+  def get_border(self, cluster: int, east: bool, movement_costs: array) -> list[tuple[int, int]]:
+    """
+    Returns the transitions of the east or south border of a cluster.
+
+    Args:
+      cluster (int): The index of the cluster.
+      east (bool): True for the east border, False for the south border.
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+
+    Returns:
+      list[tuple[int, int]]: The transitions, as pairs of positions inside and outside the cluster.
+    """
+    transitions: Optional[list[tuple[int, int]]] = self.__borders.get((cluster, east))
+    if transitions is not None:
+      return transitions
+
+    columns: int = self.__columns
+    min_x, min_y, end_x, end_y = self.get_cluster_bounds(cluster)
+    pairs: list[tuple[int, int]] = []
+    if east and end_x < columns:
+      pairs = [(y * columns + end_x - 1, y * columns + end_x) for y in range(min_y, end_y)]
+    elif not east and end_y < self.__rows:
+      pairs = [((end_y - 1) * columns + x, end_y * columns + x) for x in range(min_x, end_x)]
+
+    transitions = []
+    segment: list[tuple[int, int]] = []
+    for pair in [*pairs, None]:
+      if pair is not None and movement_costs[pair[0]] != Grid.IMPASSABLE and movement_costs[pair[1]] != Grid.IMPASSABLE:
+        segment.append(pair)
+        continue
+      if len(segment) >= ClusterAbstraction.TRANSITION_SPLIT_LENGTH:
+        transitions.extend((segment[0], segment[-1]))
+      elif len(segment) > 0:
+        transitions.append(segment[len(segment) // 2])
+      segment = []
+    self.__borders[(cluster, east)] = transitions
+    return transitions
+
+  def get_transitions(self, cluster: int, movement_costs: array) -> dict[int, list[int]]:
+    """
+    Returns the transitions of the four borders of a cluster.
+
+    Args:
+      cluster (int): The index of the cluster.
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+
+    Returns:
+      dict[int, list[int]]: The positions across the border reached from every transition position of the cluster.
+    """
+    transitions: Optional[dict[int, list[int]]] = self.__transitions.get(cluster)
+    if transitions is not None:
+      return transitions
+
+    transitions = {}
+    cluster_y, cluster_x = divmod(cluster, self.__cluster_columns)
+    for east in (True, False):
+      for inner, outer in self.get_border(cluster, east, movement_costs):
+        transitions.setdefault(inner, []).append(outer)
+    if cluster_x > 0:
+      for outer, inner in self.get_border(cluster - 1, True, movement_costs):
+        transitions.setdefault(inner, []).append(outer)
+    if cluster_y > 0:
+      for outer, inner in self.get_border(cluster - self.__cluster_columns, False, movement_costs):
+        transitions.setdefault(inner, []).append(outer)
+    self.__transitions[cluster] = transitions
+    return transitions
+
+  def get_edges(self, node: int, movement_costs: array) -> list[tuple[int, int]]:
+    """
+    Returns the edges of a position to the transitions of its cluster.
+
+    Args:
+      node (int): The index of the position.
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+
+    Returns:
+      list[tuple[int, int]]: The transitions reachable inside the cluster, with the least cost of reaching them.
+    """
+    cluster: int = self.get_cluster(node)
+    edges_by_node: dict[int, list[tuple[int, int]]] = self.__edges.setdefault(cluster, {})
+    edges: Optional[list[tuple[int, int]]] = edges_by_node.get(node)
+    if edges is None:
+      distances: dict[int, int] = self.search_cluster(movement_costs, node, False)
+      edges = [(transition, distances[transition]) for transition in self.get_transitions(cluster, movement_costs) if transition != node and transition in distances]
+      edges_by_node[node] = edges
+    return edges
+
+  def search_cluster(self, movement_costs: array, source: int, reverse: bool) -> dict[int, int]:
+    """
+    Runs Dijkstra from a position without leaving its cluster.
+
+    Args:
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+      source (int): The index of the position.
+      reverse (bool): Whether to compute the cost of reaching the source from every position instead of the cost of
+        reaching every position from the source.
+
+    Returns:
+      dict[int, int]: The least cost of every reachable position of the cluster.
+    """
+    impassable: int = Grid.IMPASSABLE
+    columns: int = self.__columns
+    min_x, min_y, end_x, end_y = self.get_cluster_bounds(self.get_cluster(source))
+    distances: dict[int, int] = {source: 0}
+    closed: set[int] = set()
+    open_set: list[tuple[int, int]] = [(0, source)]
+    while open_set:
+      distance, node = heappop(open_set)
+      if node in closed:
+        continue
+      closed.add(node)
+      y, x = divmod(node, columns)
+      for neighbour, inside in ((node - 1, x > min_x), (node + 1, x < end_x - 1), (node - columns, y > min_y), (node + columns, y < end_y - 1)):
+        if not inside or movement_costs[neighbour] == impassable:
+          continue
+        neighbour_distance: int = distance + (movement_costs[node] if reverse else movement_costs[neighbour])
+        if neighbour_distance < distances.get(neighbour, neighbour_distance + 1):
+          distances[neighbour] = neighbour_distance
+          heappush(open_set, (neighbour_distance, neighbour))
+    return distances
+
+  def search(self, movement_costs: array, start: int, finish: int) -> Optional[tuple[int, int, list[int]]]:
+    """
+    Runs A* over the abstract graph, with the start and the finish connected to the transitions of their clusters. The
+    start is also connected to its neighbours across the borders of its cluster, since an impassable start is only
+    left by its first move and is not a transition.
+
+    Args:
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+      start (int): The index of the start position.
+      finish (int): The index of the finish position.
+
+    Returns:
+      Optional[tuple[int, int, list[int]]]: The cost, the number of expanded nodes and the abstract path, from the start
+      to the finish, in which consecutive positions are either neighbours across a border or in the same cluster. None
+      if the finish cannot be reached.
+    """
+    if movement_costs[finish] == Grid.IMPASSABLE:
+      return None
+
+    columns: int = self.__columns
+    minimum_cost: int = self.get_minimum_cost(movement_costs)
+    finish_cluster: int = self.get_cluster(finish)
+    finish_distances: dict[int, int] = self.search_cluster(movement_costs, finish, True)
+    if self.get_cluster(start) == finish_cluster:
+      # The start may be impassable, so the reverse search cannot reach it.
+      start_distance: Optional[int] = self.search_cluster(movement_costs, start, False).get(finish)
+      finish_distances.pop(start, None)
+      if start_distance is not None:
+        finish_distances[start] = start_distance
+    finish_y, finish_x = divmod(finish, columns)
+    start_y, start_x = divmod(start, columns)
+    start_cluster: int = self.get_cluster(start)
+    start_links: list[tuple[int, int]] = [
+      (neighbour, movement_costs[neighbour])
+      for neighbour, inside in ((start - 1, start_x > 0), (start + 1, start_x < columns - 1), (start - columns, start_y > 0), (start + columns, start_y < self.__rows - 1))
+      if inside and self.get_cluster(neighbour) != start_cluster and movement_costs[neighbour] != Grid.IMPASSABLE
+    ]
+
+    distances: dict[int, int] = {start: 0}
+    parents: dict[int, int] = {start: -1}
+    closed: set[int] = set()
+    open_set: list[tuple[int, int]] = [(0, start)]
+    expanded_nodes: int = 0
+    while open_set:
+      node: int = heappop(open_set)[1]
+      if node in closed:
+        continue
+      if node == finish:
+        break
+      closed.add(node)
+      expanded_nodes += 1
+      distance: int = distances[node]
+      cluster: int = self.get_cluster(node)
+      successors: list[tuple[int, int]] = [
+        *self.get_edges(node, movement_costs),
+        *((neighbour, movement_costs[neighbour]) for neighbour in self.get_transitions(cluster, movement_costs).get(node, ()))
+      ]
+      if cluster == finish_cluster and node in finish_distances:
+        successors.append((finish, finish_distances[node]))
+      if node == start:
+        successors.extend(start_links)
+      for successor, cost in successors:
+        successor_distance: int = distance + cost
+        if successor not in closed and successor_distance < distances.get(successor, successor_distance + 1):
+          distances[successor] = successor_distance
+          parents[successor] = node
+          y, x = divmod(successor, columns)
+          heappush(open_set, (successor_distance + minimum_cost * (abs(x - finish_x) + abs(y - finish_y)), successor))
+    else:
+      return None
+
+    nodes: list[int] = []
+    node = finish
+    while node != -1:
+      nodes.append(node)
+      node = parents[node]
+    nodes.reverse()
+    return distances[finish], expanded_nodes, nodes
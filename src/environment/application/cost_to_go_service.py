@@ -0,0 +1,236 @@
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from heapq import heappop, heappush
+from typing import Optional
+
+from src.agent.domain.agent import Agent
+from src.environment.domain.cost_to_go_field import CostToGoField
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
+from src.position.domain.position import Position
+
+
+class CostToGoService:
+  """
+  Service class for computing and caching the cost-to-go fields of the finish positions of an environment.
+
+  A field is computed once with a reverse Dijkstra from the finish over the movement costs of the type of agent, and
+  then answers the least remaining cost from any position in constant time. Fields are keyed by a digest of the
+  movement costs, which are derived from the map and the terrain file, and by the finish position. The most recent
+  fields are kept in memory and, when a cache directory is given, every field is also written there in a little-endian
+  binary format (magic, version, rows, columns and finish, followed by the costs), so later runs load it instead of
+  computing it again.
+
+  Attributes:
+    EXTENSION (str): The extension of the cached field files.
+    __cache_directory_path (Optional[str]): The directory where the fields are persisted, None to keep them in memory only.
+    __fields (dict[tuple[str, int, int], CostToGoField]): The fields in memory, by digest and finish, oldest first.
+    __memory_limit (int): The number of fields kept in memory.
+  """
+  EXTENSION: str = '.ctg'
+
+  __HEADER: struct.Struct = struct.Struct('<4sBxxxIIII')
+  __MAGIC: bytes = b'ICTG'
+  __VERSION: int = 1
+
+  def __init__(self, cache_directory_path: Optional[str] = None, memory_limit: int = 16):
+    """
+    Initializes a CostToGoService instance.
+
+    Args:
+      cache_directory_path (Optional[str]): The directory where the fields are persisted, created if missing, or None to
+        keep them in memory only.
+      memory_limit (int): The number of fields kept in memory.
+    """
+    self.__cache_directory_path: Optional[str] = cache_directory_path
+    self.__fields: dict[tuple[str, int, int], CostToGoField] = {}
+    self.__memory_limit: int = memory_limit
+
+  def get_field(self, environment: Environment, agent_name: str, finish: Position) -> CostToGoField:
+    """
+    Returns the cost-to-go field of a finish position for a type of agent, from memory, from disk or computed.
+
+    The movement costs are hashed on every call, so callers that read the field many times should keep it.
+
+    Args:
+      environment (Environment): The environment of the field.
+      agent_name (str): The name of the agent whose movement costs are used.
+      finish (Position): The finish position.
+
+    Returns:
+      CostToGoField: The field.
+
+    Raises:
+      ValueError: If the finish is out of the bounds of the environment.
+    """
+    if not environment.contains(finish.get_x(), finish.get_y()):
+      raise ValueError(f'Finish position {finish} is out of bounds.')
+    rows: int = environment.get_rows()
+    columns: int = environment.get_columns()
+    movement_costs: array = environment.get_movement_costs_for(agent_name)
+    key: tuple[str, int, int] = (CostToGoService.get_digest(movement_costs, rows, columns), finish.get_x(), finish.get_y())
+    field: Optional[CostToGoField] = self.__fields.pop(key, None)
+    if field is None:
+      file_path: Optional[str] = None
+      if self.__cache_directory_path is not None:
+        file_path = f'{self.__cache_directory_path}/{key[0]}_{key[1]}_{key[2]}{self.EXTENSION}'
+        field = self.load(file_path, rows, columns, finish)
+      if field is None:
+        finish_node: int = finish.get_y() * columns + finish.get_x()
+        field = CostToGoField(CostToGoService.compute(movement_costs, rows, columns, finish_node), rows, columns, finish)
+        if file_path is not None:
+          self.save(field, file_path)
+    self.__fields[key] = field
+    if len(self.__fields) > self.__memory_limit:
+      del self.__fields[next(iter(self.__fields))]
+    return field
+
+  def get_field_for_agent(self, agent: Agent, environment: Environment) -> CostToGoField:
+    """
+    Returns the cost-to-go field of the finish position of an agent.
+
+    Args:
+      agent (Agent): The agent, with its finish position set.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      CostToGoField: The field.
+
+    Raises:
+      ValueError: If the agent has no finish position, or it is out of bounds.
+    """
+    finish_x, finish_y = agent.get_finish_position()
+    if finish_x is None or finish_y is None:
+      raise ValueError('The agent has no finish position.')
+    return self.get_field(environment, agent.get_name(), Position(finish_x, finish_y))
+
+  def load(self, file_path: str, rows: int, columns: int, finish: Position) -> Optional[CostToGoField]:
+    """
+    Reads a field persisted by save.
+
+    Args:
+      file_path (str): The path of the field file.
+      rows (int): The expected number of rows.
+      columns (int): The expected number of columns.
+      finish (Position): The expected finish position.
+
+    Returns:
+      Optional[CostToGoField]: The field, or None if the file is missing or does not hold the expected field.
+    """
+    try:
+      with open(file_path, 'rb') as file:
+        header: bytes = file.read(self.__HEADER.size)
+        if len(header) != self.__HEADER.size or self.__HEADER.unpack(header) != (self.__MAGIC, self.__VERSION, rows, columns, finish.get_x(), finish.get_y()):
+          return None
+        costs: array = array('I')
+        costs.fromfile(file, rows * columns)
+    except (OSError, EOFError):
+      return None
+    if sys.byteorder != 'little':
+      costs.byteswap()
+    return CostToGoField(costs, rows, columns, finish)
+
+  def save(self, field: CostToGoField, file_path: str) -> None:
+    """
+    Writes a field to a file, replacing it atomically so concurrent runs never read a partial file.
+
+    Args:
+      field (CostToGoField): The field to write.
+      file_path (str): The path of the field file.
+    """
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    costs: array = field.get_costs()
+    if sys.byteorder != 'little':
+      costs = array('I', costs)
+      costs.byteswap()
+    temporary_file_path: str = f'{file_path}.{os.getpid()}.tmp'
+    with open(temporary_file_path, 'wb') as file:
+      finish: Position = field.get_finish()
+      file.write(self.__HEADER.pack(self.__MAGIC, self.__VERSION, field.get_rows(), field.get_columns(), finish.get_x(), finish.get_y()))
+      costs.tofile(file)
+    os.replace(temporary_file_path, file_path)
+
+  @staticmethod
+  def get_digest(movement_costs: array, rows: int, columns: int) -> str:
+    """
+    Returns a digest of a movement cost matrix, which identifies the map, the terrain and the type of agent.
+
+    Args:
+      movement_costs (array): The movement costs, indexed by y * columns + x.
+      rows (int): The number of rows of the matrix.
+      columns (int): The number of columns of the matrix.
+
+    Returns:
+      str: The hexadecimal digest.
+    """
+    digest = hashlib.sha256(f'{rows}x{columns}:{movement_costs.typecode}{movement_costs.itemsize}:{sys.byteorder}:'.encode('ascii'))
+    digest.update(movement_costs)
+    return digest.hexdigest()
+
+  @staticmethod
+  def compute(movement_costs: array, rows: int, columns: int, finish: int) -> array:
+    """
+    Runs Dijkstra backwards from the finish over a movement cost matrix, with a binary heap as open set.
+
+    Entering a node costs its movement cost, so the cost of a node is the cost of the neighbour it moves to plus the
+    movement cost of that neighbour. Impassable nodes get the cost of leaving them but are never entered.
+
+    Args:
+      movement_costs (array): The movement costs, indexed by y * columns + x, with Grid.IMPASSABLE for the positions that cannot be traversed.
+      rows (int): The number of rows of the matrix.
+      columns (int): The number of columns of the matrix.
+      finish (int): The index of the finish node.
+
+    Returns:
+      array: The cost of every node to the finish, with typecode 'I' and CostToGoField.UNREACHABLE for the nodes from which the finish cannot be reached.
+
+    Raises:
+      ValueError: If a cost does not fit in 32 bits.
+    """
+    impassable: int = Grid.IMPASSABLE
+    unreachable: int = CostToGoField.UNREACHABLE
+    if movement_costs[finish] == impassable:
+      return array('I', [unreachable]) * (rows * columns)
+
+    # The matrix is surrounded by a frame of impassable nodes, so neighbours never need bound checks.
+    width: int = columns + 2
+    frame: list[int] = [impassable] * width
+    costs: list[int] = frame[:]
+    for row in range(rows):
+      costs.append(impassable)
+      costs.extend(movement_costs[row * columns:(row + 1) * columns])
+      costs.append(impassable)
+    costs.extend(frame)
+
+    finish_y, finish_x = divmod(finish, columns)
+    target: int = (finish_y + 1) * width + finish_x + 1
+    # Entries of the open set are encoded as priority * size + node, plain integers are cheaper to compare than tuples.
+    size: int = len(costs)
+    distances: list[int] = [unreachable] * size
+    closed: bytearray = bytearray(size)
+    distances[target] = 0
+    open_set: list[int] = [target]
+
+    while open_set:
+      node: int = heappop(open_set) % size
+      if closed[node]:
+        continue
+      closed[node] = 1
+      cost: int = costs[node]
+      if cost == impassable:
+        continue
+      distance: int = distances[node] + cost
+      if distance >= unreachable:
+        raise ValueError(f'Cost {distance} does not fit in a cost-to-go field.')
+      for neighbour in (node - 1, node + 1, node - width, node + width):
+        if distance < distances[neighbour]:
+          distances[neighbour] = distance
+          heappush(open_set, distance * size + neighbour)
+
+    field: array = array('I')
+    for row in range(1, rows + 1):
+      field.extend(distances[row * width + 1:row * width + 1 + columns])
+    return field
@@ -1,6 +1,7 @@
 from abc import ABC
 from enum import Enum
-from typing import Optional
+from typing import BinaryIO, Callable, Optional, Sequence
+from weakref import WeakSet
 
 from src.agent.domain.action.action import Action, ActionResult
 from src.agent.domain.action.action_repository import ActionRepository
@@ -9,6 +10,7 @@ from src.agent.domain.agent import Agent
 from src.agent.domain.sensor.sensor import Sensor, SensorResult
 from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
 from src.agent.domain.sensor.sensor_repository import SensorRepository
+from src.environment.application.episode_recorder import EpisodeRecorder
 from src.environment.domain.environment import Environment
 
 
@@ -113,12 +115,215 @@ class ExecuteSensorResult(Result):
     return self.__sensor_result
 
 
+class CompiledDispatch:
+  """
+  Actions and sensors of an agent bound once to their implementations and to an environment, for callers that execute
+  millions of them.
+
+  The actions and sensors are addressed by their index in the lists of the agent at compile time. Every execution
+  returns the plain integer value of the ActionResult or SensorResult that execute_action or execute_sensor would
+  return, without looking up repositories or allocating result objects, so outcomes such as GOAL_REACHED and
+  HIT_OBSTACLE stay distinguishable. Every code fits in a byte. The dispatch can be used for any agent with the same
+  actions and sensors, such as the agents of the same type.
+
+  While a recorder is set, the bound actions and sensors are wrapped so every execution writes the same record as
+  execute_action or execute_sensor. Without a recorder they are called directly.
+
+  Attributes:
+    NO_RESULT (int): The code of the actions and sensors that did not return a result, as in the episode logs.
+    NOT_FOUND_IN_REPOSITORY (int): The code of the actions and sensors the repository does not have.
+    __action_identifiers (list[str]): The identifier of every action, by index.
+    __actions (list[Optional[Callable[[Agent], ActionResult]]]): The executed action of every index, recorded or not,
+      None if the repository does not have it.
+    __bound_actions (list[Optional[Callable[[Agent], ActionResult]]]): The bound action of every index, None if the
+      repository does not have it.
+    __bound_sensors (list[Optional[Callable[[Agent], SensorResult]]]): The bound sensor of every index, None if the
+      repository does not have it.
+    __recorder (Optional[EpisodeRecorder]): The recorder of the executions, None if they are not recorded.
+    __sensor_identifiers (list[str]): The identifier of every sensor, by index.
+    __sensors (list[Optional[Callable[[Agent], SensorResult]]]): The executed sensor of every index, recorded or not,
+      None if the repository does not have it.
+  """
+  NO_RESULT: int = EpisodeRecorder.NO_RESULT
+  NOT_FOUND_IN_REPOSITORY: int = 254
+
+  def __init__(self, action_identifiers: list[str], actions: list[Optional[Callable[[Agent], ActionResult]]], sensor_identifiers: list[str], sensors: list[Optional[Callable[[Agent], SensorResult]]]):
+    """
+    Initializes a CompiledDispatch instance.
+
+    Args:
+      action_identifiers (list[str]): The identifier of every action, by index.
+      actions (list[Optional[Callable[[Agent], ActionResult]]]): The bound action of every index, None if the repository
+        does not have it.
+      sensor_identifiers (list[str]): The identifier of every sensor, by index.
+      sensors (list[Optional[Callable[[Agent], SensorResult]]]): The bound sensor of every index, None if the
+        repository does not have it.
+    """
+    self.__action_identifiers: list[str] = action_identifiers
+    self.__actions: list[Optional[Callable[[Agent], ActionResult]]] = actions
+    self.__bound_actions: list[Optional[Callable[[Agent], ActionResult]]] = actions
+    self.__bound_sensors: list[Optional[Callable[[Agent], SensorResult]]] = sensors
+    self.__recorder: Optional[EpisodeRecorder] = None
+    self.__sensor_identifiers: list[str] = sensor_identifiers
+    self.__sensors: list[Optional[Callable[[Agent], SensorResult]]] = sensors
+
+  def set_recorder(self, recorder: Optional[EpisodeRecorder]) -> None:
+    """
+    Sets the recorder of the executions.
+
+    Args:
+      recorder (Optional[EpisodeRecorder]): The recorder, or None to stop recording.
+    """
+    self.__recorder = recorder
+    if recorder is None:
+      self.__actions = self.__bound_actions
+      self.__sensors = self.__bound_sensors
+      return
+    self.__actions = [
+      None if action is None else CompiledDispatch.record_executions(recorder, EpisodeRecorder.ACTION, identifier, action)
+      for identifier, action in zip(self.__action_identifiers, self.__bound_actions)
+    ]
+    self.__sensors = [
+      None if sensor is None else CompiledDispatch.record_executions(recorder, EpisodeRecorder.SENSOR, identifier, sensor)
+      for identifier, sensor in zip(self.__sensor_identifiers, self.__bound_sensors)
+    ]
+
+  @staticmethod
+  def record_executions(recorder: EpisodeRecorder, kind: int, identifier: str, execute: Callable[[Agent], Optional[Enum]]) -> Callable[[Agent], Optional[Enum]]:
+    """
+    Wraps a bound action or sensor so every execution is recorded.
+
+    Args:
+      recorder (EpisodeRecorder): The recorder of the executions.
+      kind (int): EpisodeRecorder.ACTION or EpisodeRecorder.SENSOR.
+      identifier (str): The identifier of the action or sensor.
+      execute (Callable[[Agent], Optional[Enum]]): The bound action or sensor.
+
+    Returns:
+      Callable[[Agent], Optional[Enum]]: A function with the same results that records every execution.
+    """
+    record: Callable[[int, str, Agent, Optional[int]], None] = recorder.record
+
+    def recorded(agent: Agent) -> Optional[Enum]:
+      result: Optional[Enum] = execute(agent)
+      record(kind, identifier, agent, None if result is None else result.value)
+      return result
+
+    return recorded
+
+  def get_action_identifiers(self) -> list[str]:
+    """
+    Returns the identifier of every action.
+
+    Returns:
+      list[str]: The identifiers, by index.
+    """
+    return self.__action_identifiers
+
+  def get_sensor_identifiers(self) -> list[str]:
+    """
+    Returns the identifier of every sensor.
+
+    Returns:
+      list[str]: The identifiers, by index.
+    """
+    return self.__sensor_identifiers
+
+  def get_action_index(self, action_identifier: str) -> Optional[int]:
+    """
+    Returns the index of an action.
+
+    Args:
+      action_identifier (str): The identifier of the action.
+
+    Returns:
+      Optional[int]: The index, or None if the agent did not have the action.
+    """
+    return self.__action_identifiers.index(action_identifier) if action_identifier in self.__action_identifiers else None
+
+  def get_sensor_index(self, sensor_identifier: str) -> Optional[int]:
+    """
+    Returns the index of a sensor.
+
+    Args:
+      sensor_identifier (str): The identifier of the sensor.
+
+    Returns:
+      Optional[int]: The index, or None if the agent did not have the sensor.
+    """
+    return self.__sensor_identifiers.index(sensor_identifier) if sensor_identifier in self.__sensor_identifiers else None
+
+  def step(self, agent: Agent, action_index: int) -> int:
+    """
+    Executes an action for an agent.
+
+    Args:
+      agent (Agent): The agent that will execute the action.
+      action_index (int): The index of the action.
+
+    Returns:
+      int: The value of the ActionResult, NO_RESULT or NOT_FOUND_IN_REPOSITORY.
+    """
+    action: Optional[Callable[[Agent], ActionResult]] = self.__actions[action_index]
+    if action is None:
+      if self.__recorder is not None:
+        self.__recorder.record(EpisodeRecorder.ACTION, self.__action_identifiers[action_index], agent, None)
+      return CompiledDispatch.NOT_FOUND_IN_REPOSITORY
+    action_result: Optional[ActionResult] = action(agent)
+    return CompiledDispatch.NO_RESULT if action_result is None else action_result.value
+
+  def step_all(self, agents: Sequence[Agent], action_indices: Sequence[int], result_codes: bytearray) -> None:
+    """
+    Executes an action for every agent, one after the other, writing the codes of step into a buffer reused by the
+    caller.
+
+    Args:
+      agents (Sequence[Agent]): The agents that will execute the actions.
+      action_indices (Sequence[int]): The index of the action of every agent.
+      result_codes (bytearray): The buffer that receives the code of every agent, at least as long as the agents.
+    """
+    actions: list[Optional[Callable[[Agent], ActionResult]]] = self.__actions
+    for position, (agent, action_index) in enumerate(zip(agents, action_indices)):
+      action: Optional[Callable[[Agent], ActionResult]] = actions[action_index]
+      if action is None:
+        if self.__recorder is not None:
+          self.__recorder.record(EpisodeRecorder.ACTION, self.__action_identifiers[action_index], agent, None)
+        result_codes[position] = CompiledDispatch.NOT_FOUND_IN_REPOSITORY
+        continue
+      action_result: Optional[ActionResult] = action(agent)
+      result_codes[position] = CompiledDispatch.NO_RESULT if action_result is None else action_result.value
+
+  def sense(self, agent: Agent, sensor_index: int) -> int:
+    """
+    Executes a sensor for an agent.
+
+    Args:
+      agent (Agent): The agent that will execute the sensor.
+      sensor_index (int): The index of the sensor.
+
+    Returns:
+      int: The value of the SensorResult, NO_RESULT or NOT_FOUND_IN_REPOSITORY.
+    """
+    sensor: Optional[Callable[[Agent], SensorResult]] = self.__sensors[sensor_index]
+    if sensor is None:
+      if self.__recorder is not None:
+        self.__recorder.record(EpisodeRecorder.SENSOR, self.__sensor_identifiers[sensor_index], agent, None)
+      return CompiledDispatch.NOT_FOUND_IN_REPOSITORY
+    sensor_result: Optional[SensorResult] = sensor(agent)
+    return CompiledDispatch.NO_RESULT if sensor_result is None else sensor_result.value
+
+
 class EnvironmentAgentService:
   """
   Service class for managing agent actions and sensors in an environment.
 
+  While a recording is active, every action and sensor executed through the service, or through a dispatch compiled
+  by it, is appended to its log.
+
   Attributes:
     __action_repository (ActionRepository): Repository for retrieving actions.
+    __dispatches (WeakSet[CompiledDispatch]): The dispatches compiled by the service, which record with it.
+    __recorder (Optional[EpisodeRecorder]): The recorder of the active recording, None if there is none.
     __sensor_repository (SensorRepository): Repository for retrieving sensors.
   """
 
@@ -131,8 +336,88 @@ class EnvironmentAgentService:
       sensor_repository (SensorRepository): Repository for retrieving sensors.
     """
     self.__action_repository = action_repository
+    self.__dispatches: WeakSet[CompiledDispatch] = WeakSet()
+    self.__recorder: Optional[EpisodeRecorder] = None
     self.__sensor_repository = sensor_repository
 
+  def get_action_repository(self) -> ActionRepository:
+    """
+    Returns the repository for retrieving actions.
+
+    Returns:
+      ActionRepository: The action repository.
+    """
+    return self.__action_repository
+
+  def get_sensor_repository(self) -> SensorRepository:
+    """
+    Returns the repository for retrieving sensors.
+
+    Returns:
+      SensorRepository: The sensor repository.
+    """
+    return self.__sensor_repository
+
+  def start_recording(self, stream: BinaryIO, keyframe_interval: int = 4096) -> EpisodeRecorder:
+    """
+    Starts recording every action and sensor executed through the service, replacing the active recording.
+
+    Args:
+      stream (BinaryIO): The stream the log is written to, positioned at its start.
+      keyframe_interval (int): The number of invocations between keyframes.
+
+    Returns:
+      EpisodeRecorder: The recorder of the new recording.
+    """
+    self.stop_recording()
+    self.__recorder = EpisodeRecorder(
+      stream,
+      [action.get_identifier() for action in self.__action_repository.get_actions()],
+      [sensor.get_identifier() for sensor in self.__sensor_repository.get_sensors()],
+      keyframe_interval)
+    for dispatch in self.__dispatches:
+      dispatch.set_recorder(self.__recorder)
+    return self.__recorder
+
+  def stop_recording(self) -> None:
+    """
+    Writes the buffered records of the active recording, if any, and stops it. The stream is not closed.
+    """
+    if self.__recorder is not None:
+      self.__recorder.flush()
+      self.__recorder = None
+      for dispatch in self.__dispatches:
+        dispatch.set_recorder(None)
+
+  def compile_dispatch(self, agent: Agent, environment: Environment) -> CompiledDispatch:
+    """
+    Binds the actions and sensors of an agent to their implementations and to an environment. The dispatch records its
+    executions while the service is recording, including the recordings started after it was compiled.
+
+    Args:
+      agent (Agent): The agent whose actions and sensors are bound, in the order of its lists.
+      environment (Environment): The environment in which the agent will execute them.
+
+    Returns:
+      CompiledDispatch: The bound actions and sensors.
+    """
+    action_identifiers: list[str] = []
+    actions: list[Optional[Callable[[Agent], ActionResult]]] = []
+    for action_configuration in agent.list_actions():
+      action: Optional[Action] = self.__action_repository.get_action(action_configuration.get_identifier())
+      action_identifiers.append(action_configuration.get_identifier())
+      actions.append(None if action is None else action.compile(action_configuration, environment))
+    sensor_identifiers: list[str] = []
+    sensors: list[Optional[Callable[[Agent], SensorResult]]] = []
+    for sensor_configuration in agent.list_sensors():
+      sensor: Optional[Sensor] = self.__sensor_repository.get_sensor(sensor_configuration.get_identifier())
+      sensor_identifiers.append(sensor_configuration.get_identifier())
+      sensors.append(None if sensor is None else sensor.compile(sensor_configuration, environment))
+    dispatch: CompiledDispatch = CompiledDispatch(action_identifiers, actions, sensor_identifiers, sensors)
+    dispatch.set_recorder(self.__recorder)
+    self.__dispatches.add(dispatch)
+    return dispatch
+
   def execute_action(self, agent: Agent, environment: Environment, action_configuration: ActionConfiguration) -> ExecuteActionResult:
     """
     Executes an action for an agent in an environment.
@@ -145,14 +430,52 @@ class EnvironmentAgentService:
     Returns:
       ExecuteActionResult: The result of the action execution.
     """
+    recorder: Optional[EpisodeRecorder] = self.__recorder
     action: Action = self.__action_repository.get_action(action_configuration.get_identifier())
     if action is None:
+      if recorder is not None:
+        recorder.record(EpisodeRecorder.ACTION, action_configuration.get_identifier(), agent, None)
       return ExecuteActionResult(ResultCode.NOT_FOUND_IN_REPOSITORY, None)
     action_result: ActionResult = action.execute(agent, action_configuration, environment)
+    if recorder is not None:
+      recorder.record(EpisodeRecorder.ACTION, action_configuration.get_identifier(), agent, None if action_result is None else action_result.value)
     if action_result is not ActionResult.SUCCESS:
       return ExecuteActionResult(ResultCode.FAILED, action_result)
     return ExecuteActionResult(ResultCode.SUCCESS, action_result)
 
+  def execute_action_batch(self, agents: list[Agent], environment: Environment, action_configuration: ActionConfiguration) -> list[ExecuteActionResult]:
+    """
+    Executes the same action for several agents in an environment, resolving them together.
+
+    Args:
+      agents (list[Agent]): The agents that will execute the action, in order.
+      environment (Environment): The environment in which the agents will execute the action.
+      action_configuration (ActionConfiguration): The action configuration to be executed.
+
+    Returns:
+      list[ExecuteActionResult]: The result of every agent, in order.
+    """
+    recorder: Optional[EpisodeRecorder] = self.__recorder
+    action: Action = self.__action_repository.get_action(action_configuration.get_identifier())
+    if action is None:
+      if recorder is not None:
+        for agent in agents:
+          recorder.record(EpisodeRecorder.ACTION, action_configuration.get_identifier(), agent, None)
+      return [ExecuteActionResult(ResultCode.NOT_FOUND_IN_REPOSITORY, None) for _ in agents]
+    if recorder is None:
+      action_results: list[ActionResult] = action.execute_batch(agents, action_configuration, environment)
+    else:
+      # The agents of a batch are resolved one after the other, so recording them one by one keeps the same log.
+      action_results = []
+      for agent in agents:
+        action_result: ActionResult = action.execute(agent, action_configuration, environment)
+        recorder.record(EpisodeRecorder.ACTION, action_configuration.get_identifier(), agent, None if action_result is None else action_result.value)
+        action_results.append(action_result)
+    return [
+      ExecuteActionResult(ResultCode.SUCCESS if action_result is ActionResult.SUCCESS else ResultCode.FAILED, action_result)
+      for action_result in action_results
+    ]
+
   def execute_action_from_identifier(self, agent: Agent, environment: Environment, action_identifier: str) -> ExecuteActionResult:
     """
     Executes an action for an agent in an environment.
@@ -199,10 +522,15 @@ class EnvironmentAgentService:
     Returns:
       ExecuteSensorResult: The result of the sensor execution.
     """
+    recorder: Optional[EpisodeRecorder] = self.__recorder
     sensor: Sensor = self.__sensor_repository.get_sensor(sensor_configuration.get_identifier())
     if sensor is None:
+      if recorder is not None:
+        recorder.record(EpisodeRecorder.SENSOR, sensor_configuration.get_identifier(), agent, None)
       return ExecuteSensorResult(ResultCode.NOT_FOUND_IN_REPOSITORY, None)
     sensor_result: SensorResult = sensor.detect(agent, sensor_configuration, environment)
+    if recorder is not None:
+      recorder.record(EpisodeRecorder.SENSOR, sensor_configuration.get_identifier(), agent, None if sensor_result is None else sensor_result.value)
     if sensor_result is not SensorResult.SUCCESS:
       return ExecuteSensorResult(ResultCode.FAILED, sensor_result)
     return ExecuteSensorResult(ResultCode.SUCCESS, sensor_result)
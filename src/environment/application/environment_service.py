@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.agent.domain.default_agents import DefaultAgents
 from src.environment.domain.cell.cell import Cell
 from src.environment.domain.environment import Environment
+from src.environment.domain.environment_snapshot import EnvironmentSnapshot
+from src.environment.domain.grid.cell_grid import CellGrid
+from src.environment.domain.grid.grid import Grid, GridStorage
+from src.environment.domain.grid.terrain_code_grid import TerrainCodeGrid
 from src.environment.domain.terrain.terrain import Terrain
 from src.environment.domain.terrain.terrain_repository import TerrainRepository
 from src.map.domain.map import Map
@@ -14,17 +18,23 @@ class EnvironmentService:
   Provides services for managing and interacting with the Environment class.
 
   Attributes:
+    __grid_storage (GridStorage): The storage mode used for the grid of the created environments.
+    __initial_snapshot (Optional[EnvironmentSnapshot]): The state of the environment right after it was set.
     __terrain_repository (TerrainRepository): Repository for retrieving terrain information.
   """
 
-  def __init__(self, map_repository: MapRepository, terrain_repository: TerrainRepository):
+  def __init__(self, map_repository: MapRepository, terrain_repository: TerrainRepository, grid_storage: GridStorage = GridStorage.TERRAIN_CODES):
     """
     Initializes an EnvironmentService instance.
 
     Args:
+      map_repository (MapRepository): Repository for retrieving the selected map.
       terrain_repository (TerrainRepository): Repository for retrieving terrain information.
+      grid_storage (GridStorage): The storage mode used for the grid of the created environments.
     """
     self.__environment: Optional[Environment] = None
+    self.__grid_storage: GridStorage = grid_storage
+    self.__initial_snapshot: Optional[EnvironmentSnapshot] = None
     self.__map_repository: MapRepository = map_repository
     self.__terrain_repository: TerrainRepository = terrain_repository
 
@@ -37,9 +47,30 @@ class EnvironmentService:
     """
     return self.__environment
 
+  def get_terrains_of(self, codes: Sequence[int]) -> dict[int, Terrain]:
+    """
+    Resolves the terrain of every distinct code of a map, once per code.
+
+    Args:
+      codes (Sequence[int]): The terrain codes of the map.
+
+    Returns:
+      dict[int, Terrain]: The terrains by code.
+
+    Raises:
+      ValueError: If a terrain code does not correspond to any terrain in the repository.
+    """
+    terrains: dict[int, Terrain] = {}
+    for code in set(codes):
+      terrain: Optional[Terrain] = self.__terrain_repository.get_by_code(code)
+      if terrain is None:
+        raise ValueError(f'Terrain with code {code} not found.')
+      terrains[code] = terrain
+    return terrains
+
   def create_cells_from_map(self, map: Map) -> list[list[Cell]]:
     """
-    Creates a grid of cells from a map.
+    Creates a grid of cells from a map. The cells share the Terrain object of their code.
 
     Args:
       map (Map): The map from which to create cells.
@@ -50,16 +81,48 @@ class EnvironmentService:
     Raises:
       ValueError: If a terrain code in the map does not correspond to any terrain in the repository.
     """
+    codes: Sequence[int] = map.get_cells()
+    terrains: dict[int, Terrain] = self.get_terrains_of(codes)
+    columns: int = map.get_columns()
     cells: list[list[Cell]] = []
     for row in range(map.get_rows()):
-      cells.append([])
-      for column in range(map.get_columns()):
-        terrain: Optional[Terrain] = self.__terrain_repository.get_by_code(map.get_cell(row, column))
-        if terrain is None:
-          raise ValueError(f'Terrain with code {map.get_cell(row, column)} not found.')
-        cells[row].append(Cell(terrain, row, column))
+      start: int = row * columns
+      cells.append([Cell(terrains[code], row, column) for column, code in enumerate(codes[start:start + columns])])
     return cells
 
+  def create_terrain_code_grid_from_map(self, map: Map) -> TerrainCodeGrid:
+    """
+    Creates a grid that keeps only the terrain codes of a map in a contiguous typed buffer, shared with the map.
+
+    Args:
+      map (Map): The map from which to create the grid.
+
+    Returns:
+      TerrainCodeGrid: The grid created from the map.
+
+    Raises:
+      ValueError: If a terrain code in the map does not correspond to any terrain in the repository.
+    """
+    codes: Sequence[int] = map.get_cells()
+    return TerrainCodeGrid(codes, self.get_terrains_of(codes), map.get_rows(), map.get_columns(), self.__terrain_repository.get_cost_table())
+
+  def create_grid_from_map(self, map: Map) -> Grid:
+    """
+    Creates the grid of an environment from a map, using the configured storage mode.
+
+    Args:
+      map (Map): The map from which to create the grid.
+
+    Returns:
+      Grid: The grid created from the map.
+
+    Raises:
+      ValueError: If a terrain code in the map does not correspond to any terrain in the repository.
+    """
+    if self.__grid_storage == GridStorage.TERRAIN_CODES:
+      return self.create_terrain_code_grid_from_map(map)
+    return CellGrid(self.create_cells_from_map(map), map.get_rows(), map.get_columns())
+
   def set_environment(self) -> None:
     """
     Creates an environment instance from the selected map and terrain.
@@ -70,12 +133,24 @@ class EnvironmentService:
     map: Optional[Map] = self.__map_repository.get_map()
     if map is None:
       raise ValueError("No map selected.")
-    cells: list[list[Cell]] = self.create_cells_from_map(map)
+    grid: Grid = self.create_grid_from_map(map)
     rows: int = map.get_rows()
     columns: int = map.get_columns()
-    discovered_map: list[list[bool]] = [[False for _ in range(rows)] for _ in range(columns)]
-    self.__environment = Environment([], discovered_map, cells, rows, columns)
+    discovered_map: list[list[bool]] = [[False for _ in range(columns)] for _ in range(rows)]
+    self.__environment = Environment([], discovered_map, grid, rows, columns)
     self.__environment.add_agent(DefaultAgents.create_agent('human', columns, rows))
     self.__environment.add_agent(DefaultAgents.create_agent('monkey', columns, rows))
     self.__environment.add_agent(DefaultAgents.create_agent('sasquatch', columns, rows))
     self.__environment.add_agent(DefaultAgents.create_agent('octopus', columns, rows))
+    self.__initial_snapshot = self.__environment.create_snapshot()
+
+  def reset_environment(self) -> None:
+    """
+    Restores the environment to its state right after set_environment, reusing its grid and agents.
+
+    Raises:
+      ValueError: If no environment was set.
+    """
+    if self.__environment is None or self.__initial_snapshot is None:
+      raise ValueError("No environment set.")
+    self.__environment.restore_snapshot(self.__initial_snapshot)
@@ -0,0 +1,203 @@
+import json
+import struct
+from typing import BinaryIO, Optional
+from weakref import ref
+
+from src.agent.domain.agent import Agent, Direction
+
+
+class EpisodeRecorder:
+  """
+  Appends every action and sensor executed through the EnvironmentAgentService to a compact binary log.
+
+  The log starts with a header: MAGIC, the length of a JSON document as an unsigned 32-bit integer, and the document,
+  with the format version, the keyframe interval and the action and sensor identifiers. After the header every record
+  is RECORD_SIZE bytes, little-endian, and its first byte is its kind:
+
+  - ACTION and SENSOR: the identifier index (UNKNOWN_IDENTIFIER if the repository did not have it), the agent index,
+    the result (the value of the ActionResult or SensorResult, NO_RESULT if there was none), and the direction code,
+    x, y, accumulated movement cost and steps of the agent after the invocation.
+  - KEYFRAME: the tick, the number of invocations recorded before it, always a multiple of the keyframe interval. It
+    is followed by a STATE record for every agent seen so far that still exists.
+  - STATE: the agent index and its direction code, x, y, accumulated movement cost and steps, with the layout of the
+    invocations.
+
+  Invocations store the state of the agent after them instead of its changes, which would need reading the agent twice
+  per invocation; the changes are the difference with the previous record of the same agent. A keyframe is written
+  every keyframe interval invocations, so a replayer reconstructs any tick from the previous keyframe, or from the
+  start of the log before the first one. Records are packed into a preallocated buffer and written in blocks of
+  BUFFER_RECORDS records.
+
+  Agents are referenced weakly, so the agents of finished episodes are dropped from the keyframes once they are
+  discarded, and a recording over many episodes keeps its keyframes and memory bounded by the agents alive. Every agent
+  gets a new index, which is never reused.
+
+  Attributes:
+    ACTION (int): The kind of the records of actions.
+    BUFFER_RECORDS (int): The number of records buffered before writing them.
+    DIRECTIONS (list[Optional[Direction]]): The direction of every direction code.
+    INVOCATION (struct.Struct): The layout of the ACTION, SENSOR and STATE records.
+    KEYFRAME (int): The kind of the records that start a keyframe.
+    KEYFRAME_HEADER (struct.Struct): The layout of the KEYFRAME records.
+    MAGIC (bytes): The first bytes of every log.
+    MAX_AGENT_INDEX (int): The largest agent index of the format.
+    NO_RESULT (int): The result stored for the actions that did not return a result.
+    RECORD_SIZE (int): The number of bytes of every record.
+    SENSOR (int): The kind of the records of sensors.
+    STATE (int): The kind of the records with the state of an agent in a keyframe.
+    UNKNOWN_IDENTIFIER (int): The identifier index stored for the identifiers the repository did not have.
+    VERSION (int): The version of the format.
+    __agents (dict[int, tuple[ref, int]]): A weak reference to every agent seen so far that still exists and its index,
+      by identity of the agent.
+    __buffer (bytearray): The records not written yet.
+    __buffered (int): The number of records in the buffer.
+    __direction_codes (dict[Optional[Direction], int]): The code of every direction.
+    __identifier_indices (dict[int, dict[str, int]]): The index of every action and sensor identifier, by kind.
+    __keyframe_interval (int): The number of invocations between keyframes.
+    __next_agent_index (int): The index of the next agent seen.
+    __stream (BinaryIO): The stream the log is written to.
+    __tick (int): The number of invocations recorded so far.
+  """
+  ACTION: int = 1
+  SENSOR: int = 2
+  KEYFRAME: int = 3
+  STATE: int = 4
+  BUFFER_RECORDS: int = 4096
+  DIRECTIONS: list[Optional[Direction]] = [None, *Direction]
+  INVOCATION: struct.Struct = struct.Struct('<BBIBBhhii')
+  KEYFRAME_HEADER: struct.Struct = struct.Struct('<B3xQ8x')
+  MAGIC: bytes = b'EPLG'
+  MAX_AGENT_INDEX: int = 0xFFFFFFFF
+  NO_RESULT: int = 255
+  RECORD_SIZE: int = 20
+  UNKNOWN_IDENTIFIER: int = 255
+  VERSION: int = 2
+
+  def __init__(self, stream: BinaryIO, action_identifiers: list[str], sensor_identifiers: list[str], keyframe_interval: int = 4096):
+    """
+    Initializes an EpisodeRecorder instance, writing the header of the log.
+
+    Args:
+      stream (BinaryIO): The stream the log is written to, positioned at its start.
+      action_identifiers (list[str]): The identifiers of the actions that can be recorded.
+      sensor_identifiers (list[str]): The identifiers of the sensors that can be recorded.
+      keyframe_interval (int): The number of invocations between keyframes.
+
+    Raises:
+      ValueError: If the keyframe interval is not positive or there are too many identifiers for the format.
+    """
+    if keyframe_interval < 1:
+      raise ValueError('The keyframe interval must be positive')
+    if max(len(action_identifiers), len(sensor_identifiers)) >= EpisodeRecorder.UNKNOWN_IDENTIFIER:
+      raise ValueError(f'At most {EpisodeRecorder.UNKNOWN_IDENTIFIER - 1} actions and sensors can be recorded')
+    self.__agents: dict[int, tuple[ref, int]] = {}
+    self.__buffer: bytearray = bytearray(EpisodeRecorder.BUFFER_RECORDS * EpisodeRecorder.RECORD_SIZE)
+    self.__buffered: int = 0
+    self.__direction_codes: dict[Optional[Direction], int] = {direction: code for code, direction in enumerate(EpisodeRecorder.DIRECTIONS)}
+    self.__identifier_indices: dict[int, dict[str, int]] = {
+      EpisodeRecorder.ACTION: {identifier: index for index, identifier in enumerate(action_identifiers)},
+      EpisodeRecorder.SENSOR: {identifier: index for index, identifier in enumerate(sensor_identifiers)}
+    }
+    self.__keyframe_interval: int = keyframe_interval
+    self.__next_agent_index: int = 0
+    self.__stream: BinaryIO = stream
+    self.__tick: int = 0
+
+    header: bytes = json.dumps({
+      'version': EpisodeRecorder.VERSION,
+      'keyframe_interval': keyframe_interval,
+      'actions': action_identifiers,
+      'sensors': sensor_identifiers
+    }).encode('utf-8')
+    stream.write(EpisodeRecorder.MAGIC + struct.pack('<I', len(header)) + header)
+
+  def get_tick(self) -> int:
+    """
+    Returns the number of invocations recorded so far.
+
+    Returns:
+      int: The number of invocations.
+    """
+    return self.__tick
+
+  def record(self, kind: int, identifier: str, agent: Agent, result: Optional[int]) -> None:
+    """
+    Appends the record of an invocation, followed by a keyframe when the tick reaches a multiple of the keyframe
+    interval.
+
+    Args:
+      kind (int): ACTION or SENSOR.
+      identifier (str): The identifier of the action or sensor.
+      agent (Agent): The agent that executed the invocation, after executing it.
+      result (Optional[int]): The value of the ActionResult or SensorResult, None if there was none.
+
+    Raises:
+      ValueError: If the agent is new and every agent index of the format is taken.
+    """
+    entry: Optional[tuple[ref, int]] = self.__agents.get(id(agent))
+    if entry is None:
+      agent_index: int = self.__next_agent_index
+      if agent_index > EpisodeRecorder.MAX_AGENT_INDEX:
+        raise ValueError(f'At most {EpisodeRecorder.MAX_AGENT_INDEX + 1} agents can be recorded')
+      # The entry is removed when the agent is discarded, before its identity can be given to another object.
+      agents: dict[int, tuple[ref, int]] = self.__agents
+      agent_id: int = id(agent)
+      agents[agent_id] = (ref(agent, lambda _: agents.pop(agent_id, None)), agent_index)
+      self.__next_agent_index += 1
+    else:
+      agent_index = entry[1]
+    if self.__buffered == EpisodeRecorder.BUFFER_RECORDS:
+      self.flush()
+    EpisodeRecorder.INVOCATION.pack_into(
+      self.__buffer,
+      self.__buffered * EpisodeRecorder.RECORD_SIZE,
+      kind,
+      self.__identifier_indices[kind].get(identifier, EpisodeRecorder.UNKNOWN_IDENTIFIER),
+      agent_index,
+      EpisodeRecorder.NO_RESULT if result is None else result,
+      self.__direction_codes[agent.get_direction()],
+      agent.get_x(),
+      agent.get_y(),
+      agent.get_accumulated_movement_cost(),
+      agent.get_steps())
+    self.__buffered += 1
+    self.__tick += 1
+    if self.__tick % self.__keyframe_interval == 0:
+      self.write_keyframe()
+
+  def write_keyframe(self) -> None:
+    """
+    Appends a keyframe at the current tick, with the state of every agent seen so far that still exists.
+    """
+    if self.__buffered == EpisodeRecorder.BUFFER_RECORDS:
+      self.flush()
+    EpisodeRecorder.KEYFRAME_HEADER.pack_into(self.__buffer, self.__buffered * EpisodeRecorder.RECORD_SIZE, EpisodeRecorder.KEYFRAME, self.__tick)
+    self.__buffered += 1
+    for agent_reference, agent_index in list(self.__agents.values()):
+      agent: Optional[Agent] = agent_reference()
+      if agent is None:
+        continue
+      if self.__buffered == EpisodeRecorder.BUFFER_RECORDS:
+        self.flush()
+      EpisodeRecorder.INVOCATION.pack_into(
+        self.__buffer,
+        self.__buffered * EpisodeRecorder.RECORD_SIZE,
+        EpisodeRecorder.STATE,
+        0,
+        agent_index,
+        EpisodeRecorder.NO_RESULT,
+        self.__direction_codes[agent.get_direction()],
+        agent.get_x(),
+        agent.get_y(),
+        agent.get_accumulated_movement_cost(),
+        agent.get_steps())
+      self.__buffered += 1
+
+  def flush(self) -> None:
+    """
+    Writes the buffered records to the stream.
+    """
+    if self.__buffered > 0:
+      self.__stream.write(memoryview(self.__buffer)[:self.__buffered * EpisodeRecorder.RECORD_SIZE])
+      self.__buffered = 0
+    self.__stream.flush()
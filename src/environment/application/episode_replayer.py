@@ -0,0 +1,313 @@
+import json
+import struct
+from typing import BinaryIO, Optional
+
+from src.agent.domain.agent import Direction
+from src.environment.application.episode_recorder import EpisodeRecorder
+
+
+class ReplayedAgentState:
+  """
+  State of an agent at a tick of a recorded log.
+
+  Attributes:
+    __accumulated_movement_cost (int): The accumulated movement cost of the agent.
+    __direction (Optional[Direction]): The direction of the agent.
+    __steps (int): The steps of the agent.
+    __x (int): The x-coordinate of the agent.
+    __y (int): The y-coordinate of the agent.
+  """
+
+  def __init__(self, direction: Optional[Direction], x: int, y: int, accumulated_movement_cost: int, steps: int):
+    """
+    Initializes a ReplayedAgentState instance.
+
+    Args:
+      direction (Optional[Direction]): The direction of the agent.
+      x (int): The x-coordinate of the agent.
+      y (int): The y-coordinate of the agent.
+      accumulated_movement_cost (int): The accumulated movement cost of the agent.
+      steps (int): The steps of the agent.
+    """
+    self.__accumulated_movement_cost: int = accumulated_movement_cost
+    self.__direction: Optional[Direction] = direction
+    self.__steps: int = steps
+    self.__x: int = x
+    self.__y: int = y
+
+  def get_direction(self) -> Optional[Direction]:
+    """
+    Returns the direction of the agent.
+
+    Returns:
+      Optional[Direction]: The direction.
+    """
+    return self.__direction
+
+  def get_x(self) -> int:
+    """
+    Returns the x-coordinate of the agent.
+
+    Returns:
+      int: The x-coordinate.
+    """
+    return self.__x
+
+  def get_y(self) -> int:
+    """
+    Returns the y-coordinate of the agent.
+
+    Returns:
+      int: The y-coordinate.
+    """
+    return self.__y
+
+  def get_accumulated_movement_cost(self) -> int:
+    """
+    Returns the accumulated movement cost of the agent.
+
+    Returns:
+      int: The accumulated movement cost.
+    """
+    return self.__accumulated_movement_cost
+
+  def get_steps(self) -> int:
+    """
+    Returns the steps of the agent.
+
+    Returns:
+      int: The steps.
+    """
+    return self.__steps
+
+
+class ReplayedInvocation:
+  """
+  An action or sensor of a recorded log.
+
+  Attributes:
+    __agent_index (int): The index of the agent, in order of appearance in the log.
+    __identifier (Optional[str]): The identifier of the action or sensor, None if the repository did not have it.
+    __is_sensor (bool): Whether the invocation was a sensor instead of an action.
+    __result (Optional[int]): The value of the ActionResult or SensorResult, None if there was none.
+    __state (ReplayedAgentState): The state of the agent after the invocation.
+  """
+
+  def __init__(self, agent_index: int, identifier: Optional[str], is_sensor: bool, result: Optional[int], state: ReplayedAgentState):
+    """
+    Initializes a ReplayedInvocation instance.
+
+    Args:
+      agent_index (int): The index of the agent, in order of appearance in the log.
+      identifier (Optional[str]): The identifier of the action or sensor, None if the repository did not have it.
+      is_sensor (bool): Whether the invocation was a sensor instead of an action.
+      result (Optional[int]): The value of the ActionResult or SensorResult, None if there was none.
+      state (ReplayedAgentState): The state of the agent after the invocation.
+    """
+    self.__agent_index: int = agent_index
+    self.__identifier: Optional[str] = identifier
+    self.__is_sensor: bool = is_sensor
+    self.__result: Optional[int] = result
+    self.__state: ReplayedAgentState = state
+
+  def get_agent_index(self) -> int:
+    """
+    Returns the index of the agent.
+
+    Returns:
+      int: The index, in order of appearance in the log.
+    """
+    return self.__agent_index
+
+  def get_identifier(self) -> Optional[str]:
+    """
+    Returns the identifier of the action or sensor.
+
+    Returns:
+      Optional[str]: The identifier, None if the repository did not have it.
+    """
+    return self.__identifier
+
+  def is_sensor(self) -> bool:
+    """
+    Checks if the invocation was a sensor.
+
+    Returns:
+      bool: True for a sensor, False for an action.
+    """
+    return self.__is_sensor
+
+  def get_result(self) -> Optional[int]:
+    """
+    Returns the result of the invocation.
+
+    Returns:
+      Optional[int]: The value of the ActionResult or SensorResult, None if there was none.
+    """
+    return self.__result
+
+  def get_state(self) -> ReplayedAgentState:
+    """
+    Returns the state of the agent after the invocation. Its changes are the difference with the state of the agent
+    before the invocation, if the agent was seen before it.
+
+    Returns:
+      ReplayedAgentState: The state.
+    """
+    return self.__state
+
+
+class EpisodeReplayer:
+  """
+  Reads a log written by an EpisodeRecorder and reconstructs the state of the agents at any tick.
+
+  The tick of an invocation is the number of invocations recorded before it. The state at a tick is rebuilt from the
+  previous keyframe, so its cost is bounded by the keyframe interval and not by the length of the log.
+
+  Attributes:
+    __action_identifiers (list[str]): The identifiers of the actions, by index.
+    __keyframe_interval (int): The number of invocations between keyframes.
+    __keyframe_records (list[int]): The record index of every keyframe, the keyframe k being at tick k * interval.
+    __records (memoryview): The records of the log, after the header.
+    __sensor_identifiers (list[str]): The identifiers of the sensors, by index.
+    __ticks (int): The number of invocations of the log.
+  """
+
+  def __init__(self, stream: BinaryIO):
+    """
+    Initializes an EpisodeReplayer instance, reading the whole log and indexing its keyframes.
+
+    Args:
+      stream (BinaryIO): The stream the log is read from, positioned at its start.
+
+    Raises:
+      ValueError: If the stream does not hold a log of a supported version.
+    """
+    data: bytes = stream.read()
+    if data[:len(EpisodeRecorder.MAGIC)] != EpisodeRecorder.MAGIC:
+      raise ValueError('The stream does not hold an episode log')
+    header_start: int = len(EpisodeRecorder.MAGIC) + 4
+    header_length: int = struct.unpack_from('<I', data, len(EpisodeRecorder.MAGIC))[0]
+    header: dict = json.loads(data[header_start:header_start + header_length].decode('utf-8'))
+    if header.get('version') != EpisodeRecorder.VERSION:
+      raise ValueError(f'Unsupported episode log version {header.get("version")}')
+
+    records: memoryview = memoryview(data)[header_start + header_length:]
+    record_count: int = len(records) // EpisodeRecorder.RECORD_SIZE
+    self.__records: memoryview = records[:record_count * EpisodeRecorder.RECORD_SIZE]
+    self.__action_identifiers: list[str] = header['actions']
+    self.__sensor_identifiers: list[str] = header['sensors']
+    self.__keyframe_interval: int = header['keyframe_interval']
+
+    kinds: bytes = bytes(self.__records[::EpisodeRecorder.RECORD_SIZE])
+    self.__ticks: int = kinds.count(EpisodeRecorder.ACTION) + kinds.count(EpisodeRecorder.SENSOR)
+    self.__keyframe_records: list[int] = [0]
+    record: int = kinds.find(EpisodeRecorder.KEYFRAME)
+    while record != -1:
+      self.__keyframe_records.append(record)
+      record = kinds.find(EpisodeRecorder.KEYFRAME, record + 1)
+
+  def get_action_identifiers(self) -> list[str]:
+    """
+    Returns the identifiers of the actions of the log.
+
+    Returns:
+      list[str]: The identifiers, by index.
+    """
+    return self.__action_identifiers
+
+  def get_sensor_identifiers(self) -> list[str]:
+    """
+    Returns the identifiers of the sensors of the log.
+
+    Returns:
+      list[str]: The identifiers, by index.
+    """
+    return self.__sensor_identifiers
+
+  def get_ticks(self) -> int:
+    """
+    Returns the number of invocations of the log.
+
+    Returns:
+      int: The number of invocations.
+    """
+    return self.__ticks
+
+  def get_invocation(self, tick: int) -> ReplayedInvocation:
+    """
+    Returns an invocation of the log.
+
+    Args:
+      tick (int): The tick of the invocation.
+
+    Returns:
+      ReplayedInvocation: The invocation.
+
+    Raises:
+      ValueError: If the tick is not in the log.
+    """
+    if tick < 0 or tick >= self.__ticks:
+      raise ValueError(f'Tick {tick} is not in the log.')
+    record, _ = self.seek(tick, {})
+    kind, identifier_index, agent_index, result, direction_code, *state = EpisodeRecorder.INVOCATION.unpack_from(self.__records, record * EpisodeRecorder.RECORD_SIZE)
+    identifiers: list[str] = self.__sensor_identifiers if kind == EpisodeRecorder.SENSOR else self.__action_identifiers
+    return ReplayedInvocation(
+      agent_index,
+      identifiers[identifier_index] if identifier_index < len(identifiers) else None,
+      kind == EpisodeRecorder.SENSOR,
+      None if result == EpisodeRecorder.NO_RESULT else result,
+      ReplayedAgentState(EpisodeRecorder.DIRECTIONS[direction_code], *state))
+
+  def get_states(self, tick: int) -> dict[int, ReplayedAgentState]:
+    """
+    Reconstructs the state of the agents before an invocation, or at the end of the log.
+
+    Args:
+      tick (int): The number of invocations applied, from 0 to get_ticks.
+
+    Returns:
+      dict[int, ReplayedAgentState]: The state of every agent seen before the tick, by index. The agents discarded
+      before the previous keyframe are left out.
+
+    Raises:
+      ValueError: If the tick is not in the log.
+    """
+    if tick < 0 or tick > self.__ticks:
+      raise ValueError(f'Tick {tick} is not in the log.')
+    states: dict[int, list[int]] = {}
+    self.seek(tick, states)
+    return {agent_index: ReplayedAgentState(EpisodeRecorder.DIRECTIONS[state[0]], *state[1:]) for agent_index, state in sorted(states.items())}
+
+  def seek(self, tick: int, states: dict[int, list[int]]) -> tuple[int, dict[int, list[int]]]:
+    """
+    Reads the records from the keyframe before a tick until the invocation of the tick, keeping the last state of every
+    agent.
+
+    Args:
+      tick (int): The number of invocations to apply.
+      states (dict[int, list[int]]): Receives the direction code, x, y, accumulated movement cost and steps of every
+        agent, by index.
+
+    Returns:
+      tuple[int, dict[int, list[int]]]: The record index of the invocation of the tick, or the number of records at
+      the end of the log, and the states.
+    """
+    record_size: int = EpisodeRecorder.RECORD_SIZE
+    records: memoryview = self.__records
+    keyframe: int = min(tick // self.__keyframe_interval, len(self.__keyframe_records) - 1)
+    record: int = self.__keyframe_records[keyframe]
+    current_tick: int = keyframe * self.__keyframe_interval
+    record_count: int = len(records) // record_size
+    invocation: struct.Struct = EpisodeRecorder.INVOCATION
+    while record < record_count:
+      kind: int = records[record * record_size]
+      if kind != EpisodeRecorder.KEYFRAME:
+        if kind != EpisodeRecorder.STATE:
+          if current_tick == tick:
+            break
+          current_tick += 1
+        _, _, agent_index, _, *state = invocation.unpack_from(records, record * record_size)
+        states[agent_index] = state
+      record += 1
+    return record, states
@@ -0,0 +1,291 @@
+from array import array
+from heapq import heappop, heappush, heapreplace
+from typing import Optional
+
+from src.agent.domain.agent import Agent
+from src.environment.application.path_planning_service import PlannedPath
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
+from src.position.domain.position import Position
+
+
+class IncrementalPathPlanner:
+  """
+  D* Lite planner of the least-cost path of an agent to its finish position over the cells the agent knows.
+
+  Known cells cost their movement cost for the type of agent and unknown cells are assumed to cost the cheapest
+  movement cost of the environment, so the path goes through unexplored areas optimistically. The search runs
+  backwards from the finish, so when the agent moves and its sensors reveal cells, only the cost-to-finish values that
+  depend on the revealed cells are repaired, instead of searching again from scratch. The revealed cells are read from
+  the log of the known map of the agent; if the log no longer covers them, the planner starts over.
+
+  Nodes are identified by the integer index y * columns + x of the movement cost matrices. The movement costs of the
+  environment are assumed not to change during the episode.
+
+  Attributes:
+    __agent (Agent): The agent whose path is planned.
+    __columns (int): The number of columns of the environment.
+    __costs (list[float]): The cost of moving into every node as the agent knows it, infinite for the impassable ones.
+    __distances (list[float]): The cost-to-finish of every node, the g-values of D* Lite.
+    __finish (int): The index of the finish node.
+    __known_count (Optional[int]): The position of the log of known cells already consumed, None before the first plan.
+    __last_start (int): The index of the start node when the key modifier was last updated.
+    __lookaheads (list[float]): The one-step lookahead cost-to-finish of every node, the rhs-values of D* Lite.
+    __minimum_cost (int): The cheapest movement cost of the environment, assumed for the unknown cells.
+    __movement_costs (array): The movement costs of the agent, with Grid.IMPASSABLE for the positions that cannot be traversed.
+    __key_modifier (int): The accumulated heuristic distance the start moved, the km of D* Lite.
+    __open_set (list[tuple[float, float, int]]): The inconsistent nodes by key, with outdated entries skipped lazily.
+    __rows (int): The number of rows of the environment.
+  """
+
+  def __init__(self, agent: Agent, environment: Environment):
+    """
+    Initializes an IncrementalPathPlanner instance, the search starts with the first plan.
+
+    Args:
+      agent (Agent): The agent whose path is planned, with its finish position set.
+      environment (Environment): The environment in which the agent operates.
+
+    Raises:
+      ValueError: If the finish position of the agent is out of the bounds of the environment.
+    """
+    finish_x, finish_y = agent.get_finish_position()
+    if finish_x is None or finish_y is None or not environment.contains(finish_x, finish_y):
+      raise ValueError(f'Finish position {Position(finish_x, finish_y)} is out of bounds.')
+    self.__agent: Agent = agent
+    self.__columns: int = environment.get_columns()
+    self.__rows: int = environment.get_rows()
+    self.__finish: int = finish_y * self.__columns + finish_x
+    self.__movement_costs: array = environment.get_movement_costs_for(agent.get_name())
+    self.__minimum_cost: int = min((movement_cost for movement_cost in set(self.__movement_costs) if movement_cost != Grid.IMPASSABLE), default=0)
+    self.__costs: list[float] = []
+    self.__distances: list[float] = []
+    self.__lookaheads: list[float] = []
+    self.__known_count: Optional[int] = None
+    self.__key_modifier: int = 0
+    self.__last_start: int = self.__finish
+    self.__open_set: list[tuple[float, float, int]] = []
+
+  def plan(self) -> Optional[PlannedPath]:
+    """
+    Updates the search and returns the whole path from the position of the agent to its finish position.
+
+    Returns:
+      Optional[PlannedPath]: The path, with its cost and the nodes expanded by this update, or None if the finish
+      cannot be reached through the known and unknown cells.
+    """
+    expanded_nodes: int = self.update()
+    start: int = self.__last_start
+    if self.__lookaheads[start] == float('inf'):
+      return None
+    return PlannedPath(int(self.__lookaheads[start]), expanded_nodes, self.extract_path(start))
+
+  def plan_next_position(self) -> Optional[Position]:
+    """
+    Updates the search and returns only the first position of the path, without walking the rest of it.
+
+    Returns:
+      Optional[Position]: The next position of the path, the position of the agent if it is at the finish, or None if
+      the finish cannot be reached through the known and unknown cells.
+    """
+    self.update()
+    start: int = self.__last_start
+    if self.__lookaheads[start] == float('inf'):
+      return None
+    node: int = start if start == self.__finish else self.get_next_node(start)
+    return Position(node % self.__columns, node // self.__columns)
+
+  def update(self) -> int:
+    """
+    Updates the search with the cells revealed since the previous update and the new position of the agent.
+
+    Returns:
+      int: The number of nodes expanded to repair the search.
+    """
+    start: int = self.__agent.get_y() * self.__columns + self.__agent.get_x()
+    revealed: Optional[list[int]] = None
+    if self.__known_count is not None:
+      revealed = self.__agent.get_known_since(self.__known_count)
+    if revealed is None:
+      self.reset(start)
+    else:
+      self.__key_modifier += self.get_heuristic(self.__last_start, start)
+      self.__last_start = start
+      self.update_costs(revealed)
+    self.__known_count = self.__agent.get_known_count()
+    return self.compute_shortest_path(start)
+
+  def reset(self, start: int) -> None:
+    """
+    Discards the search and reads the known cells of the agent from scratch, from the log if it is complete.
+
+    Args:
+      start (int): The index of the start node.
+    """
+    columns: int = self.__columns
+    infinity: float = float('inf')
+    self.__costs = [self.__minimum_cost] * (self.__rows * columns)
+    known: Optional[list[int]] = self.__agent.get_known_since(0)
+    if known is None:
+      known = [index for index in range(self.__rows * columns) if self.__agent.is_known(index % columns, index // columns)]
+    movement_costs: array = self.__movement_costs
+    for index in known:
+      self.__costs[index] = infinity if movement_costs[index] == Grid.IMPASSABLE else movement_costs[index]
+    self.__distances = [infinity] * (self.__rows * columns)
+    self.__lookaheads = [infinity] * (self.__rows * columns)
+    self.__lookaheads[self.__finish] = 0
+    self.__key_modifier = 0
+    self.__last_start = start
+    self.__open_set = [(self.get_heuristic(start, self.__finish), 0, self.__finish)]
+
+  def update_costs(self, revealed: list[int]) -> None:
+    """
+    Applies the actual movement cost of the revealed cells, updating the nodes that move into them.
+
+    Args:
+      revealed (list[int]): The indexes of the cells that became known.
+    """
+    costs: list[float] = self.__costs
+    movement_costs: array = self.__movement_costs
+    for index in revealed:
+      cost: float = float('inf') if movement_costs[index] == Grid.IMPASSABLE else movement_costs[index]
+      if cost == costs[index]:
+        continue
+      costs[index] = cost
+      for neighbour in self.get_neighbours(index):
+        self.update_node(neighbour)
+
+  def compute_shortest_path(self, start: int) -> int:
+    """
+    Expands the inconsistent nodes until the cost-to-finish of the start is correct.
+
+    Args:
+      start (int): The index of the start node.
+
+    Returns:
+      int: The number of expanded nodes.
+    """
+    distances: list[float] = self.__distances
+    lookaheads: list[float] = self.__lookaheads
+    open_set: list[tuple[float, float, int]] = self.__open_set
+    infinity: float = float('inf')
+    expanded_nodes: int = 0
+    while open_set:
+      key_cost, key_distance, node = open_set[0]
+      if distances[node] == lookaheads[node]:
+        heappop(open_set)
+        continue
+      start_key: tuple[float, float] = self.get_key(start)
+      if (key_cost, key_distance) >= start_key and lookaheads[start] <= distances[start]:
+        break
+      key: tuple[float, float] = self.get_key(node)
+      if (key_cost, key_distance) < key:
+        heapreplace(open_set, (*key, node))
+        continue
+      heappop(open_set)
+      expanded_nodes += 1
+      if distances[node] > lookaheads[node]:
+        distances[node] = lookaheads[node]
+      else:
+        distances[node] = infinity
+        self.update_node(node)
+      for neighbour in self.get_neighbours(node):
+        self.update_node(neighbour)
+    return expanded_nodes
+
+  def update_node(self, node: int) -> None:
+    """
+    Recomputes the one-step lookahead cost-to-finish of a node, queueing it if it became inconsistent.
+
+    Args:
+      node (int): The index of the node.
+    """
+    if node != self.__finish:
+      costs: list[float] = self.__costs
+      distances: list[float] = self.__distances
+      self.__lookaheads[node] = min((costs[neighbour] + distances[neighbour] for neighbour in self.get_neighbours(node)), default=float('inf'))
+    if self.__distances[node] != self.__lookaheads[node]:
+      heappush(self.__open_set, (*self.get_key(node), node))
+
+  def extract_path(self, start: int) -> list[Position]:
+    """
+    Follows the cheapest neighbours from the start to the finish.
+
+    Args:
+      start (int): The index of the start node, with a finite cost-to-finish.
+
+    Returns:
+      list[Position]: The positions of the path, from the start to the finish, both included.
+    """
+    columns: int = self.__columns
+    nodes: list[int] = [start]
+    node: int = start
+    while node != self.__finish and len(nodes) <= len(self.__distances):
+      node = self.get_next_node(node)
+      nodes.append(node)
+    return [Position(node % columns, node // columns) for node in nodes]
+
+  def get_next_node(self, node: int) -> int:
+    """
+    Returns the neighbour of a node with the least cost of moving into it plus its cost-to-finish.
+
+    Args:
+      node (int): The index of the node.
+
+    Returns:
+      int: The index of the neighbour.
+    """
+    costs: list[float] = self.__costs
+    distances: list[float] = self.__distances
+    return min(self.get_neighbours(node), key=lambda neighbour: costs[neighbour] + distances[neighbour])
+
+  def get_key(self, node: int) -> tuple[float, float]:
+    """
+    Returns the priority of a node in the open set.
+
+    Args:
+      node (int): The index of the node.
+
+    Returns:
+      tuple[float, float]: The estimated cost of a path through the node and its cost-to-finish.
+    """
+    distance: float = min(self.__distances[node], self.__lookaheads[node])
+    return distance + self.get_heuristic(self.__last_start, node) + self.__key_modifier, distance
+
+  def get_heuristic(self, source: int, target: int) -> int:
+    """
+    Returns a lower bound of the cost between two nodes, the cheapest movement cost times their Manhattan distance.
+
+    Args:
+      source (int): The index of the first node.
+      target (int): The index of the second node.
+
+    Returns:
+      int: The lower bound.
+    """
+    source_y, source_x = divmod(source, self.__columns)
+    target_y, target_x = divmod(target, self.__columns)
+    return self.__minimum_cost * (abs(source_x - target_x) + abs(source_y - target_y))
+
+  def get_neighbours(self, node: int) -> list[int]:
+    """
+    Returns the nodes a node can move to, inside the bounds of the environment.
+
+    Args:
+      node (int): The index of the node.
+
+    Returns:
+      list[int]: The indexes of the neighbours.
+    """
+    columns: int = self.__columns
+    y, x = divmod(node, columns)
+    neighbours: list[int] = []
+    if x > 0:
+      neighbours.append(node - 1)
+    if x < columns - 1:
+      neighbours.append(node + 1)
+    if y > 0:
+      neighbours.append(node - columns)
+    if y < self.__rows - 1:
+      neighbours.append(node + columns)
+    return neighbours
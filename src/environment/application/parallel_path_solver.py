@@ -0,0 +1,179 @@
+import math
+import os
+from array import array
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from src.environment.application.path_planning_service import PathPlanningAlgorithm, PathPlanningService, PlannedPath
+from src.environment.domain.environment import Environment
+from src.position.domain.position import Position
+
+if TYPE_CHECKING:
+  from multiprocessing.shared_memory import SharedMemory
+
+
+class ParallelPathSolver:
+  """
+  Plans the least-cost routes of many start and finish pairs for several types of agent over a pool of processes.
+
+  The movement cost matrices of every type of agent are copied once into a block of shared memory, which the worker
+  processes map on start instead of receiving a pickled environment. Only the indexes of the routes are sent to the
+  workers and only the costs and nodes of the paths come back, so the work of every process is the search itself.
+
+  Attributes:
+    __worker_columns (int): The number of columns of the matrices, in a worker process.
+    __worker_minimum_costs (list[int]): The minimum cost of every matrix, in a worker process.
+    __worker_movement_costs (list[memoryview]): The movement cost matrix of every type of agent, in a worker process.
+    __worker_rows (int): The number of rows of the matrices, in a worker process.
+    __worker_shared_memory (Optional[SharedMemory]): The block of shared memory mapped by a worker process.
+  """
+  __worker_columns: int = 0
+  __worker_minimum_costs: list[int] = []
+  __worker_movement_costs: list[memoryview] = []
+  __worker_rows: int = 0
+  __worker_shared_memory: Optional['SharedMemory'] = None
+
+  def solve(
+      self,
+      environment: Environment,
+      agent_names: list[str],
+      routes: list[tuple[Position, Position]],
+      algorithm: PathPlanningAlgorithm = PathPlanningAlgorithm.A_STAR,
+      workers: Optional[int] = None,
+      chunk_size: Optional[int] = None) -> dict[str, list[Optional[PlannedPath]]]:
+    """
+    Plans every route for every type of agent.
+
+    Args:
+      environment (Environment): The environment in which the routes are planned.
+      agent_names (list[str]): The names of the agents whose movement costs are used.
+      routes (list[tuple[Position, Position]]): The start and finish positions of the routes.
+      algorithm (PathPlanningAlgorithm): A_STAR or DIJKSTRA.
+      workers (Optional[int]): The number of processes, 1 plans the routes in the current process. Defaults to the
+        number of CPUs.
+      chunk_size (Optional[int]): The number of routes sent to a process at once. Defaults to a quarter of the routes of
+        every process.
+
+    Returns:
+      dict[str, list[Optional[PlannedPath]]]: The path of every route, in the order of the routes, or None for the
+      routes whose finish cannot be reached, by name of agent.
+
+    Raises:
+      ValueError: If the algorithm is not supported or a position is out of the bounds of the environment.
+    """
+    if algorithm not in (PathPlanningAlgorithm.A_STAR, PathPlanningAlgorithm.DIJKSTRA):
+      raise ValueError(f'Algorithm {algorithm.value} is not supported by the parallel solver.')
+    rows: int = environment.get_rows()
+    columns: int = environment.get_columns()
+    nodes: list[tuple[int, int]] = []
+    for start, finish in routes:
+      for position in (start, finish):
+        if not environment.contains(position.get_x(), position.get_y()):
+          raise ValueError(f'Position {position} is out of bounds.')
+      nodes.append((start.get_y() * columns + start.get_x(), finish.get_y() * columns + finish.get_x()))
+
+    movement_costs: list[array] = [environment.get_movement_costs_for(agent_name) for agent_name in agent_names]
+    minimum_costs: list[int] = [0] * len(agent_names)
+    if algorithm == PathPlanningAlgorithm.A_STAR:
+      minimum_costs = [PathPlanningService.get_minimum_cost(agent_movement_costs) for agent_movement_costs in movement_costs]
+    tasks: list[tuple[int, int, int]] = [(agent_index, start, finish) for agent_index in range(len(agent_names)) for start, finish in nodes]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+      results: list[Optional[tuple[int, int, list[int]]]] = [
+        PathPlanningService.search(movement_costs[agent_index], rows, columns, start, finish, minimum_costs[agent_index])
+        for agent_index, start, finish in tasks
+      ]
+    else:
+      results = self.solve_in_pool(movement_costs, minimum_costs, rows, columns, tasks, workers, chunk_size)
+
+    paths: dict[str, list[Optional[PlannedPath]]] = {agent_name: [] for agent_name in agent_names}
+    for (agent_index, _, _), result in zip(tasks, results):
+      path: Optional[PlannedPath] = None
+      if result is not None:
+        cost, expanded_nodes, path_nodes = result
+        path = PlannedPath(cost, expanded_nodes, [Position(node % columns, node // columns) for node in path_nodes])
+      paths[agent_names[agent_index]].append(path)
+    return paths
+
+  def solve_in_pool(
+      self,
+      movement_costs: list[array],
+      minimum_costs: list[int],
+      rows: int,
+      columns: int,
+      tasks: list[tuple[int, int, int]],
+      workers: int,
+      chunk_size: Optional[int]) -> list[Optional[tuple[int, int, list[int]]]]:
+    """
+    Copies the movement cost matrices to shared memory and runs the searches over a pool of processes.
+
+    Args:
+      movement_costs (list[array]): The movement cost matrix of every type of agent, with typecode 'i'.
+      minimum_costs (list[int]): The minimum cost of every matrix, 0 for Dijkstra.
+      rows (int): The number of rows of the matrices.
+      columns (int): The number of columns of the matrices.
+      tasks (list[tuple[int, int, int]]): The index of the type of agent and the start and finish nodes of every search.
+      workers (int): The number of processes.
+      chunk_size (Optional[int]): The number of searches sent to a process at once.
+
+    Returns:
+      list[Optional[tuple[int, int, list[int]]]]: The result of every search, in the order of the tasks.
+    """
+    # Imported here so plans in the current process do not pay for loading the multiprocessing machinery.
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    matrix_size: int = rows * columns * array('i').itemsize
+    shared_memory: SharedMemory = SharedMemory(create=True, size=max(1, matrix_size * len(movement_costs)))
+    try:
+      for agent_index, agent_movement_costs in enumerate(movement_costs):
+        shared_memory.buf[agent_index * matrix_size:(agent_index + 1) * matrix_size] = memoryview(agent_movement_costs).cast('B')
+      chunk_size = chunk_size or max(1, math.ceil(len(tasks) / (workers * 4)))
+      chunks: list[list[tuple[int, int, int]]] = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+      with ProcessPoolExecutor(max_workers=workers, initializer=ParallelPathSolver.initialize_worker, initargs=(shared_memory.name, minimum_costs, rows, columns)) as executor:
+        return [result for results in executor.map(ParallelPathSolver.run_worker_chunk, chunks) for result in results]
+    finally:
+      shared_memory.close()
+      shared_memory.unlink()
+
+  @staticmethod
+  def initialize_worker(shared_memory_name: str, minimum_costs: list[int], rows: int, columns: int) -> None:
+    """
+    Maps the movement cost matrices of the shared memory block in a worker process.
+
+    Args:
+      shared_memory_name (str): The name of the shared memory block.
+      minimum_costs (list[int]): The minimum cost of every matrix, 0 for Dijkstra.
+      rows (int): The number of rows of the matrices.
+      columns (int): The number of columns of the matrices.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    # The workers share the resource tracker of the parent process, which unlinks the block once the pool is done.
+    shared_memory: SharedMemory = SharedMemory(shared_memory_name)
+    matrix_size: int = rows * columns * array('i').itemsize
+    ParallelPathSolver.__worker_shared_memory = shared_memory
+    ParallelPathSolver.__worker_movement_costs = [
+      shared_memory.buf[agent_index * matrix_size:(agent_index + 1) * matrix_size].cast('i')
+      for agent_index in range(len(minimum_costs))
+    ]
+    ParallelPathSolver.__worker_minimum_costs = minimum_costs
+    ParallelPathSolver.__worker_rows = rows
+    ParallelPathSolver.__worker_columns = columns
+
+  @staticmethod
+  def run_worker_chunk(tasks: Sequence[tuple[int, int, int]]) -> list[Optional[tuple[int, int, list[int]]]]:
+    """
+    Runs a chunk of searches over the matrices mapped by the worker process.
+
+    Args:
+      tasks (Sequence[tuple[int, int, int]]): The index of the type of agent and the start and finish nodes of every search.
+
+    Returns:
+      list[Optional[tuple[int, int, list[int]]]]: The result of every search, in the order of the tasks.
+    """
+    movement_costs: list[memoryview] = ParallelPathSolver.__worker_movement_costs
+    minimum_costs: list[int] = ParallelPathSolver.__worker_minimum_costs
+    rows: int = ParallelPathSolver.__worker_rows
+    columns: int = ParallelPathSolver.__worker_columns
+    return [PathPlanningService.search(movement_costs[agent_index], rows, columns, start, finish, minimum_costs[agent_index]) for agent_index, start, finish in tasks]
@@ -0,0 +1,343 @@
+from array import array
+from enum import Enum
+from heapq import heappop, heappush
+from typing import Optional
+from weakref import WeakKeyDictionary, WeakSet
+
+from src.agent.domain.agent import Agent
+from src.environment.application.cluster_abstraction import ClusterAbstraction
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid, GridRevision
+from src.position.domain.position import Position
+
+
+class PathPlanningAlgorithm(Enum):
+  """
+  Enum representing the algorithms available to plan a path.
+
+  Attributes:
+    A_STAR (str): A* search guided by the minimum terrain cost times the Manhattan distance.
+    DIJKSTRA (str): Uniform cost search, without heuristic.
+    HIERARCHICAL (str): HPA*, A* over the transitions between clusters of the map, refined cluster by cluster. The
+      paths are close to the least-cost ones, but not always optimal.
+  """
+  A_STAR = 'a_star'
+  DIJKSTRA = 'dijkstra'
+  HIERARCHICAL = 'hierarchical'
+
+
+class PlannedPath:
+  """
+  Represents a least-cost path between two positions of an environment.
+
+  Attributes:
+    __cost (int): The accumulated movement cost of following the path.
+    __expanded_nodes (int): The number of nodes expanded by the search.
+    __positions (list[Position]): The positions of the path, from the start to the finish, both included.
+  """
+
+  def __init__(self, cost: int, expanded_nodes: int, positions: list[Position]):
+    """
+    Initializes a PlannedPath instance.
+
+    Args:
+      cost (int): The accumulated movement cost of following the path.
+      expanded_nodes (int): The number of nodes expanded by the search.
+      positions (list[Position]): The positions of the path, from the start to the finish, both included.
+    """
+    self.__cost: int = cost
+    self.__expanded_nodes: int = expanded_nodes
+    self.__positions: list[Position] = positions
+
+  def get_cost(self) -> int:
+    """
+    Returns the accumulated movement cost of following the path.
+
+    Returns:
+      int: The movement cost.
+    """
+    return self.__cost
+
+  def get_expanded_nodes(self) -> int:
+    """
+    Returns the number of nodes expanded by the search.
+
+    Returns:
+      int: The number of expanded nodes.
+    """
+    return self.__expanded_nodes
+
+  def get_positions(self) -> list[Position]:
+    """
+    Returns the positions of the path.
+
+    Returns:
+      list[Position]: The positions, from the start to the finish, both included.
+    """
+    return self.__positions
+
+  def get_steps(self) -> int:
+    """
+    Returns the number of moves needed to follow the path.
+
+    Returns:
+      int: The number of moves.
+    """
+    return len(self.__positions) - 1
+
+
+class PathPlanningService:
+  """
+  Service class for computing least-cost paths over the movement costs of an environment.
+
+  Moving into a cell costs the movement cost of that cell for the type of agent, as in MoveAction. Nodes are identified by
+  the integer index y * columns + x of the movement cost matrices.
+
+  The abstract graphs of the hierarchical algorithm are cached by revision of the grid, which is shared by the views of
+  a grid built once per map and terrain file, and by type of agent. They are updated when update_state changes a cell
+  of an environment planned on, and a view that copies its cells on the change gets graphs of its own.
+
+  Attributes:
+    __abstractions (WeakKeyDictionary[GridRevision, dict[str, ClusterAbstraction]]): The abstract graph of every
+      revision of a grid and type of agent.
+    __cluster_size (int): The number of positions of the side of the clusters of the hierarchical algorithm.
+    __observed_environments (WeakSet[Environment]): The environments whose changes update the abstract graphs.
+  """
+
+  def __init__(self, cluster_size: int = 32):
+    """
+    Initializes a PathPlanningService instance without cached abstract graphs.
+
+    Args:
+      cluster_size (int): The number of positions of the side of the clusters of the hierarchical algorithm.
+    """
+    self.__abstractions: WeakKeyDictionary[GridRevision, dict[str, ClusterAbstraction]] = WeakKeyDictionary()
+    self.__cluster_size: int = cluster_size
+    self.__observed_environments: WeakSet[Environment] = WeakSet()
+
+  def plan(self, environment: Environment, agent_name: str, start: Position, finish: Position, algorithm: PathPlanningAlgorithm = PathPlanningAlgorithm.A_STAR) -> Optional[PlannedPath]:
+    """
+    Computes the least-cost path between two positions for a type of agent.
+
+    Args:
+      environment (Environment): The environment in which the path is planned.
+      agent_name (str): The name of the agent whose movement costs are used.
+      start (Position): The start position.
+      finish (Position): The finish position.
+      algorithm (PathPlanningAlgorithm): The search algorithm to use.
+
+    Returns:
+      Optional[PlannedPath]: The path, or None if the finish cannot be reached.
+
+    Raises:
+      ValueError: If the start or the finish are out of the bounds of the environment.
+    """
+    if not environment.contains(start.get_x(), start.get_y()):
+      raise ValueError(f'Start position {start} is out of bounds.')
+    if not environment.contains(finish.get_x(), finish.get_y()):
+      raise ValueError(f'Finish position {finish} is out of bounds.')
+
+    columns: int = environment.get_columns()
+    movement_costs: array = environment.get_movement_costs_for(agent_name)
+    start_node: int = start.get_y() * columns + start.get_x()
+    finish_node: int = finish.get_y() * columns + finish.get_x()
+    result: Optional[tuple[int, int, list[int]]]
+    if algorithm == PathPlanningAlgorithm.HIERARCHICAL:
+      result = PathPlanningService.search_hierarchical(self.get_abstraction(environment, agent_name), movement_costs, columns, start_node, finish_node)
+    else:
+      minimum_cost: int = 0
+      if algorithm == PathPlanningAlgorithm.A_STAR:
+        minimum_cost = PathPlanningService.get_minimum_cost(movement_costs)
+      result = PathPlanningService.search(movement_costs, environment.get_rows(), columns, start_node, finish_node, minimum_cost)
+    if result is None:
+      return None
+    cost, expanded_nodes, nodes = result
+    return PlannedPath(cost, expanded_nodes, [Position(node % columns, node // columns) for node in nodes])
+
+  def plan_for_agent(self, agent: Agent, environment: Environment, algorithm: PathPlanningAlgorithm = PathPlanningAlgorithm.A_STAR) -> Optional[PlannedPath]:
+    """
+    Computes the least-cost path from the position of an agent to its finish position.
+
+    Args:
+      agent (Agent): The agent to plan the path for.
+      environment (Environment): The environment in which the agent operates.
+      algorithm (PathPlanningAlgorithm): The search algorithm to use.
+
+    Returns:
+      Optional[PlannedPath]: The path, or None if the finish cannot be reached.
+
+    Raises:
+      ValueError: If the agent has no finish position, or a position is out of bounds.
+    """
+    finish_x, finish_y = agent.get_finish_position()
+    if finish_x is None or finish_y is None:
+      raise ValueError('The agent has no finish position.')
+    return self.plan(environment, agent.get_name(), Position(agent.get_x(), agent.get_y()), Position(finish_x, finish_y), algorithm)
+
+  def get_abstraction(self, environment: Environment, agent_name: str) -> ClusterAbstraction:
+    """
+    Returns the abstract graph of the grid of an environment for a type of agent, creating it the first time.
+
+    Args:
+      environment (Environment): The environment in which the paths are planned.
+      agent_name (str): The name of the agent whose movement costs are used.
+
+    Returns:
+      ClusterAbstraction: The abstract graph.
+    """
+    if environment not in self.__observed_environments:
+      environment.add_state_listener(self.invalidate_cell)
+      self.__observed_environments.add(environment)
+    abstractions: dict[str, ClusterAbstraction] = self.__abstractions.setdefault(environment.get_grid().get_revision(), {})
+    abstraction: Optional[ClusterAbstraction] = abstractions.get(agent_name)
+    if abstraction is None:
+      abstraction = ClusterAbstraction(environment.get_rows(), environment.get_columns(), self.__cluster_size)
+      abstractions[agent_name] = abstraction
+    return abstraction
+
+  def invalidate_cell(self, environment: Environment, x: int, y: int) -> None:
+    """
+    Updates the abstract graphs of the grid of an environment after a cell changed. A view that copied its cells on the
+    change has a new revision without graphs, so the graphs of the grid it was created from stay untouched.
+
+    Args:
+      environment (Environment): The environment whose cell changed.
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+    """
+    for abstraction in self.__abstractions.get(environment.get_grid().get_revision(), {}).values():
+      abstraction.invalidate(x, y)
+
+  @staticmethod
+  def search_hierarchical(abstraction: ClusterAbstraction, movement_costs: array, columns: int, start: int, finish: int) -> Optional[tuple[int, int, list[int]]]:
+    """
+    Runs A* over an abstract graph and refines the abstract path with A* inside every cluster it crosses.
+
+    Args:
+      abstraction (ClusterAbstraction): The abstract graph of the movement cost matrix.
+      movement_costs (array): The movement costs, indexed by y * columns + x, with Grid.IMPASSABLE for the positions that cannot be traversed.
+      columns (int): The number of columns of the matrix.
+      start (int): The index of the start node.
+      finish (int): The index of the finish node.
+
+    Returns:
+      Optional[tuple[int, int, list[int]]]: The cost, the number of expanded nodes, abstract and refined, and the indexes of the path, or None if the finish cannot be reached.
+    """
+    result: Optional[tuple[int, int, list[int]]] = abstraction.search(movement_costs, start, finish)
+    if result is None:
+      return None
+    cost, expanded_nodes, abstract_nodes = result
+    minimum_cost: int = abstraction.get_minimum_cost(movement_costs)
+    nodes: list[int] = abstract_nodes[:1]
+    for node, next_node in zip(abstract_nodes, abstract_nodes[1:]):
+      cluster: int = abstraction.get_cluster(node)
+      if cluster != abstraction.get_cluster(next_node):
+        nodes.append(next_node)
+        continue
+      min_x, min_y, end_x, end_y = abstraction.get_cluster_bounds(cluster)
+      width: int = end_x - min_x
+      window: array = array(movement_costs.typecode)
+      for y in range(min_y, end_y):
+        window.extend(movement_costs[y * columns + min_x:y * columns + end_x])
+      node_y, node_x = divmod(node, columns)
+      next_y, next_x = divmod(next_node, columns)
+      window_result: Optional[tuple[int, int, list[int]]] = PathPlanningService.search(window, end_y - min_y, width, (node_y - min_y) * width + node_x - min_x, (next_y - min_y) * width + next_x - min_x, minimum_cost)
+      if window_result is None:
+        # The abstract graph no longer matches the matrix, so the path is searched over the whole matrix instead.
+        return PathPlanningService.search(movement_costs, len(movement_costs) // columns, columns, start, finish, minimum_cost)
+      _, window_expanded_nodes, window_nodes = window_result
+      expanded_nodes += window_expanded_nodes
+      nodes.extend((min_y + window_node // width) * columns + min_x + window_node % width for window_node in window_nodes[1:])
+    return cost, expanded_nodes, nodes
+
+  @staticmethod
+  def get_minimum_cost(movement_costs: array) -> int:
+    """
+    Returns the smallest movement cost of a matrix, which makes the Manhattan heuristic admissible.
+
+    Args:
+      movement_costs (array): The movement costs, with Grid.IMPASSABLE for the positions that cannot be traversed.
+
+    Returns:
+      int: The smallest movement cost, or 0 if every position is impassable.
+    """
+    return min((movement_cost for movement_cost in set(movement_costs) if movement_cost != Grid.IMPASSABLE), default=0)
+
+  @staticmethod
+  def search(movement_costs: array, rows: int, columns: int, start: int, finish: int, minimum_cost: int) -> Optional[tuple[int, int, list[int]]]:
+    """
+    Runs A* over a movement cost matrix with a binary heap as open set, using Dijkstra when the minimum cost is 0.
+
+    Args:
+      movement_costs (array): The movement costs, indexed by y * columns + x, with Grid.IMPASSABLE for the positions that cannot be traversed.
+      rows (int): The number of rows of the matrix.
+      columns (int): The number of columns of the matrix.
+      start (int): The index of the start node.
+      finish (int): The index of the finish node.
+      minimum_cost (int): The smallest movement cost, used to scale the Manhattan heuristic.
+
+    Returns:
+      Optional[tuple[int, int, list[int]]]: The cost, the number of expanded nodes and the indexes of the path, or None if the finish cannot be reached.
+    """
+    impassable: int = Grid.IMPASSABLE
+    if movement_costs[finish] == impassable:
+      return None
+
+    # The matrix is surrounded by a frame of impassable nodes, so neighbours never need bound checks.
+    width: int = columns + 2
+    frame: list[int] = [impassable] * width
+    costs: list[int] = frame[:]
+    for row in range(rows):
+      costs.append(impassable)
+      costs.extend(movement_costs[row * columns:(row + 1) * columns])
+      costs.append(impassable)
+    costs.extend(frame)
+
+    finish_y, finish_x = divmod(finish, columns)
+    if minimum_cost > 0:
+      horizontal: list[int] = [impassable] + [minimum_cost * abs(x - finish_x) for x in range(columns)] + [impassable]
+      heuristics: list[int] = frame[:]
+      for y in range(rows):
+        vertical: int = minimum_cost * abs(y - finish_y)
+        heuristics.extend([cost + vertical for cost in horizontal])
+      heuristics.extend(frame)
+    else:
+      heuristics = [0] * len(costs)
+
+    start_y, start_x = divmod(start, columns)
+    source: int = (start_y + 1) * width + start_x + 1
+    target: int = (finish_y + 1) * width + finish_x + 1
+    # Entries of the open set are encoded as priority * size + node, plain integers are cheaper to compare than tuples.
+    size: int = len(costs)
+    distances: list[int] = [1 << 62] * size
+    parents: list[int] = [-1] * size
+    closed: bytearray = bytearray(size)
+    distances[source] = 0
+    open_set: list[int] = [heuristics[source] * size + source]
+    expanded_nodes: int = 0
+
+    while open_set:
+      node: int = heappop(open_set) % size
+      if closed[node]:
+        continue
+      if node == target:
+        break
+      closed[node] = 1
+      expanded_nodes += 1
+      distance: int = distances[node]
+      for neighbour in (node - 1, node + 1, node - width, node + width):
+        cost: int = costs[neighbour]
+        if cost != impassable and distance + cost < distances[neighbour]:
+          distances[neighbour] = distance + cost
+          parents[neighbour] = node
+          heappush(open_set, (distance + cost + heuristics[neighbour]) * size + neighbour)
+    else:
+      return None
+
+    nodes: list[int] = []
+    node = target
+    while node != -1:
+      nodes.append((node // width - 1) * columns + node % width - 1)
+      node = parents[node]
+    nodes.reverse()
+    return distances[target], expanded_nodes, nodes
@@ -7,11 +7,15 @@ class Cell:
   """
   Entity that represents a cell in the map.
 
+  Cells only hold a reference to their terrain, shared by every cell of the same code, and use slots to stay small
+  when a grid keeps one for every position.
+
   Attributes:
     __terrain (Terrain): The terrain type of the cell.
     __x (int): The x-coordinate of the cell.
     __y (int): The y-coordinate of the cell.
   """
+  __slots__ = ('__terrain', '__x', '__y')
 
   def __init__(self, terrain: Terrain, x: int, y: int):
     """
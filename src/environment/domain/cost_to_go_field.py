@@ -0,0 +1,94 @@
+from array import array
+from typing import Optional
+
+from src.position.domain.position import Position
+
+
+class CostToGoField:
+  """
+  The least movement cost from every position of an environment to a finish position, for a type of agent.
+
+  Moving into a position costs its movement cost, as in MoveAction, so the cost of a position is the sum of the costs
+  of the positions entered after it, the finish included. Positions the agent cannot traverse still have the cost of
+  leaving them, since an agent may start on them.
+
+  Attributes:
+    UNREACHABLE (int): The cost of the positions from which the finish cannot be reached.
+    __columns (int): The number of columns of the environment.
+    __costs (array): The cost of every position, indexed by y * columns + x, with typecode 'I'.
+    __finish (Position): The finish position.
+    __rows (int): The number of rows of the environment.
+  """
+  UNREACHABLE: int = 0xFFFFFFFF
+
+  def __init__(self, costs: array, rows: int, columns: int, finish: Position):
+    """
+    Initializes a CostToGoField instance.
+
+    Args:
+      costs (array): The cost of every position, indexed by y * columns + x, with typecode 'I'.
+      rows (int): The number of rows of the environment.
+      columns (int): The number of columns of the environment.
+      finish (Position): The finish position.
+
+    Raises:
+      ValueError: If the number of costs does not match the size of the environment.
+    """
+    if len(costs) != rows * columns:
+      raise ValueError(f'Expected {rows * columns} costs, found {len(costs)}.')
+    self.__columns: int = columns
+    self.__costs: array = costs
+    self.__finish: Position = finish
+    self.__rows: int = rows
+
+  def get_rows(self) -> int:
+    """
+    Returns the number of rows of the environment.
+
+    Returns:
+      int: The number of rows.
+    """
+    return self.__rows
+
+  def get_columns(self) -> int:
+    """
+    Returns the number of columns of the environment.
+
+    Returns:
+      int: The number of columns.
+    """
+    return self.__columns
+
+  def get_finish(self) -> Position:
+    """
+    Returns the finish position.
+
+    Returns:
+      Position: The finish position.
+    """
+    return self.__finish
+
+  def get_costs(self) -> array:
+    """
+    Returns the cost of every position.
+
+    Returns:
+      array: The costs, indexed by y * columns + x, with UNREACHABLE for the positions from which the finish cannot be reached.
+    """
+    return self.__costs
+
+  def get_cost(self, x: int, y: int) -> Optional[int]:
+    """
+    Returns the least movement cost from a position to the finish.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      Optional[int]: The cost, or None if the position is out of bounds or the finish cannot be reached from it.
+    """
+    if not (0 <= x < self.__columns and 0 <= y < self.__rows):
+      return None
+    cost: int = self.__costs[y * self.__columns + x]
+    return None if cost == CostToGoField.UNREACHABLE else cost
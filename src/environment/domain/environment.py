@@ -1,7 +1,11 @@
-from typing import Optional
+from array import array
+from typing import Callable, Iterable, Optional
 
 from src.agent.domain.agent import Agent
 from src.environment.domain.cell.cell import Cell
+from src.environment.domain.environment_snapshot import EnvironmentSnapshot
+from src.environment.domain.grid.grid import Grid
+from src.environment.domain.occupancy_index import OccupancyIndex
 
 
 class Environment:
@@ -11,28 +15,40 @@ class Environment:
   Attributes:
     __agents (list[Agent]): The list of agents in the environment.
     __discovered_map (list[list[bool]]): The map of discovered cells.
-    __grid (list[list[Cell]]): The grid representing the environment.
+    __discovered_rows_shared (bytearray): Whether every row of the discovered map is shared with a snapshot, and must be
+      copied before it is written.
+    __grid (Grid): The grid representing the environment.
+    __movement_costs (dict[str, array]): The movement cost matrix of every type of agent, indexed by y * columns + x.
+    __occupancy_index (OccupancyIndex): The agents by position, updated when they move.
     __rows (int): The number of rows in the environment.
     __columns (int): The number of columns in the environment.
+    __state_listeners (list[Callable[[Environment, int, int], None]]): The functions called after a cell is changed.
   """
 
-  def __init__(self, agents: list[Agent], discovered_map: list[list[bool]], grid: list[list[Cell]], rows: int, columns: int):
+  def __init__(self, agents: list[Agent], discovered_map: list[list[bool]], grid: Grid, rows: int, columns: int):
     """
     Initializes an Environment instance.
 
     Args:
       agents (list[Agent]): The list of agents in the environment.
       discovered_map (list[list[bool]]): The map of discovered cells.
-      grid (list[list[Cell]]): The grid representing the environment.
+      grid (Grid): The grid representing the environment.
       rows (int): The number of rows in the environment.
       columns (int): The number of columns in the environment
     """
     self.__agents: list[Agent] = agents
     self.__selected_agent: Optional[Agent] = None
     self.__discovered_map: list[list[bool]] = discovered_map
-    self.__grid: list[list[Cell]] = grid
+    self.__discovered_rows_shared: bytearray = bytearray(rows)
+    self.__grid: Grid = grid
+    self.__movement_costs: dict[str, array] = {}
+    self.__occupancy_index: OccupancyIndex = OccupancyIndex(columns)
     self.__rows: int = rows
     self.__columns: int = columns
+    self.__state_listeners: list[Callable[['Environment', int, int], None]] = []
+    for agent in agents:
+      self.__occupancy_index.add(agent)
+      agent.add_position_listener(self.__occupancy_index.move)
 
   def get_selected_agent(self) -> Optional[Agent]:
     """
@@ -69,7 +85,23 @@ class Environment:
       agent (Agent): The agent to be added.
     """
     self.__agents.append(agent)
-    self.__discovered_map[agent.get_x()][agent.get_y()] = True
+    self.__occupancy_index.add(agent)
+    agent.add_position_listener(self.__occupancy_index.move)
+    self.get_movement_costs_for(agent.get_name())
+    self.__get_writable_discovered_row(agent.get_y())[agent.get_x()] = True
+
+  def contains(self, x: int, y: int) -> bool:
+    """
+    Checks if a position is inside the bounds of the environment.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      bool: True if the position is inside the environment, False otherwise.
+    """
+    return 0 <= y < self.__rows and 0 <= x < self.__columns
 
   def get_cell(self, x: int, y: int) -> Optional[Cell]:
     """
@@ -84,7 +116,16 @@ class Environment:
     """
     if y < 0 or y >= self.__rows or x < 0 or x >= self.__columns:
       return None
-    return self.__grid[y][x]
+    return self.__grid.get_cell(x, y)
+
+  def get_grid(self) -> Grid:
+    """
+    Returns the grid representing the environment.
+
+    Returns:
+      Grid: The grid.
+    """
+    return self.__grid
 
   def update_discovered_map(self, x: int, y: int, value: bool):
     """
@@ -95,12 +136,47 @@ class Environment:
       y (int): The y-coordinate of the position to update.
       value (bool): The new value for the position.
     """
-    self.__discovered_map[y][x] = value
+    self.__get_writable_discovered_row(y)[x] = value
+
+  def update_discovered_cells(self, indices: Iterable[int]):
+    """
+    Marks several cells of the discovered map as discovered.
+
+    Args:
+      indices (Iterable[int]): The cells to mark, indexed by y * columns + x.
+    """
+    discovered_map: list[list[bool]] = self.__discovered_map
+    discovered_rows_shared: bytearray = self.__discovered_rows_shared
+    columns: int = self.__columns
+    for index in indices:
+      y: int = index // columns
+      if discovered_rows_shared[y]:
+        self.__get_writable_discovered_row(y)
+      discovered_map[y][index % columns] = True
+
+  def __get_writable_discovered_row(self, y: int) -> list[bool]:
+    """
+    Returns a row of the discovered map that can be written, copying it first if it is shared with a snapshot.
+
+    Args:
+      y (int): The y-coordinate of the row.
+
+    Returns:
+      list[bool]: The row, owned by the environment.
+    """
+    row: list[bool] = self.__discovered_map[y]
+    if self.__discovered_rows_shared[y]:
+      row = list(row)
+      self.__discovered_map[y] = row
+      self.__discovered_rows_shared[y] = 0
+    return row
 
   def get_discovered_map(self) -> list[list[bool]]:
     """
     Returns the discovered map.
 
+    Its rows may be shared with snapshots, so it must only be written through the methods of the environment.
+
     Returns:
       list[list[bool]]: The discovered map.
     """
@@ -119,6 +195,44 @@ class Environment:
     """
     return self.__discovered_map[y][x]
 
+  def create_snapshot(self) -> EnvironmentSnapshot:
+    """
+    Captures the agents, their state, the selected agent and the discovered map, to restore them later with
+    restore_snapshot.
+
+    The grid is shared rather than captured, so changes made through update_state are not undone by a restore. The
+    rows of the discovered map are shared with the snapshot and copied the first time they are written.
+
+    Returns:
+      EnvironmentSnapshot: The snapshot of the environment.
+    """
+    self.__discovered_rows_shared = bytearray(b'\x01') * self.__rows
+    return EnvironmentSnapshot(
+      list(self.__agents),
+      [agent.create_snapshot() for agent in self.__agents],
+      tuple(self.__discovered_map),
+      self.__selected_agent)
+
+  def restore_snapshot(self, snapshot: EnvironmentSnapshot) -> None:
+    """
+    Restores the state captured by create_snapshot, removing the agents added after it. A snapshot can be restored
+    any number of times.
+
+    Args:
+      snapshot (EnvironmentSnapshot): The snapshot of this environment.
+    """
+    agents: list[Agent] = snapshot.get_agents()
+    for agent in self.__agents:
+      if agent not in agents:
+        agent.remove_position_listener(self.__occupancy_index.move)
+        self.__occupancy_index.remove(agent)
+    self.__agents[:] = agents
+    for agent, agent_snapshot in zip(agents, snapshot.get_agent_snapshots()):
+      agent.restore_snapshot(agent_snapshot)
+    self.__selected_agent = snapshot.get_selected_agent()
+    self.__discovered_map[:] = snapshot.get_discovered_rows()
+    self.__discovered_rows_shared = bytearray(b'\x01') * self.__rows
+
   def update_state(self, x: int, y: int, new_value: Cell):
     """
     Changes the state of the environment at a position and updates both the global and agents' maps.
@@ -128,7 +242,46 @@ class Environment:
       y (int): The y-coordinate of the position to update.
       new_value (Cell): The new value for the position.
     """
-    self.__grid[y][x] = new_value
+    self.__grid.set_cell(x, y, new_value)
+    index: int = y * self.__columns + x
+    for agent_name, movement_costs in self.__movement_costs.items():
+      movement_costs[index] = Grid.get_movement_cost_of(new_value.get_terrain(), agent_name)
+    for listener in self.__state_listeners:
+      listener(self, x, y)
+
+  def add_state_listener(self, listener: Callable[['Environment', int, int], None]) -> None:
+    """
+    Registers a function called with the environment and the coordinates of the cell after every update_state.
+
+    Args:
+      listener (Callable[[Environment, int, int], None]): The function to call.
+    """
+    self.__state_listeners.append(listener)
+
+  def remove_state_listener(self, listener: Callable[['Environment', int, int], None]) -> None:
+    """
+    Unregisters a function registered with add_state_listener.
+
+    Args:
+      listener (Callable[[Environment, int, int], None]): The function to unregister.
+    """
+    self.__state_listeners.remove(listener)
+
+  def get_movement_costs_for(self, agent_name: str) -> array:
+    """
+    Returns the movement cost matrix of a type of agent, creating it the first time it is requested.
+
+    Args:
+      agent_name (str): The name of the agent.
+
+    Returns:
+      array: The movement costs, indexed by y * columns + x, with Grid.IMPASSABLE for the positions the agent cannot traverse.
+    """
+    movement_costs: Optional[array] = self.__movement_costs.get(agent_name)
+    if movement_costs is None:
+      movement_costs = self.__grid.create_movement_costs_for(agent_name)
+      self.__movement_costs[agent_name] = movement_costs
+    return movement_costs
 
   def is_obstacle_for(self, agent: Agent, x: int, y: int) -> Optional[bool]:
     """
@@ -142,10 +295,9 @@ class Environment:
     Returns:
       bool: True if the cell is an obstacle for the agent, False otherwise.
     """
-    cell: Optional[Cell] = self.get_cell(x, y)
-    if cell is None:
+    if y < 0 or y >= self.__rows or x < 0 or x >= self.__columns:
       return None
-    return cell.get_movement_cost_for(agent.get_name()) is None
+    return self.get_movement_costs_for(agent.get_name())[y * self.__columns + x] == Grid.IMPASSABLE
 
   def get_rows(self) -> int:
     """
@@ -176,10 +328,37 @@ class Environment:
     Returns:
       bool: True if an agent is in the position, False otherwise.
     """
-    for agent in self.__agents:
-      if agent.get_x() == x and agent.get_y() == y:
-        return True
-    return False
+    return self.contains(x, y) and self.__occupancy_index.is_occupied(x, y)
+
+  def get_agents_at(self, x: int, y: int) -> list[Agent]:
+    """
+    Returns the agents in a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      list[Agent]: The agents in the position.
+    """
+    if not self.contains(x, y):
+      return []
+    return self.__occupancy_index.get_agents_at(x, y)
+
+  def get_agents_in_rectangle(self, min_x: int, min_y: int, max_x: int, max_y: int) -> list[Agent]:
+    """
+    Returns the agents within a rectangle of the environment, bounds included.
+
+    Args:
+      min_x (int): The smallest x-coordinate of the rectangle.
+      min_y (int): The smallest y-coordinate of the rectangle.
+      max_x (int): The largest x-coordinate of the rectangle.
+      max_y (int): The largest y-coordinate of the rectangle.
+
+    Returns:
+      list[Agent]: The agents within the rectangle.
+    """
+    return self.__occupancy_index.get_agents_in_rectangle(max(min_x, 0), max(min_y, 0), min(max_x, self.__columns - 1), min(max_y, self.__rows - 1))
 
   def print_discovered_map(self):
     """
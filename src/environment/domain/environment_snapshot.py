@@ -0,0 +1,70 @@
+from typing import Optional
+
+from src.agent.domain.agent import Agent, AgentSnapshot
+
+
+class EnvironmentSnapshot:
+  """
+  The mutable state of an environment at a point in time: its agents, their state, the selected agent and the
+  discovered map. The grid is not part of the snapshot, it is shared with the environment.
+
+  The rows of the discovered map are shared with the environment until it writes to them, so the snapshot never owns
+  a copy of a row that did not change.
+
+  Attributes:
+    __agent_snapshots (list[AgentSnapshot]): The snapshot of every agent, in the order of the agents.
+    __agents (list[Agent]): The agents of the environment.
+    __discovered_rows (tuple[list[bool], ...]): The rows of the discovered map, never written once captured.
+    __selected_agent (Optional[Agent]): The selected agent.
+  """
+
+  def __init__(self, agents: list[Agent], agent_snapshots: list[AgentSnapshot], discovered_rows: tuple[list[bool], ...], selected_agent: Optional[Agent]):
+    """
+    Initializes an EnvironmentSnapshot instance.
+
+    Args:
+      agents (list[Agent]): The agents of the environment.
+      agent_snapshots (list[AgentSnapshot]): The snapshot of every agent, in the order of the agents.
+      discovered_rows (tuple[list[bool], ...]): The rows of the discovered map, never written once captured.
+      selected_agent (Optional[Agent]): The selected agent.
+    """
+    self.__agent_snapshots: list[AgentSnapshot] = agent_snapshots
+    self.__agents: list[Agent] = agents
+    self.__discovered_rows: tuple[list[bool], ...] = discovered_rows
+    self.__selected_agent: Optional[Agent] = selected_agent
+
+  def get_agents(self) -> list[Agent]:
+    """
+    Returns the agents of the environment.
+
+    Returns:
+      list[Agent]: The agents.
+    """
+    return self.__agents
+
+  def get_agent_snapshots(self) -> list[AgentSnapshot]:
+    """
+    Returns the snapshot of every agent.
+
+    Returns:
+      list[AgentSnapshot]: The snapshots, in the order of the agents.
+    """
+    return self.__agent_snapshots
+
+  def get_discovered_rows(self) -> tuple[list[bool], ...]:
+    """
+    Returns the rows of the discovered map.
+
+    Returns:
+      tuple[list[bool], ...]: The rows, which must not be written.
+    """
+    return self.__discovered_rows
+
+  def get_selected_agent(self) -> Optional[Agent]:
+    """
+    Returns the selected agent.
+
+    Returns:
+      Optional[Agent]: The selected agent.
+    """
+    return self.__selected_agent
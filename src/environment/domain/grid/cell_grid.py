@@ -0,0 +1,92 @@
+from array import array
+from typing import Optional
+
+from src.environment.domain.cell.cell import Cell
+from src.environment.domain.grid.grid import Grid, GridRevision
+from src.environment.domain.terrain.terrain import Terrain
+
+
+class CellGrid(Grid):
+  """
+  Grid that keeps one Cell object for every position.
+
+  The rows are shared with the views of the grid until a cell is replaced, when the grid copies them.
+
+  Attributes:
+    __cells (list[list[Cell]]): The cells of the grid, indexed by row and then by column.
+    __owns_cells (bool): Whether the rows are not shared and can be modified.
+  """
+
+  def __init__(self, cells: list[list[Cell]], rows: int, columns: int, revision: Optional[GridRevision] = None):
+    """
+    Initializes a CellGrid instance.
+
+    Args:
+      cells (list[list[Cell]]): The cells of the grid, indexed by row and then by column.
+      rows (int): The number of rows in the grid.
+      columns (int): The number of columns in the grid.
+      revision (Optional[GridRevision]): The revision of the grid the rows belong to, None if the grid is not a view.
+    """
+    super().__init__(rows, columns, revision)
+    self.__cells: list[list[Cell]] = cells
+    self.__owns_cells: bool = revision is None
+
+  def create_view(self) -> 'CellGrid':
+    """
+    Creates a grid that shares the rows of this one until one of its cells is replaced.
+
+    Returns:
+      CellGrid: The view.
+    """
+    # Both grids now share the rows, so this one has to copy them too before replacing a cell.
+    self.__owns_cells = False
+    return CellGrid(self.__cells, self.get_rows(), self.get_columns(), self.get_revision())
+
+  def get_cell(self, x: int, y: int) -> Cell:
+    """
+    Returns the cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      Cell: The cell at the specified position.
+    """
+    return self.__cells[y][x]
+
+  def set_cell(self, x: int, y: int, cell: Cell) -> None:
+    """
+    Replaces the cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+      cell (Cell): The new cell.
+    """
+    if not self.__owns_cells:
+      self.__cells = [row[:] for row in self.__cells]
+      self.__owns_cells = True
+      self.renew_revision()
+    self.__cells[y][x] = cell
+
+  def create_movement_costs_for(self, agent_name: str) -> array:
+    """
+    Creates a dense matrix with the movement cost of every position for a type of agent.
+
+    The cost is resolved once per distinct terrain, since the cells of the same code share their Terrain object.
+
+    Args:
+      agent_name (str): The name of the agent.
+
+    Returns:
+      array: The movement costs, indexed by y * columns + x, with IMPASSABLE for the positions the agent cannot traverse.
+    """
+    costs_by_terrain: dict[Terrain, int] = {}
+    movement_costs: array = array('i')
+    for row in self.__cells:
+      terrains: list[Terrain] = [cell.get_terrain() for cell in row]
+      for terrain in set(terrains).difference(costs_by_terrain):
+        costs_by_terrain[terrain] = Grid.get_movement_cost_of(terrain, agent_name)
+      movement_costs.extend(map(costs_by_terrain.__getitem__, terrains))
+    return movement_costs
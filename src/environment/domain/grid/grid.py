@@ -0,0 +1,160 @@
+from abc import ABC, abstractmethod
+from array import array
+from enum import Enum
+from typing import Optional
+
+from src.environment.domain.cell.cell import Cell
+from src.environment.domain.terrain.terrain import Terrain
+from src.environment.domain.terrain.terrain_cost_table import TerrainCostTable
+
+
+class GridStorage(Enum):
+  """
+  Enum representing the available storage modes for the environment grid.
+
+  Attributes:
+    CELLS (str): One Cell object is kept for every position of the grid.
+    TERRAIN_CODES (str): Only the terrain codes are kept, in a contiguous typed buffer.
+  """
+  CELLS = 'cells'
+  TERRAIN_CODES = 'terrain_codes'
+
+
+class GridRevision:
+  """
+  Identifies the cells read by a grid and its views, as the key of the data derived from them.
+  """
+  __slots__ = ('__weakref__',)
+
+
+class Grid(ABC):
+  """
+  Represents the storage of the cells of an environment.
+
+  Positions are always valid when they reach a grid, the bounds are checked by the environment.
+
+  A grid can be shared by several environments through views, which read the cells of the grid they were created from
+  until one of their cells is replaced, when they copy them. Grids that read the same cells have the same revision, so
+  data derived from the cells can be kept by revision and reused by every view.
+
+  Attributes:
+    IMPASSABLE (int): The movement cost stored for the positions an agent cannot traverse.
+    __columns (int): The number of columns in the grid.
+    __revision (GridRevision): The revision of the cells read by the grid.
+    __rows (int): The number of rows in the grid.
+  """
+  IMPASSABLE: int = TerrainCostTable.IMPASSABLE
+
+  def __init__(self, rows: int, columns: int, revision: Optional['GridRevision'] = None):
+    """
+    Initializes a Grid instance.
+
+    Args:
+      rows (int): The number of rows in the grid.
+      columns (int): The number of columns in the grid.
+      revision (Optional[GridRevision]): The revision of the cells read, shared with the grid they belong to, or None
+        for a new one.
+    """
+    self.__columns: int = columns
+    self.__revision: GridRevision = revision if revision is not None else GridRevision()
+    self.__rows: int = rows
+
+  def get_rows(self) -> int:
+    """
+    Returns the number of rows in the grid.
+
+    Returns:
+      int: The number of rows.
+    """
+    return self.__rows
+
+  def get_columns(self) -> int:
+    """
+    Returns the number of columns in the grid.
+
+    Returns:
+      int: The number of columns.
+    """
+    return self.__columns
+
+  def get_revision(self) -> 'GridRevision':
+    """
+    Returns the revision of the cells read by the grid.
+
+    Returns:
+      GridRevision: The revision, shared by the grids that read the same cells.
+    """
+    return self.__revision
+
+  def renew_revision(self) -> None:
+    """
+    Gives the grid a new revision, called by the subclasses when they copy shared cells before replacing one.
+    """
+    self.__revision = GridRevision()
+
+  @abstractmethod
+  def create_view(self) -> 'Grid':
+    """
+    Creates a grid that reads the cells of this one until one of its cells is replaced. Replacing a cell of either grid
+    afterwards never changes the other one.
+
+    Returns:
+      Grid: The view.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def get_cell(self, x: int, y: int) -> Cell:
+    """
+    Returns the cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      Cell: The cell at the specified position.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def set_cell(self, x: int, y: int, cell: Cell) -> None:
+    """
+    Replaces the cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+      cell (Cell): The new cell.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @abstractmethod
+  def create_movement_costs_for(self, agent_name: str) -> array:
+    """
+    Creates a dense matrix with the movement cost of every position for a type of agent.
+
+    Args:
+      agent_name (str): The name of the agent.
+
+    Returns:
+      array: The movement costs, indexed by y * columns + x, with IMPASSABLE for the positions the agent cannot traverse.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
+
+  @staticmethod
+  def get_movement_cost_of(terrain: Terrain, agent_name: str) -> int:
+    """
+    Returns the movement cost of a terrain for a type of agent, as stored in the movement cost matrices.
+
+    Args:
+      terrain (Terrain): The terrain to check.
+      agent_name (str): The name of the agent.
+
+    Returns:
+      int: The movement cost, or IMPASSABLE if the agent cannot traverse the terrain.
+    """
+    movement_cost: Optional[int] = terrain.get_movement_cost(agent_name)
+    if movement_cost is None:
+      return Grid.IMPASSABLE
+    return movement_cost
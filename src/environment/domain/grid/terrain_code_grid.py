@@ -0,0 +1,175 @@
+import sys
+from array import array
+from typing import Optional, Sequence
+
+from src.environment.domain.cell.cell import Cell
+from src.environment.domain.grid.grid import Grid, GridRevision
+from src.environment.domain.terrain.terrain import Terrain
+from src.environment.domain.terrain.terrain_cost_table import TerrainCostTable
+
+
+class TerrainCodeGrid(Grid):
+  """
+  Grid that keeps the terrain codes in a single contiguous typed buffer, row after row.
+
+  Cells are not stored, a Cell view is materialized every time one is requested. The buffer received is shared, for
+  example with the map it comes from or with the views of the grid, until the first cell is replaced, when the grid
+  copies it.
+
+  Attributes:
+    __codes (Sequence[int]): The terrain code of every position, indexed by y * columns + x.
+    __cost_table (Optional[TerrainCostTable]): The movement costs of the terrains, while they are the ones the grid
+      was created with.
+    __owns_codes (bool): Whether the buffer was copied by the grid and can be modified.
+    __terrains (dict[int, Terrain]): The terrain of every code present in the grid.
+  """
+
+  def __init__(self, codes: Sequence[int], terrains: dict[int, Terrain], rows: int, columns: int, cost_table: Optional[TerrainCostTable] = None, revision: Optional[GridRevision] = None):
+    """
+    Initializes a TerrainCodeGrid instance.
+
+    Args:
+      codes (Sequence[int]): A typed buffer, array or memoryview, with the terrain code of every position, indexed by y * columns + x.
+      terrains (dict[int, Terrain]): The terrain of every code present in the grid.
+      rows (int): The number of rows in the grid.
+      columns (int): The number of columns in the grid.
+      cost_table (Optional[TerrainCostTable]): The movement costs of the terrains, covering every code of the grid.
+      revision (Optional[GridRevision]): The revision of the grid the buffer belongs to, None if the grid is not a view.
+    """
+    super().__init__(rows, columns, revision)
+    self.__codes: Sequence[int] = codes
+    self.__cost_table: Optional[TerrainCostTable] = cost_table
+    self.__owns_codes: bool = False
+    self.__terrains: dict[int, Terrain] = terrains
+
+  def create_view(self) -> 'TerrainCodeGrid':
+    """
+    Creates a grid that shares the buffer of terrain codes of this one until one of its cells is replaced.
+
+    Returns:
+      TerrainCodeGrid: The view.
+    """
+    # Both grids now share the buffer, so this one has to copy it too before replacing a cell.
+    self.__owns_codes = False
+    return TerrainCodeGrid(self.__codes, dict(self.__terrains), self.get_rows(), self.get_columns(), self.__cost_table, self.get_revision())
+
+  def get_codes(self) -> Sequence[int]:
+    """
+    Returns the buffer of terrain codes.
+
+    Returns:
+      Sequence[int]: The terrain code of every position, indexed by y * columns + x.
+    """
+    return self.__codes
+
+  def get_terrains(self) -> dict[int, Terrain]:
+    """
+    Returns the terrain of every code present in the grid.
+
+    Returns:
+      dict[int, Terrain]: The terrains by code.
+    """
+    return self.__terrains
+
+  def get_code(self, x: int, y: int) -> int:
+    """
+    Returns the terrain code at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      int: The terrain code.
+    """
+    return self.__codes[y * self.get_columns() + x]
+
+  def get_cell(self, x: int, y: int) -> Cell:
+    """
+    Materializes the cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      Cell: A view of the cell at the specified position.
+    """
+    return Cell(self.__terrains[self.__codes[y * self.get_columns() + x]], y, x)
+
+  def set_cell(self, x: int, y: int, cell: Cell) -> None:
+    """
+    Stores the terrain code of a cell at a specific position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+      cell (Cell): The new cell.
+
+    Raises:
+      ValueError: If the terrain code does not fit in the buffer.
+    """
+    terrain: Terrain = cell.get_terrain()
+    code: int = int(terrain.get_code())
+    if code < 0 or code >= 1 << (8 * self.__codes.itemsize):
+      raise ValueError(f'Terrain code {code} does not fit in the grid.')
+    if not self.__owns_codes:
+      codes: array = array(self.__codes.typecode if isinstance(self.__codes, array) else self.__codes.format)
+      codes.frombytes(self.__codes)
+      self.__codes = codes
+      self.__owns_codes = True
+      self.renew_revision()
+    self.__terrains[code] = terrain
+    self.__cost_table = None
+    self.__codes[y * self.get_columns() + x] = code
+
+  def create_movement_costs_for(self, agent_name: str) -> array:
+    """
+    Creates a dense matrix with the movement cost of every position for a type of agent.
+
+    The cost of every terrain code is taken from the column of the cost table, or resolved from the terrains once the
+    grid replaced a cell, and then expanded over the buffer of codes.
+
+    Args:
+      agent_name (str): The name of the agent.
+
+    Returns:
+      array: The movement costs, indexed by y * columns + x, with IMPASSABLE for the positions the agent cannot traverse.
+    """
+    if self.__cost_table is not None:
+      return self.expand_costs(self.__cost_table.get_costs_for(agent_name))
+    costs_by_code: list[int] = [Grid.IMPASSABLE] * (max(self.__terrains, default=0) + 1)
+    for code, terrain in self.__terrains.items():
+      costs_by_code[code] = Grid.get_movement_cost_of(terrain, agent_name)
+    return self.expand_costs(costs_by_code)
+
+  def expand_costs(self, costs_by_code: Sequence[int]) -> array:
+    """
+    Expands the movement cost of every terrain code over the buffer of codes.
+
+    When the codes take a single byte, every byte of the costs is produced by translating the whole buffer of codes, so
+    the expansion runs without a Python call per position.
+
+    Args:
+      costs_by_code (Sequence[int]): The movement cost of every terrain code of the grid.
+
+    Returns:
+      array: The movement costs, indexed by y * columns + x.
+    """
+    movement_costs: array = array('i')
+    if self.__codes.itemsize != 1:
+      movement_costs.extend(map(costs_by_code.__getitem__, self.__codes))
+      return movement_costs
+
+    itemsize: int = movement_costs.itemsize
+    impassable: bytes = Grid.IMPASSABLE.to_bytes(itemsize, sys.byteorder, signed=True)
+    tables: list[bytearray] = [bytearray([byte]) * 256 for byte in impassable]
+    for code, movement_cost in enumerate(costs_by_code[:256]):
+      for table, byte in zip(tables, movement_cost.to_bytes(itemsize, sys.byteorder, signed=True)):
+        table[code] = byte
+    codes: bytes = bytes(self.__codes)
+    buffer: bytearray = bytearray(len(codes) * itemsize)
+    for offset, table in enumerate(tables):
+      buffer[offset::itemsize] = codes.translate(table)
+    movement_costs.frombytes(buffer)
+    return movement_costs
@@ -0,0 +1,118 @@
+from src.agent.domain.agent import Agent
+
+
+class OccupancyIndex:
+  """
+  Spatial index of the agents of an environment by position, kept up to date as the agents move.
+
+  Only the occupied positions are stored, so the memory is proportional to the number of agents and not to the size
+  of the map.
+
+  Attributes:
+    __agents_by_index (dict[int, list[Agent]]): The agents at every occupied position, indexed by y * columns + x.
+    __columns (int): The number of columns of the environment.
+  """
+
+  def __init__(self, columns: int):
+    """
+    Initializes an OccupancyIndex instance without agents.
+
+    Args:
+      columns (int): The number of columns of the environment.
+    """
+    self.__agents_by_index: dict[int, list[Agent]] = {}
+    self.__columns: int = columns
+
+  def add(self, agent: Agent) -> None:
+    """
+    Adds an agent at its current position.
+
+    Args:
+      agent (Agent): The agent to add.
+    """
+    self.__agents_by_index.setdefault(agent.get_y() * self.__columns + agent.get_x(), []).append(agent)
+
+  def remove(self, agent: Agent) -> None:
+    """
+    Removes an agent from its current position.
+
+    Args:
+      agent (Agent): The agent to remove.
+    """
+    index: int = agent.get_y() * self.__columns + agent.get_x()
+    agents: list[Agent] = self.__agents_by_index[index]
+    agents.remove(agent)
+    if len(agents) == 0:
+      del self.__agents_by_index[index]
+
+  def move(self, agent: Agent, previous_x: int, previous_y: int) -> None:
+    """
+    Moves an agent from its previous position to its current one.
+
+    Args:
+      agent (Agent): The agent that moved.
+      previous_x (int): The x-coordinate the agent left.
+      previous_y (int): The y-coordinate the agent left.
+    """
+    previous_index: int = previous_y * self.__columns + previous_x
+    agents: list[Agent] = self.__agents_by_index[previous_index]
+    agents.remove(agent)
+    if len(agents) == 0:
+      del self.__agents_by_index[previous_index]
+    self.add(agent)
+
+  def get_agents_at(self, x: int, y: int) -> list[Agent]:
+    """
+    Returns the agents at a position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      list[Agent]: The agents at the position, in the order they arrived.
+    """
+    return list(self.__agents_by_index.get(y * self.__columns + x, ()))
+
+  def is_occupied(self, x: int, y: int) -> bool:
+    """
+    Checks if there is an agent at a position.
+
+    Args:
+      x (int): The x-coordinate of the position.
+      y (int): The y-coordinate of the position.
+
+    Returns:
+      bool: True if an agent is at the position, False otherwise.
+    """
+    return y * self.__columns + x in self.__agents_by_index
+
+  def get_agents_in_rectangle(self, min_x: int, min_y: int, max_x: int, max_y: int) -> list[Agent]:
+    """
+    Returns the agents within a rectangle, bounds included.
+
+    The positions of the rectangle or the occupied positions are scanned, whichever are fewer.
+
+    Args:
+      min_x (int): The smallest x-coordinate of the rectangle.
+      min_y (int): The smallest y-coordinate of the rectangle.
+      max_x (int): The largest x-coordinate of the rectangle.
+      max_y (int): The largest y-coordinate of the rectangle.
+
+    Returns:
+      list[Agent]: The agents within the rectangle.
+    """
+    if min_x > max_x or min_y > max_y:
+      return []
+    columns: int = self.__columns
+    agents: list[Agent] = []
+    if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(self.__agents_by_index):
+      for y in range(min_y, max_y + 1):
+        for index in range(y * columns + min_x, y * columns + max_x + 1):
+          agents.extend(self.__agents_by_index.get(index, ()))
+    else:
+      for index, agents_at_index in self.__agents_by_index.items():
+        y, x = divmod(index, columns)
+        if min_x <= x <= max_x and min_y <= y <= max_y:
+          agents.extend(agents_at_index)
+    return agents
@@ -66,6 +66,15 @@ class Terrain:
     """
     return self.__movement_costs_by_agent.get(agent_name)
 
+  def get_movement_costs(self) -> dict[str, Optional[int]]:
+    """
+    Returns the movement cost of every type of agent named by the terrain.
+
+    Returns:
+      dict[str, Optional[int]]: The movement costs by agent name, None for the agents that cannot traverse the terrain.
+    """
+    return self.__movement_costs_by_agent
+
   def __str__(self) -> str:
     """
     Returns a string representation of the Terrain instance.
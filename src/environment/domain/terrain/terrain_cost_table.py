@@ -0,0 +1,114 @@
+from array import array
+from typing import Optional
+
+from src.environment.domain.terrain.terrain import Terrain
+
+
+class TerrainCostTable:
+  """
+  Movement costs of a set of terrains in a compact table indexed by terrain code and agent type id.
+
+  Every agent type named by a terrain gets a small integer id, in the order they first appear. The costs are stored in
+  a single typed buffer, row after row: the cost of a terrain code for an agent type id is at
+  code * agent_type_count + agent_type_id, with IMPASSABLE for the agent types that cannot traverse the terrain and for
+  the codes without terrain. The buffer pickles as raw bytes, so the table is cheap to send to other processes.
+
+  Attributes:
+    IMPASSABLE (int): The cost stored for the terrains an agent type cannot traverse.
+    __agent_type_ids (dict[str, int]): The id of every agent type, by name.
+    __agent_types (list[str]): The name of every agent type, by id.
+    __code_count (int): The number of rows of the table, one more than the highest terrain code.
+    __costs (array): The cost of every terrain code for every agent type id.
+  """
+  IMPASSABLE: int = -1
+
+  def __init__(self, terrains: list[Terrain]):
+    """
+    Initializes a TerrainCostTable instance from terrains with normalized costs.
+
+    Args:
+      terrains (list[Terrain]): The terrains of the table, with non-negative integer codes.
+    """
+    self.__agent_type_ids: dict[str, int] = {}
+    self.__agent_types: list[str] = []
+    for terrain in terrains:
+      for agent_name in terrain.get_movement_costs():
+        if agent_name not in self.__agent_type_ids:
+          self.__agent_type_ids[agent_name] = len(self.__agent_types)
+          self.__agent_types.append(agent_name)
+
+    agent_type_count: int = len(self.__agent_types)
+    self.__code_count: int = max((terrain.get_code() for terrain in terrains), default=-1) + 1
+    self.__costs: array = array('i', [TerrainCostTable.IMPASSABLE]) * (self.__code_count * agent_type_count)
+    for terrain in terrains:
+      row: int = terrain.get_code() * agent_type_count
+      for agent_name, movement_cost in terrain.get_movement_costs().items():
+        if movement_cost is not None:
+          self.__costs[row + self.__agent_type_ids[agent_name]] = movement_cost
+
+  def get_agent_types(self) -> list[str]:
+    """
+    Returns the name of every agent type.
+
+    Returns:
+      list[str]: The names, by id.
+    """
+    return self.__agent_types
+
+  def get_agent_type_id(self, agent_name: str) -> Optional[int]:
+    """
+    Returns the id of an agent type.
+
+    Args:
+      agent_name (str): The name of the agent type.
+
+    Returns:
+      Optional[int]: The id, or None if no terrain names the agent type.
+    """
+    return self.__agent_type_ids.get(agent_name)
+
+  def get_code_count(self) -> int:
+    """
+    Returns the number of rows of the table, one more than the highest terrain code.
+
+    Returns:
+      int: The number of terrain codes.
+    """
+    return self.__code_count
+
+  def get_costs(self) -> array:
+    """
+    Returns the buffer of the table.
+
+    Returns:
+      array: The cost of every terrain code for every agent type id, at code * agent_type_count + agent_type_id.
+    """
+    return self.__costs
+
+  def get_cost(self, code: int, agent_type_id: int) -> int:
+    """
+    Returns the movement cost of a terrain code for an agent type.
+
+    Args:
+      code (int): The terrain code, lower than the number of codes of the table.
+      agent_type_id (int): The id of the agent type.
+
+    Returns:
+      int: The movement cost, or IMPASSABLE if the agent type cannot traverse the terrain.
+    """
+    return self.__costs[code * len(self.__agent_types) + agent_type_id]
+
+  def get_costs_for(self, agent_name: str) -> array:
+    """
+    Returns the column of the table of an agent type.
+
+    Args:
+      agent_name (str): The name of the agent type.
+
+    Returns:
+      array: The movement cost of every terrain code, IMPASSABLE for all of them if no terrain names the agent type.
+    """
+    agent_type_id: Optional[int] = self.__agent_type_ids.get(agent_name)
+    if agent_type_id is None:
+      return array('i', [TerrainCostTable.IMPASSABLE]) * self.__code_count
+    return self.__costs[agent_type_id::len(self.__agent_types)]
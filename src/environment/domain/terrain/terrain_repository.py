@@ -1,15 +1,21 @@
 import json
 import os
-from typing import Optional
+import sys
+from typing import Any, Optional
 
 from src.environment.domain.terrain.terrain import Terrain
+from src.environment.domain.terrain.terrain_cost_table import TerrainCostTable
 
 
 class TerrainRepository:
   """
   Class that handles loading and accessing terrain data.
 
+  The terrains are validated and normalized when they are loaded: codes become integers, movement costs become
+  non-negative integers or None, and the agent names are interned. Their costs are also kept in a TerrainCostTable.
+
   Attributes:
+    __cost_table (TerrainCostTable): The movement costs of the loaded terrains.
     __directory_path (str): The directory path where terrain files are stored.
     __terrain_dict (dict[int, Terrain]): A dictionary mapping terrain codes to Terrain objects.
   """
@@ -21,6 +27,7 @@ class TerrainRepository:
     Args:
       directory_path (str): The directory path where terrain files are stored.
     """
+    self.__cost_table: TerrainCostTable = TerrainCostTable([])
     self.__directory_path: str = directory_path
     self.__terrain_dict: dict[int, Terrain] = {}
 
@@ -28,21 +35,92 @@ class TerrainRepository:
     """
     Loads terrain data from the JSON file at the given path and stores it in the terrain_dict attribute.
 
+    Nothing is stored if any terrain of the file is invalid.
+
     Args:
       file_name (str): The name of the file to load without the directory path.
 
     Raises:
       FileNotFoundError: If the file at the given path does not exist.
+      ValueError: If a terrain code, display name, color or movement cost of the file is invalid.
     """
     with open(f'{self.__directory_path}/{file_name}') as file:
       terrain_data = json.load(file)
+    if not isinstance(terrain_data, dict):
+      raise ValueError(f'Terrain file {file_name} must contain an object of terrains by code.')
 
+    terrains: dict[int, Terrain] = {}
     for terrain_code, terrain_data in terrain_data.items():
-      self.__terrain_dict[int(terrain_code)] = Terrain(
-        terrain_code,
+      code: int = TerrainRepository.parse_code(terrain_code, file_name)
+      if not isinstance(terrain_data, dict):
+        raise ValueError(f'Terrain {code} of {file_name} must be an object.')
+      for key in ('color', 'display_name'):
+        if not isinstance(terrain_data.get(key), str):
+          raise ValueError(f'Terrain {code} of {file_name} must have a text {key}.')
+      movement_costs = terrain_data.get('movement_costs')
+      if not isinstance(movement_costs, dict):
+        raise ValueError(f'Terrain {code} of {file_name} must have an object of movement costs by agent.')
+      terrains[code] = Terrain(
+        code,
         terrain_data['color'],
         terrain_data['display_name'],
-        terrain_data['movement_costs'])
+        {sys.intern(str(agent_name)): TerrainRepository.parse_movement_cost(movement_cost, code, agent_name, file_name) for agent_name, movement_cost in movement_costs.items()})
+
+    self.__terrain_dict.update(terrains)
+    self.__cost_table = TerrainCostTable(list(self.__terrain_dict.values()))
+
+  @staticmethod
+  def parse_code(value: str, file_name: str) -> int:
+    """
+    Parses the code of a terrain.
+
+    Args:
+      value (str): The key of the terrain in the file.
+      file_name (str): The name of the file, for the error message.
+
+    Returns:
+      int: The code.
+
+    Raises:
+      ValueError: If the code is not a non-negative integer.
+    """
+    try:
+      code: int = int(value)
+    except ValueError:
+      raise ValueError(f'Invalid terrain code {value!r} in {file_name}.') from None
+    if code < 0:
+      raise ValueError(f'Invalid terrain code {value!r} in {file_name}.')
+    return code
+
+  @staticmethod
+  def parse_movement_cost(value: Any, code: int, agent_name: str, file_name: str) -> Optional[int]:
+    """
+    Normalizes a movement cost, which the files may write as a number or as the text of a number.
+
+    Args:
+      value (Any): The movement cost in the file.
+      code (int): The code of the terrain, for the error message.
+      agent_name (str): The name of the agent, for the error message.
+      file_name (str): The name of the file, for the error message.
+
+    Returns:
+      Optional[int]: The movement cost, or None if the agent cannot traverse the terrain.
+
+    Raises:
+      ValueError: If the movement cost is not null or a non-negative integer.
+    """
+    if value is None:
+      return None
+    movement_cost: Optional[int] = None
+    if isinstance(value, int) and not isinstance(value, bool):
+      movement_cost = value
+    elif isinstance(value, float) and value.is_integer():
+      movement_cost = int(value)
+    elif isinstance(value, str) and value.strip().isdigit():
+      movement_cost = int(value)
+    if movement_cost is None or movement_cost < 0:
+      raise ValueError(f'Invalid movement cost {value!r} of {agent_name} for terrain {code} in {file_name}.')
+    return movement_cost
 
   def get_all_from_directory(self) -> list[str]:
     """
@@ -73,3 +151,12 @@ class TerrainRepository:
       list[Terrain]: A list of all Terrain objects.
     """
     return list(self.__terrain_dict.values())
+
+  def get_cost_table(self) -> TerrainCostTable:
+    """
+    Returns the movement costs of the loaded terrains.
+
+    Returns:
+      TerrainCostTable: The cost table.
+    """
+    return self.__cost_table
@@ -1,25 +1,45 @@
+from typing import Sequence
+
+
 class Map:
   """Entity that represents a terrain map.
 
   Attributes:
-    __grid (list[list[int]]): 2D list representing the terrain grid.
+    __cells (Sequence[int]): Contiguous buffer with the terrain code of every cell, row after row.
     __rows (int): Number of rows in the map.
     __columns (int): Number of columns in the map
   """
 
-  def __init__(self, grid: list[list[int]], rows: int, columns: int):
+  def __init__(self, cells: Sequence[int], rows: int, columns: int):
     """
     Initializes a Map instance.
 
     Args:
+      cells (Sequence[int]): Contiguous buffer with the terrain code of every cell, row after row.
       rows (int): Number of rows in the map.
       columns (int): Number of columns in the map.
-      grid (list[list[int]]): 2D list representing the terrain grid.
     """
-    self.__grid = grid
+    self.__cells = cells
     self.__rows = rows
     self.__columns = columns
 
+  @staticmethod
+  def get_typecode_for(max_code: int) -> str:
+    """
+    Returns the smallest unsigned array typecode able to hold the given terrain code.
+
+    Args:
+      max_code (int): The greatest terrain code that must be stored.
+
+    Returns:
+      str: The array typecode.
+    """
+    if max_code < 1 << 8:
+      return 'B'
+    if max_code < 1 << 16:
+      return 'H'
+    return 'L'
+
   def get_rows(self) -> int:
     """
     Returns the number of rows in the map.
@@ -38,6 +58,15 @@ class Map:
     """
     return self.__columns
 
+  def get_cells(self) -> Sequence[int]:
+    """
+    Returns the buffer with the terrain code of every cell.
+
+    Returns:
+      Sequence[int]: The terrain codes, indexed by row * columns + column.
+    """
+    return self.__cells
+
   def get_cell(self, x: int, y: int) -> int:
     """
     Retrieves the value of a cell in the grid.
@@ -49,7 +78,7 @@ class Map:
     Returns:
       int: The value of the cell at the specified coordinates.
     """
-    return self.__grid[x][y]
+    return self.__cells[x * self.__columns + y]
 
   def print(self):
     """
@@ -64,7 +93,7 @@ class Map:
 
     for row in range(self.__rows):
       # Print row with values
-      print('│' + '│'.join([f' {str(cell)} ' for cell in self.__grid[row]]) + '│')
+      print('│' + '│'.join([f' {str(cell)} ' for cell in self.__cells[row * self.__columns:(row + 1) * self.__columns]]) + '│')
       # Print row separator
       if row != self.__rows - 1:
         print('├' + '┼'.join(['─' * 3] * self.__columns) + '┤')
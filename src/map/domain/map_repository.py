@@ -1,5 +1,9 @@
+import mmap
 import os
-from typing import Optional
+import struct
+import sys
+from array import array
+from typing import Callable, Optional, Sequence
 
 from src.map.domain.map import Map
 
@@ -8,9 +12,28 @@ class MapRepository:
   """
   Class that handles the loading and access to map data.
 
+  Maps are streamed from disk in chunks and parsed directly into a contiguous buffer of terrain codes, so the memory
+  needed to load a map is proportional to the resulting buffer and not to the size of intermediate Python lists.
+
+  Maps can also be compiled to a binary format, made of a little-endian header (magic, version, bytes per code, rows and
+  columns) followed by the raw codes, row after row. Binary maps are memory-mapped read-only, so they open in constant
+  time and their pages are shared by every process that opens them.
+
   Attributes:
+    BINARY_EXTENSION (str): The extension of the compiled binary maps.
+    CHUNK_SIZE (int): The number of bytes read from disk at once.
     __directory_path (str): The directory path where map files are stored.
   """
+  BINARY_EXTENSION: str = '.bmap'
+  CHUNK_SIZE: int = 1 << 18
+
+  __BINARY_HEADER: struct.Struct = struct.Struct('<4sBBxxII')
+  __BINARY_MAGIC: bytes = b'IAMP'
+  __BINARY_VERSION: int = 1
+  __BINARY_TYPECODES: dict[int, str] = {1: 'B', 2: 'H', 4: 'I'}
+
+  # Translates the ASCII digits to their numeric value, to convert rows of single digit codes in bulk.
+  __DIGITS: bytes = bytes.maketrans(b'0123456789', bytes(range(10)))
 
   def __init__(self, directory_path: str):
     """
@@ -31,31 +54,227 @@ class MapRepository:
     """
     return self.__map
 
-  def load_from_txt(self, file_path: str) -> None:
+  def load_from_txt(self, file_path: str, on_progress: Optional[Callable[[int, int], None]] = None) -> None:
     """
-    Loads a map from a text file.
+    Loads a map from a text file with the codes separated by whitespace.
 
     Args:
       file_path (str): The path to the text file.
+      on_progress (Optional[Callable[[int, int], None]]): Called after every chunk with the bytes read and the total bytes.
     """
-    with open(file_path) as file:
-      grid: list[list[int]] = [[int(cell) for cell in row.split()] for row in file]
-      rows: int = len(grid)
-      columns: int = len(grid[0]) if rows > 0 else 0
-      self.__map = Map(grid, rows, columns)
+    self.__map = self.__load_delimited(file_path, None, on_progress)
 
-  def load_from_csv(self, file_path: str) -> None:
+  def load_from_csv(self, file_path: str, on_progress: Optional[Callable[[int, int], None]] = None) -> None:
     """
     Loads a map from a CSV file.
 
     Args:
       file_path (str): The path to the CSV file.
+      on_progress (Optional[Callable[[int, int], None]]): Called after every chunk with the bytes read and the total bytes.
+    """
+    self.__map = self.__load_delimited(file_path, b',', on_progress)
+
+  def __load_delimited(self, file_path: str, separator: Optional[bytes], on_progress: Optional[Callable[[int, int], None]]) -> Map:
+    """
+    Streams a delimited map file in chunks, parsing its rows into a contiguous buffer of terrain codes.
+
+    Args:
+      file_path (str): The path to the file.
+      separator (Optional[bytes]): The separator of the codes in a row, or None for whitespace.
+      on_progress (Optional[Callable[[int, int], None]]): Called after every chunk with the bytes read and the total bytes.
+
+    Returns:
+      Map: The loaded map.
+
+    Raises:
+      ValueError: If a code is not a non-negative integer or the rows have different lengths.
+    """
+    codes: array = array('B')
+    rows: int = 0
+    columns: int = 0
+    with open(file_path, 'rb') as file:
+      total_bytes: int = os.fstat(file.fileno()).st_size
+      read_bytes: int = 0
+      pending: bytes = b''
+      while True:
+        chunk: bytes = file.read(self.CHUNK_SIZE)
+        if not chunk:
+          break
+        read_bytes += len(chunk)
+        block: bytes = pending + chunk
+        end: int = block.rfind(b'\n') + 1
+        pending = block[end:]
+        codes, rows, columns = self.__parse_block(block[:end], separator, codes, rows, columns)
+        if on_progress is not None:
+          on_progress(read_bytes, total_bytes)
+      codes, rows, columns = self.__parse_row(pending, separator, codes, rows, columns)
+    return Map(codes, rows, columns)
+
+  def __parse_block(self, block: bytes, separator: Optional[bytes], codes: array, rows: int, columns: int) -> tuple[array, int, int]:
+    """
+    Parses a block of complete rows of a delimited map file, appending their codes to the buffer.
+
+    When every row of the block has the expected number of single digit codes, the whole block is validated and
+    converted with a few bulk bytes operations. Otherwise, the rows are parsed one by one.
+
+    Args:
+      block (bytes): The rows to parse, each one terminated by a new line.
+      separator (Optional[bytes]): The separator of the codes in a row, or None for whitespace.
+      codes (array): The buffer of the codes parsed so far.
+      rows (int): The number of rows parsed so far.
+      columns (int): The number of columns of the map, or 0 if no row was parsed yet.
+
+    Returns:
+      tuple[array, int, int]: The buffer, the number of rows and the number of columns after parsing the block.
+
+    Raises:
+      ValueError: If a code is not a non-negative integer or the row lengths differ.
+    """
+    while columns == 0 and block:
+      line, _, block = block.partition(b'\n')
+      codes, rows, columns = self.__parse_row(line, separator, codes, rows, columns)
+    if columns > 0 and separator is not None and codes.typecode == 'B':
+      # Single digit codes sit at the even offsets and the separators and new lines at the odd ones.
+      row_separators: bytes = separator * (columns - 1) + b'\n'
+      block_rows, remainder = divmod(len(block), 2 * columns)
+      if remainder == 0 and block[1::2] == row_separators * block_rows:
+        digits: bytes = block[::2]
+        if digits.isdigit():
+          codes.frombytes(digits.translate(self.__DIGITS))
+          return codes, rows + block_rows, columns
+    for line in block.split(b'\n'):
+      codes, rows, columns = self.__parse_row(line, separator, codes, rows, columns)
+    return codes, rows, columns
+
+  def __parse_row(self, line: bytes, separator: Optional[bytes], codes: array, rows: int, columns: int) -> tuple[array, int, int]:
+    """
+    Parses a row of a delimited map file, appending its codes to the buffer.
+
+    Rows where every code is a single digit are converted in bulk, other rows are converted code by code. The buffer is
+    widened when a code does not fit in its typecode.
+
+    Args:
+      line (bytes): The row to parse.
+      separator (Optional[bytes]): The separator of the codes in the row, or None for whitespace.
+      codes (array): The buffer of the codes parsed so far.
+      rows (int): The number of rows parsed so far.
+      columns (int): The number of columns of the map, or 0 if no row was parsed yet.
+
+    Returns:
+      tuple[array, int, int]: The buffer, the number of rows and the number of columns after parsing the row.
+
+    Raises:
+      ValueError: If a code is not a non-negative integer or the row length differs from the previous rows.
+    """
+    line = line.strip()
+    if not line:
+      return codes, rows, columns
+
+    fields: list[bytes] = line.split(separator)
+    if rows > 0 and len(fields) != columns:
+      raise ValueError(f'Row {rows} has {len(fields)} columns, expected {columns}.')
+
+    digits: bytes = b''.join(fields)
+    if len(digits) == len(fields) and digits.isdigit():
+      if codes.typecode == 'B':
+        codes.frombytes(digits.translate(self.__DIGITS))
+      else:
+        codes.extend(digits.translate(self.__DIGITS))
+    else:
+      try:
+        values: list[int] = [int(field) for field in fields]
+      except ValueError as error:
+        raise ValueError(f'Row {rows} has an invalid terrain code.') from error
+      if min(values) < 0:
+        raise ValueError(f'Row {rows} has a negative terrain code.')
+      typecode: str = Map.get_typecode_for(max(values))
+      if array(typecode).itemsize > codes.itemsize:
+        codes = array(typecode, codes)
+      codes.extend(values)
+    return codes, rows + 1, len(fields)
+
+  def load_from_binary(self, file_path: str) -> None:
+    """
+    Loads a compiled binary map by memory-mapping it, the codes are read straight from the mapped pages.
+
+    Args:
+      file_path (str): The path to the binary file.
+
+    Raises:
+      ValueError: If the file is not a valid binary map.
+    """
+    with open(file_path, 'rb') as file:
+      mapped_file: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapped_file) < self.__BINARY_HEADER.size:
+      raise ValueError('Invalid binary map: truncated header.')
+    magic, version, itemsize, rows, columns = self.__BINARY_HEADER.unpack_from(mapped_file)
+    if magic != self.__BINARY_MAGIC or version != self.__BINARY_VERSION or itemsize not in self.__BINARY_TYPECODES:
+      raise ValueError('Invalid binary map: unsupported header.')
+    size: int = self.__BINARY_HEADER.size + rows * columns * itemsize
+    if len(mapped_file) != size:
+      raise ValueError(f'Invalid binary map: expected {size} bytes, found {len(mapped_file)}.')
+
+    typecode: str = self.__BINARY_TYPECODES[itemsize]
+    codes: memoryview = memoryview(mapped_file)[self.__BINARY_HEADER.size:].cast(typecode)
+    if itemsize > 1 and sys.byteorder != 'little':
+      swapped_codes: array = array(typecode, codes)
+      swapped_codes.byteswap()
+      self.__map = Map(swapped_codes, rows, columns)
+    else:
+      self.__map = Map(codes, rows, columns)
+
+  def save_as_binary(self, map: Map, file_path: str) -> None:
     """
-    with open(file_path) as file:
-      grid: list[list[int]] = [[int(cell) for cell in row.split(',')] for row in file]
-      rows: int = len(grid)
-      columns: int = len(grid[0]) if rows > 0 else 0
-      self.__map = Map(grid, rows, columns)
+    Writes a map to a file in the compiled binary format.
+
+    The file is written next to the target and then renamed over it, so maps already memory-mapped from the previous
+    version keep reading its pages instead of a truncated file.
+
+    Args:
+      map (Map): The map to write.
+      file_path (str): The path of the binary file.
+
+    Raises:
+      ValueError: If a terrain code does not fit in 32 bits.
+    """
+    cells: Sequence[int] = map.get_cells()
+    max_code: int = max(cells, default=0)
+    if max_code >= 1 << 32:
+      raise ValueError(f'Terrain code {max_code} does not fit in a binary map.')
+    typecode: str = Map.get_typecode_for(max_code)
+    if typecode == 'L':
+      typecode = 'I'
+    codes: array = array(typecode)
+    if isinstance(cells, (array, memoryview)) and codes.itemsize == cells.itemsize:
+      codes.frombytes(cells)
+    else:
+      codes = array(typecode, cells)
+    if codes.itemsize > 1 and sys.byteorder != 'little':
+      codes.byteswap()
+
+    temporary_file_path: str = f'{file_path}.{os.getpid()}.tmp'
+    with open(temporary_file_path, 'wb') as file:
+      file.write(self.__BINARY_HEADER.pack(self.__BINARY_MAGIC, self.__BINARY_VERSION, codes.itemsize, map.get_rows(), map.get_columns()))
+      codes.tofile(file)
+    os.replace(temporary_file_path, file_path)
+
+  def compile(self, name: str) -> str:
+    """
+    Converts a CSV or text map of the directory to the compiled binary format, next to the original file.
+
+    Args:
+      name (str): The name of the map file.
+
+    Returns:
+      str: The name of the compiled binary map.
+
+    Raises:
+      ValueError: If the file format is unsupported.
+    """
+    self.load(name)
+    binary_name: str = os.path.splitext(name)[0] + self.BINARY_EXTENSION
+    self.save_as_binary(self.__map, f'{self.__directory_path}/{binary_name}')
+    return binary_name
 
   def list_all_from_directory(self) -> list[str]:
     """
@@ -66,25 +285,36 @@ class MapRepository:
     """
     return os.listdir(self.__directory_path)
 
-  def load(self, name: str) -> None:
+  def load(self, name: str, on_progress: Optional[Callable[[int, int], None]] = None) -> None:
     """
     Loads a map by its name.
 
+    CSV and text maps are read from their compiled binary version when it exists and is up to date.
+
     Args:
       name (str): The name of the map file.
-
-    Returns:
-      Map: An instance of the Map class with the loaded data.
+      on_progress (Optional[Callable[[int, int], None]]): Called while loading with the bytes read and the total bytes.
 
     Raises:
       ValueError: If the file format is unsupported.
     """
     file_path: str = f"{self.__directory_path}/{name}"
-    file_extension: str = os.path.splitext(file_path)[1]
+    file_stem, file_extension = os.path.splitext(file_path)
+
+    # A compiled version of a CSV or text map is preferred while it is not older than the original file.
+    binary_file_path: str = file_stem + self.BINARY_EXTENSION
+    if file_extension in ('.txt', '.csv') and os.path.isfile(binary_file_path) and os.path.getmtime(binary_file_path) >= os.path.getmtime(file_path):
+      file_path = binary_file_path
+      file_extension = self.BINARY_EXTENSION
 
-    if file_extension == '.txt':
-      self.load_from_txt(file_path)
+    if file_extension == self.BINARY_EXTENSION:
+      self.load_from_binary(file_path)
+      if on_progress is not None:
+        size: int = os.path.getsize(file_path)
+        on_progress(size, size)
+    elif file_extension == '.txt':
+      self.load_from_txt(file_path, on_progress)
     elif file_extension == '.csv':
-      self.load_from_csv(file_path)
+      self.load_from_csv(file_path, on_progress)
     else:
       raise ValueError("Unsupported file format")
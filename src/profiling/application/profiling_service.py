@@ -0,0 +1,195 @@
+import functools
+import inspect
+import time
+from typing import Callable, Optional
+
+from src.environment.application.environment_agent_service import EnvironmentAgentService
+from src.environment.application.environment_service import EnvironmentService
+from src.map.domain.map_repository import MapRepository
+from src.profiling.domain.profiling_registry import ProfilingRegistry
+
+
+class ProfilingTarget:
+  """
+  A method whose calls are timed while profiling is enabled.
+
+  Attributes:
+    __installed (bool): Whether the wrapper replaces the method.
+    __method_name (str): The name of the method.
+    __operation (str): The name of the timer of the method.
+    __original (Optional[Callable]): The method defined by the owner itself, None if it is inherited, while it is instrumented.
+    __owner (type): The class that has the method.
+  """
+
+  def __init__(self, owner: type, method_name: str, operation: str):
+    """
+    Initializes a ProfilingTarget instance, not instrumented.
+
+    Args:
+      owner (type): The class that has the method.
+      method_name (str): The name of the method.
+      operation (str): The name of the timer of the method.
+
+    Raises:
+      ValueError: If the class has no such method.
+    """
+    if not callable(getattr(owner, method_name, None)):
+      raise ValueError(f'{owner.__name__} has no method {method_name}.')
+    self.__installed: bool = False
+    self.__method_name: str = method_name
+    self.__operation: str = operation
+    self.__original: Optional[Callable] = None
+    self.__owner: type = owner
+
+  def get_operation(self) -> str:
+    """
+    Returns the name of the timer of the method.
+
+    Returns:
+      str: The name of the timer.
+    """
+    return self.__operation
+
+  def install(self, registry: ProfilingRegistry) -> None:
+    """
+    Replaces the method of the class with a wrapper that records the latency of every call in the timer of the method.
+    Static and class methods are wrapped in the same kind of method, so they are still called the same way.
+
+    Args:
+      registry (ProfilingRegistry): The registry of the timer.
+    """
+    if self.__installed:
+      return
+    descriptor: object = inspect.getattr_static(self.__owner, self.__method_name)
+    method_type: Optional[type] = type(descriptor) if isinstance(descriptor, (staticmethod, classmethod)) else None
+    method: Callable = descriptor.__func__ if method_type is not None else getattr(self.__owner, self.__method_name)
+    record: Callable[[int], None] = registry.get_timer(self.__operation).record
+    perf_counter_ns: Callable[[], int] = time.perf_counter_ns
+
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+      start: int = perf_counter_ns()
+      try:
+        return method(*args, **kwargs)
+      finally:
+        record(perf_counter_ns() - start)
+
+    self.__original = self.__owner.__dict__.get(self.__method_name)
+    setattr(self.__owner, self.__method_name, method_type(timed) if method_type is not None else timed)
+    self.__installed = True
+
+  def uninstall(self) -> None:
+    """
+    Restores the method of the class, so its calls no longer go through the wrapper.
+    """
+    if not self.__installed:
+      return
+    if self.__original is None:
+      delattr(self.__owner, self.__method_name)
+    else:
+      setattr(self.__owner, self.__method_name, self.__original)
+    self.__original = None
+    self.__installed = False
+
+
+class ProfilingService:
+  """
+  Service class for timing the calls of the methods that dominate the responsiveness of a session.
+
+  Profiling is switched at runtime: enabling it replaces every target method of its class with a timing wrapper, and
+  disabling it restores the original methods, so disabled profiling has no cost at all on the calls. The timers stay in
+  the registry between switches until they are reset.
+
+  The actions, sensors, environment creation and map loading are profiled by default; other methods, such as the
+  ones of the user interface, are added with add_target.
+
+  Attributes:
+    __enabled (bool): Whether the targets are instrumented.
+    __registry (ProfilingRegistry): The registry of the timers.
+    __targets (list[ProfilingTarget]): The methods to time.
+  """
+
+  def __init__(self, registry: Optional[ProfilingRegistry] = None):
+    """
+    Initializes a ProfilingService instance with the default targets, disabled.
+
+    Args:
+      registry (Optional[ProfilingRegistry]): The registry of the timers, a new one if None.
+    """
+    self.__enabled: bool = False
+    self.__registry: ProfilingRegistry = registry if registry is not None else ProfilingRegistry()
+    self.__targets: list[ProfilingTarget] = [
+      ProfilingTarget(EnvironmentAgentService, 'execute_action', 'environment_agent_service.execute_action'),
+      ProfilingTarget(EnvironmentAgentService, 'execute_sensor', 'environment_agent_service.execute_sensor'),
+      ProfilingTarget(EnvironmentService, 'set_environment', 'environment_service.set_environment'),
+      ProfilingTarget(MapRepository, 'load', 'map_repository.load')
+    ]
+
+  def get_registry(self) -> ProfilingRegistry:
+    """
+    Returns the registry of the timers.
+
+    Returns:
+      ProfilingRegistry: The registry.
+    """
+    return self.__registry
+
+  def is_enabled(self) -> bool:
+    """
+    Checks if profiling is enabled.
+
+    Returns:
+      bool: True if the targets are instrumented, False otherwise.
+    """
+    return self.__enabled
+
+  def add_target(self, owner: type, method_name: str, operation: Optional[str] = None) -> None:
+    """
+    Adds a method to time, instrumenting it right away if profiling is enabled.
+
+    Args:
+      owner (type): The class that has the method.
+      method_name (str): The name of the method.
+      operation (Optional[str]): The name of the timer of the method, the class and method names if None.
+
+    Raises:
+      ValueError: If the class has no such method.
+    """
+    target: ProfilingTarget = ProfilingTarget(owner, method_name, operation or f'{owner.__name__}.{method_name}')
+    self.__targets.append(target)
+    if self.__enabled:
+      target.install(self.__registry)
+
+  def enable(self) -> None:
+    """
+    Instruments every target.
+    """
+    for target in self.__targets:
+      target.install(self.__registry)
+    self.__enabled = True
+
+  def disable(self) -> None:
+    """
+    Restores every target, in the reverse order of their instrumentation.
+    """
+    for target in reversed(self.__targets):
+      target.uninstall()
+    self.__enabled = False
+
+  def export_json(self) -> str:
+    """
+    Exports a snapshot of the timers as a JSON document.
+
+    Returns:
+      str: The document, with the latencies in nanoseconds.
+    """
+    return self.__registry.to_json()
+
+  def export_prometheus(self) -> str:
+    """
+    Exports a snapshot of the timers in the Prometheus text exposition format.
+
+    Returns:
+      str: The text dump, with the latencies in seconds.
+    """
+    return self.__registry.to_prometheus()
@@ -0,0 +1,131 @@
+import math
+from array import array
+
+
+class CallTimer:
+  """
+  Accumulates the latencies of the calls of an operation: their count, their total and maximum, and the latest ones for
+  the percentiles.
+
+  Only the latest SAMPLE_LIMIT latencies are kept, in a preallocated ring, so recording a call takes constant time and
+  memory however long the session runs, and the percentiles describe the recent behaviour of the operation.
+
+  Attributes:
+    SAMPLE_LIMIT (int): The number of latest latencies kept for the percentiles.
+    __count (int): The number of recorded calls.
+    __max (int): The maximum latency in nanoseconds.
+    __name (str): The name of the operation.
+    __next_sample (int): The position of the ring where the next latency is written.
+    __samples (array): The latest latencies in nanoseconds, as a ring.
+    __total (int): The sum of the latencies in nanoseconds.
+  """
+  SAMPLE_LIMIT: int = 1024
+
+  def __init__(self, name: str):
+    """
+    Initializes a CallTimer instance without calls.
+
+    Args:
+      name (str): The name of the operation.
+    """
+    self.__count: int = 0
+    self.__max: int = 0
+    self.__name: str = name
+    self.__next_sample: int = 0
+    self.__samples: array = array('q', [0]) * CallTimer.SAMPLE_LIMIT
+    self.__total: int = 0
+
+  def record(self, latency: int) -> None:
+    """
+    Records the latency of a call.
+
+    Args:
+      latency (int): The latency in nanoseconds.
+    """
+    self.__count += 1
+    self.__total += latency
+    if latency > self.__max:
+      self.__max = latency
+    self.__samples[self.__next_sample] = latency
+    self.__next_sample = (self.__next_sample + 1) % CallTimer.SAMPLE_LIMIT
+
+  def reset(self) -> None:
+    """
+    Discards the recorded calls.
+    """
+    self.__count = 0
+    self.__max = 0
+    self.__next_sample = 0
+    self.__total = 0
+
+  def get_name(self) -> str:
+    """
+    Returns the name of the operation.
+
+    Returns:
+      str: The name of the operation.
+    """
+    return self.__name
+
+  def get_count(self) -> int:
+    """
+    Returns the number of recorded calls.
+
+    Returns:
+      int: The number of calls.
+    """
+    return self.__count
+
+  def get_total(self) -> int:
+    """
+    Returns the sum of the latencies of the recorded calls.
+
+    Returns:
+      int: The cumulative latency in nanoseconds.
+    """
+    return self.__total
+
+  def get_max(self) -> int:
+    """
+    Returns the maximum latency of the recorded calls.
+
+    Returns:
+      int: The latency in nanoseconds, 0 without calls.
+    """
+    return self.__max
+
+  def get_percentiles(self, percentiles: list[float]) -> list[int]:
+    """
+    Returns latency percentiles of the latest calls, using the nearest-rank method.
+
+    Args:
+      percentiles (list[float]): The percentiles, between 0 and 100.
+
+    Returns:
+      list[int]: The latencies in nanoseconds, in the order of the percentiles, 0 without calls.
+    """
+    samples: list[int] = sorted(self.__samples[:min(self.__count, CallTimer.SAMPLE_LIMIT)])
+    if not samples:
+      return [0 for _ in percentiles]
+    return [samples[min(len(samples), max(1, math.ceil(len(samples) * percentile / 100))) - 1] for percentile in percentiles]
+
+  def to_dict(self) -> dict[str, any]:
+    """
+    Converts the timer to a dictionary that can be serialized to JSON.
+
+    Returns:
+      dict[str, any]: The timer, with the latencies in nanoseconds.
+    """
+    p50, p90, p99 = self.get_percentiles([50, 90, 99])
+    return {
+      'operation': self.__name,
+      'calls': self.__count,
+      'latency_ns': {
+        'total': self.__total,
+        'mean': self.__total / self.__count if self.__count > 0 else 0,
+        'p50': p50,
+        'p90': p90,
+        'p99': p99,
+        'max': self.__max
+      }
+    }
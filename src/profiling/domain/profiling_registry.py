@@ -0,0 +1,86 @@
+import json
+import time
+from typing import Optional
+
+from src.profiling.domain.call_timer import CallTimer
+
+
+class ProfilingRegistry:
+  """
+  Keeps the call timer of every profiled operation and exports snapshots of them.
+
+  Attributes:
+    PROMETHEUS_QUANTILES (list[float]): The quantiles exported in the Prometheus text format.
+    __timers (dict[str, CallTimer]): The timer of every operation, by name, in order of creation.
+  """
+  PROMETHEUS_QUANTILES: list[float] = [0.5, 0.9, 0.99]
+
+  def __init__(self):
+    """
+    Initializes a ProfilingRegistry instance without timers.
+    """
+    self.__timers: dict[str, CallTimer] = {}
+
+  def get_timer(self, name: str) -> CallTimer:
+    """
+    Returns the timer of an operation, creating it the first time it is requested.
+
+    Args:
+      name (str): The name of the operation.
+
+    Returns:
+      CallTimer: The timer.
+    """
+    timer: Optional[CallTimer] = self.__timers.get(name)
+    if timer is None:
+      timer = CallTimer(name)
+      self.__timers[name] = timer
+    return timer
+
+  def get_timers(self) -> list[CallTimer]:
+    """
+    Returns the timers of every operation.
+
+    Returns:
+      list[CallTimer]: The timers, in order of creation.
+    """
+    return list(self.__timers.values())
+
+  def reset(self) -> None:
+    """
+    Discards the recorded calls of every operation.
+    """
+    for timer in self.__timers.values():
+      timer.reset()
+
+  def to_json(self) -> str:
+    """
+    Exports a snapshot of the timers as a JSON document.
+
+    Returns:
+      str: The document, with the time of the snapshot and the timers, with the latencies in nanoseconds.
+    """
+    return json.dumps({'timestamp': time.time(), 'timers': [timer.to_dict() for timer in self.__timers.values()]}, indent=2)
+
+  def to_prometheus(self, metric_name: str = 'ia_call_latency_seconds') -> str:
+    """
+    Exports a snapshot of the timers as a summary in the Prometheus text exposition format.
+
+    Args:
+      metric_name (str): The name of the metric, labeled with the operation of every timer.
+
+    Returns:
+      str: The text dump, with the latencies in seconds.
+    """
+    lines: list[str] = [
+      f'# HELP {metric_name} Latency of the profiled calls.',
+      f'# TYPE {metric_name} summary'
+    ]
+    for timer in self.__timers.values():
+      operation: str = timer.get_name().replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+      percentiles: list[int] = timer.get_percentiles([quantile * 100 for quantile in ProfilingRegistry.PROMETHEUS_QUANTILES])
+      for quantile, latency in zip(ProfilingRegistry.PROMETHEUS_QUANTILES, percentiles):
+        lines.append(f'{metric_name}{{operation="{operation}",quantile="{quantile}"}} {latency / 1e9:.9f}')
+      lines.append(f'{metric_name}_sum{{operation="{operation}"}} {timer.get_total() / 1e9:.9f}')
+      lines.append(f'{metric_name}_count{{operation="{operation}"}} {timer.get_count()}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,219 @@
+import math
+import os
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.agent import Agent
+from src.agent.domain.default_agents import DefaultAgents
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.application.environment_agent_service import EnvironmentAgentService
+from src.environment.application.environment_service import EnvironmentService
+from src.environment.application.path_planning_service import PathPlanningService
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
+from src.environment.domain.terrain.terrain_repository import TerrainRepository
+from src.map.domain.map import Map
+from src.map.domain.map_repository import MapRepository
+from src.position.domain.position import Position
+from src.simulation.application.exploration_policy import ExplorationPolicy
+from src.simulation.application.path_following_policy import PathFollowingPolicy
+from src.simulation.application.replanning_policy import ReplanningPolicy
+from src.simulation.domain.episode_configuration import EpisodeConfiguration
+from src.simulation.domain.episode_result import EpisodeResult
+from src.simulation.domain.policy import Policy
+from src.simulation.domain.policy_repository import PolicyRepository
+from src.simulation.domain.random_walk_policy import RandomWalkPolicy
+from src.simulation.domain.simulation_summary import SimulationSummary
+
+
+class BatchSimulationService:
+  """
+  Service class for running episodes without the user interface and aggregating their results.
+
+  Every episode gets a fresh environment with a single agent, driven by a policy through the EnvironmentAgentService.
+  The grid of every map and terrain pair is built once per process and shared by the episodes that use it. Large
+  batches are split in chunks and fanned out over a pool of processes.
+
+  Attributes:
+    __environment_agent_service (EnvironmentAgentService): Service for executing the actions and sensors.
+    __grids (dict[tuple[str, str], Grid]): The grids built so far, by map name and terrain name.
+    __map_directory_path (str): The directory path where map files are stored.
+    __policy_repository (PolicyRepository): Repository for retrieving the policies.
+    __terrain_directory_path (str): The directory path where terrain files are stored.
+  """
+  __worker: Optional['BatchSimulationService'] = None
+
+  def __init__(self, map_directory_path: str, terrain_directory_path: str):
+    """
+    Initializes a BatchSimulationService instance with the default actions, sensors and policies.
+
+    Args:
+      map_directory_path (str): The directory path where map files are stored.
+      terrain_directory_path (str): The directory path where terrain files are stored.
+    """
+    action_repository = DefaultAgents.create_action_repository()
+    self.__environment_agent_service: EnvironmentAgentService = EnvironmentAgentService(action_repository, DefaultAgents.create_sensor_repository())
+    self.__grids: dict[tuple[str, str], Grid] = {}
+    self.__map_directory_path: str = map_directory_path
+    self.__policy_repository: PolicyRepository = PolicyRepository()
+    self.__policy_repository.add_policies(
+      RandomWalkPolicy(),
+      PathFollowingPolicy(action_repository, PathPlanningService()),
+      ReplanningPolicy(action_repository),
+      ExplorationPolicy(action_repository))
+    self.__terrain_directory_path: str = terrain_directory_path
+
+  def get_policy_repository(self) -> PolicyRepository:
+    """
+    Returns the repository of the policies available to the episodes.
+
+    Returns:
+      PolicyRepository: The policy repository.
+    """
+    return self.__policy_repository
+
+  def get_grid(self, map_name: str, terrain_name: str) -> Grid:
+    """
+    Returns the grid of a map and terrain pair, building it on the first request. The grid is shared by the episodes,
+    which run over views of it so their changes never reach it.
+
+    Args:
+      map_name (str): The name of the map file.
+      terrain_name (str): The name of the terrain file.
+
+    Returns:
+      Grid: The grid of the map.
+
+    Raises:
+      ValueError: If the map format is unsupported or a terrain code of the map is unknown.
+    """
+    grid: Optional[Grid] = self.__grids.get((map_name, terrain_name))
+    if grid is None:
+      map_repository: MapRepository = MapRepository(self.__map_directory_path)
+      map_repository.load(map_name)
+      terrain_repository: TerrainRepository = TerrainRepository(self.__terrain_directory_path)
+      terrain_repository.load(terrain_name)
+      map: Map = map_repository.get_map()
+      grid = EnvironmentService(map_repository, terrain_repository).create_grid_from_map(map)
+      self.__grids[(map_name, terrain_name)] = grid
+    return grid
+
+  def run_episode(self, configuration: EpisodeConfiguration) -> EpisodeResult:
+    """
+    Runs an episode until the agent reaches its finish position, the policy stops or the step limit is hit.
+
+    Args:
+      configuration (EpisodeConfiguration): The configuration of the episode.
+
+    Returns:
+      EpisodeResult: The result of the episode.
+
+    Raises:
+      ValueError: If the policy is unknown or a position of the episode is out of bounds.
+    """
+    policy: Optional[Policy] = self.__policy_repository.get_policy(configuration.get_policy_identifier())
+    if policy is None:
+      raise ValueError(f'Policy {configuration.get_policy_identifier()} not found.')
+
+    grid: Grid = self.get_grid(configuration.get_map_name(), configuration.get_terrain_name())
+    rows: int = grid.get_rows()
+    columns: int = grid.get_columns()
+    environment: Environment = Environment([], [[False for _ in range(columns)] for _ in range(rows)], grid.create_view(), rows, columns)
+    start: Position = configuration.get_start()
+    finish: Position = configuration.get_finish()
+    for position in (start, finish):
+      if not environment.contains(position.get_x(), position.get_y()):
+        raise ValueError(f'Position {position} is out of bounds.')
+
+    agent: Agent = DefaultAgents.create_agent(configuration.get_agent_name(), columns, rows)
+    agent.update_position(start.get_x(), start.get_y())
+    agent.set_finish_position(finish.get_x(), finish.get_y())
+    environment.add_agent(agent)
+
+    policy.start_episode(agent, environment, configuration.get_seed())
+    decisions: int = 0
+    while decisions < configuration.get_max_steps() and not agent.is_at_finish_position():
+      decision: Optional[Union[ActionConfiguration, SensorConfiguration]] = policy.decide(agent, environment)
+      if decision is None:
+        break
+      if isinstance(decision, ActionConfiguration):
+        self.__environment_agent_service.execute_action(agent, environment, decision)
+      else:
+        self.__environment_agent_service.execute_sensor(agent, environment, decision)
+      decisions += 1
+    return EpisodeResult(configuration, agent.get_steps(), agent.get_accumulated_movement_cost(), agent.is_at_finish_position(), decisions)
+
+  def run_episodes(self, configurations: list[EpisodeConfiguration]) -> list[EpisodeResult]:
+    """
+    Runs episodes one after the other in the current process.
+
+    Args:
+      configurations (list[EpisodeConfiguration]): The configurations of the episodes.
+
+    Returns:
+      list[EpisodeResult]: The results, in the order of the configurations.
+    """
+    return [self.run_episode(configuration) for configuration in configurations]
+
+  def run(self, configurations: list[EpisodeConfiguration], workers: Optional[int] = None, chunk_size: Optional[int] = None) -> list[EpisodeResult]:
+    """
+    Runs a batch of episodes, spreading them over a pool of processes.
+
+    Args:
+      configurations (list[EpisodeConfiguration]): The configurations of the episodes.
+      workers (Optional[int]): The number of processes, 1 runs the episodes in the current process. Defaults to the
+        number of CPUs.
+      chunk_size (Optional[int]): The number of episodes sent to a process at once. Defaults to a quarter of the
+        episodes of every process, to balance the load without paying the inter-process overhead per episode.
+
+    Returns:
+      list[EpisodeResult]: The results, in the order of the configurations.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(configurations) <= 1:
+      return self.run_episodes(configurations)
+
+    # Imported here so runs in the current process do not pay for loading the multiprocessing machinery.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = chunk_size or max(1, math.ceil(len(configurations) / (workers * 4)))
+    chunks: list[list[EpisodeConfiguration]] = [configurations[start:start + chunk_size] for start in range(0, len(configurations), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=BatchSimulationService.initialize_worker, initargs=(self.__map_directory_path, self.__terrain_directory_path)) as executor:
+      return [result for results in executor.map(BatchSimulationService.run_worker_chunk, chunks) for result in results]
+
+  def simulate(self, configurations: list[EpisodeConfiguration], workers: Optional[int] = None) -> SimulationSummary:
+    """
+    Runs a batch of episodes and aggregates their results.
+
+    Args:
+      configurations (list[EpisodeConfiguration]): The configurations of the episodes.
+      workers (Optional[int]): The number of processes, 1 runs the episodes in the current process.
+
+    Returns:
+      SimulationSummary: The summary of the results.
+    """
+    return SimulationSummary(self.run(configurations, workers))
+
+  @staticmethod
+  def initialize_worker(map_directory_path: str, terrain_directory_path: str) -> None:
+    """
+    Creates the service of a worker process, which keeps its grids between chunks.
+
+    Args:
+      map_directory_path (str): The directory path where map files are stored.
+      terrain_directory_path (str): The directory path where terrain files are stored.
+    """
+    BatchSimulationService.__worker = BatchSimulationService(map_directory_path, terrain_directory_path)
+
+  @staticmethod
+  def run_worker_chunk(configurations: list[EpisodeConfiguration]) -> list[EpisodeResult]:
+    """
+    Runs a chunk of episodes with the service of the worker process.
+
+    Args:
+      configurations (list[EpisodeConfiguration]): The configurations of the episodes.
+
+    Returns:
+      list[EpisodeResult]: The results, in the order of the configurations.
+    """
+    return BatchSimulationService.__worker.run_episodes(configurations)
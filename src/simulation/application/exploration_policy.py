@@ -0,0 +1,142 @@
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.action_repository import ActionRepository
+from src.agent.domain.agent import Agent
+from src.agent.domain.frontier_set import FrontierSet
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.domain.environment import Environment
+from src.environment.domain.grid.grid import Grid
+from src.position.domain.position import Position
+from src.simulation.application.path_following_policy import PathFollowingPolicy
+from src.simulation.domain.policy import Policy
+
+
+class ExplorationPolicy(Policy):
+  """
+  Policy that explores the environment autonomously, moving to the frontier of the knowledge of the agent and using the
+  sensor there.
+
+  The sensor is used wherever the agent has unknown neighbours, including its start position even if the agent could
+  not stand there. The target is the frontier cell with the least movement cost from the agent through the cells it knows. The path to
+  the target is kept until the target leaves the frontier, so the search only runs when a target is explored. Frontier
+  cells where the sensor did not reveal every neighbour are not targeted again. The episode ends when no frontier cell
+  can be reached.
+
+  Attributes:
+    IDENTIFIER (str): The identifier of the exploration policy.
+    __action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+    __exhausted_cells (set[int]): The cells where the sensor was already used, indexed by y * columns + x.
+    __frontier (Optional[FrontierSet]): The frontier of the episode.
+    __remaining_positions (deque[Position]): The positions of the path to the target not reached yet, starting with the current one.
+    __sensor_identifier (str): The identifier of the sensor used on the frontier.
+    __target (Optional[int]): The frontier cell the agent is moving to.
+  """
+  IDENTIFIER: str = 'exploration'
+
+  def __init__(self, action_repository: ActionRepository, sensor_identifier: str = 'every_direction'):
+    """
+    Initializes an ExplorationPolicy instance.
+
+    Args:
+      action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+      sensor_identifier (str): The identifier of the sensor used on the frontier.
+    """
+    super().__init__(ExplorationPolicy.IDENTIFIER)
+    self.__action_repository: ActionRepository = action_repository
+    self.__exhausted_cells: set[int] = set()
+    self.__frontier: Optional[FrontierSet] = None
+    self.__remaining_positions: deque[Position] = deque()
+    self.__sensor_identifier: str = sensor_identifier
+    self.__target: Optional[int] = None
+
+  def start_episode(self, agent: Agent, environment: Environment, seed: int) -> None:
+    """
+    Creates the frontier of the episode.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+      seed (int): The seed of the episode, unused because the policy is deterministic.
+    """
+    self.__exhausted_cells = set()
+    self.__frontier = FrontierSet(agent, environment.get_movement_costs_for(agent.get_name()), environment.get_rows(), environment.get_columns())
+    self.__remaining_positions = deque()
+    self.__target = None
+
+  def decide(self, agent: Agent, environment: Environment) -> Optional[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Decides the next action or sensor of the agent.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[Union[ActionConfiguration, SensorConfiguration]]: The sensor, the move towards the target, or None if no
+      frontier cell can be reached.
+    """
+    self.__frontier.update()
+    frontier: set[int] = self.__frontier.get_cells()
+    columns: int = environment.get_columns()
+    current: int = agent.get_y() * columns + agent.get_x()
+    if current not in self.__exhausted_cells and self.__frontier.has_unknown_neighbours(current):
+      self.__exhausted_cells.add(current)
+      return agent.get_sensor(self.__sensor_identifier)
+
+    current_position: Position = Position(agent.get_x(), agent.get_y())
+    while len(self.__remaining_positions) > 0 and self.__remaining_positions[0] != current_position:
+      self.__remaining_positions.popleft()
+    if self.__target not in frontier or self.__target in self.__exhausted_cells or len(self.__remaining_positions) < 2:
+      self.__target = self.find_target(agent, environment)
+      if self.__target is None:
+        return None
+    return PathFollowingPolicy.get_move_to(self.__action_repository, agent, self.__remaining_positions[1])
+
+  def find_target(self, agent: Agent, environment: Environment) -> Optional[int]:
+    """
+    Runs Dijkstra from the agent through the cells it knows until it reaches a frontier cell not exhausted yet, and
+    keeps the path to it.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[int]: The frontier cell, indexed by y * columns + x, or None if none can be reached.
+    """
+    rows: int = environment.get_rows()
+    columns: int = environment.get_columns()
+    movement_costs: array = environment.get_movement_costs_for(agent.get_name())
+    frontier: set[int] = self.__frontier.get_cells()
+    start: int = agent.get_y() * columns + agent.get_x()
+    distances: dict[int, int] = {start: 0}
+    parents: dict[int, int] = {start: -1}
+    open_set: list[tuple[int, int]] = [(0, start)]
+    while open_set:
+      distance, node = heappop(open_set)
+      if distance > distances[node]:
+        continue
+      if node != start and node in frontier and node not in self.__exhausted_cells:
+        target: int = node
+        path: list[Position] = []
+        while node != -1:
+          path.append(Position(node % columns, node // columns))
+          node = parents[node]
+        path.reverse()
+        self.__remaining_positions = deque(path)
+        return target
+      y, x = divmod(node, columns)
+      for neighbour, inside in ((node - 1, x > 0), (node + 1, x < columns - 1), (node - columns, y > 0), (node + columns, y < rows - 1)):
+        if not inside or movement_costs[neighbour] == Grid.IMPASSABLE or not agent.is_known(neighbour % columns, neighbour // columns):
+          continue
+        neighbour_distance: int = distance + movement_costs[neighbour]
+        if neighbour_distance < distances.get(neighbour, neighbour_distance + 1):
+          distances[neighbour] = neighbour_distance
+          parents[neighbour] = node
+          heappush(open_set, (neighbour_distance, neighbour))
+    self.__remaining_positions = deque()
+    return None
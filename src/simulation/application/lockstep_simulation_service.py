@@ -0,0 +1,195 @@
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.application.environment_agent_service import EnvironmentAgentService
+from src.environment.domain.environment import Environment
+from src.simulation.domain.policy import Policy
+
+
+class TickReport:
+  """
+  Summary of a tick of a lockstep simulation.
+
+  Attributes:
+    __actions (int): The number of actions executed in the tick.
+    __active_agents (int): The number of agents that had not reached their finish position at the start of the tick.
+    __goals_reached (int): The number of agents that reached their finish position in the tick.
+    __sensors (int): The number of sensors executed in the tick.
+    __tick (int): The number of the tick, starting at 1.
+  """
+
+  def __init__(self, tick: int, active_agents: int, actions: int, sensors: int, goals_reached: int):
+    """
+    Initializes a TickReport instance.
+
+    Args:
+      tick (int): The number of the tick, starting at 1.
+      active_agents (int): The number of agents that had not reached their finish position at the start of the tick.
+      actions (int): The number of actions executed in the tick.
+      sensors (int): The number of sensors executed in the tick.
+      goals_reached (int): The number of agents that reached their finish position in the tick.
+    """
+    self.__actions: int = actions
+    self.__active_agents: int = active_agents
+    self.__goals_reached: int = goals_reached
+    self.__sensors: int = sensors
+    self.__tick: int = tick
+
+  def get_tick(self) -> int:
+    """
+    Returns the number of the tick.
+
+    Returns:
+      int: The number of the tick, starting at 1.
+    """
+    return self.__tick
+
+  def get_active_agents(self) -> int:
+    """
+    Returns the number of agents that had not reached their finish position at the start of the tick.
+
+    Returns:
+      int: The number of active agents.
+    """
+    return self.__active_agents
+
+  def get_actions(self) -> int:
+    """
+    Returns the number of actions executed in the tick.
+
+    Returns:
+      int: The number of actions.
+    """
+    return self.__actions
+
+  def get_sensors(self) -> int:
+    """
+    Returns the number of sensors executed in the tick.
+
+    Returns:
+      int: The number of sensors.
+    """
+    return self.__sensors
+
+  def get_goals_reached(self) -> int:
+    """
+    Returns the number of agents that reached their finish position in the tick.
+
+    Returns:
+      int: The number of agents.
+    """
+    return self.__goals_reached
+
+
+class LockstepSimulationService:
+  """
+  Service class for advancing every agent of an environment in lockstep.
+
+  In every tick, the policy of every active agent decides against the state at the start of the tick. Then the
+  sensors are executed, since they only add knowledge, and finally the actions are resolved in batches of agents that
+  requested the same action configuration. Agents at their finish position are no longer active.
+
+  Attributes:
+    __environment (Environment): The environment in which the agents operate.
+    __environment_agent_service (EnvironmentAgentService): Service for executing the actions and sensors.
+    __participants (list[tuple[Agent, Policy]]): The agents of the simulation with the policy that drives each one.
+    __tick (int): The number of ticks run so far.
+  """
+
+  def __init__(self, environment_agent_service: EnvironmentAgentService, environment: Environment):
+    """
+    Initializes a LockstepSimulationService instance without agents.
+
+    Args:
+      environment_agent_service (EnvironmentAgentService): Service for executing the actions and sensors.
+      environment (Environment): The environment in which the agents operate.
+    """
+    self.__environment: Environment = environment
+    self.__environment_agent_service: EnvironmentAgentService = environment_agent_service
+    self.__participants: list[tuple[Agent, Policy]] = []
+    self.__tick: int = 0
+
+  def add_agent(self, agent: Agent, policy: Policy, seed: int = 0) -> None:
+    """
+    Adds an agent to the simulation, and to the environment if it is not there yet.
+
+    Every agent needs its own policy instance, since policies keep the state of the episode.
+
+    Args:
+      agent (Agent): The agent, already at its start position.
+      policy (Policy): The policy that drives the agent.
+      seed (int): The seed of the episode of the agent.
+    """
+    if agent not in self.__environment.get_agents():
+      self.__environment.add_agent(agent)
+    policy.start_episode(agent, self.__environment, seed)
+    self.__participants.append((agent, policy))
+
+  def get_tick(self) -> int:
+    """
+    Returns the number of ticks run so far.
+
+    Returns:
+      int: The number of ticks.
+    """
+    return self.__tick
+
+  def tick(self) -> TickReport:
+    """
+    Advances every active agent by one decision.
+
+    Returns:
+      TickReport: The summary of the tick.
+    """
+    environment: Environment = self.__environment
+    sensor_requests: list[tuple[Agent, SensorConfiguration]] = []
+    action_requests: dict[ActionConfiguration, list[Agent]] = {}
+    active_agents: int = 0
+    for agent, policy in self.__participants:
+      if agent.is_at_finish_position():
+        continue
+      active_agents += 1
+      decision: Optional[Union[ActionConfiguration, SensorConfiguration]] = policy.decide(agent, environment)
+      if decision is None:
+        continue
+      if isinstance(decision, ActionConfiguration):
+        agents: Optional[list[Agent]] = action_requests.get(decision)
+        if agents is None:
+          action_requests[decision] = [agent]
+        else:
+          agents.append(agent)
+      else:
+        sensor_requests.append((agent, decision))
+
+    for agent, sensor_configuration in sensor_requests:
+      self.__environment_agent_service.execute_sensor(agent, environment, sensor_configuration)
+
+    actions: int = 0
+    goals_reached: int = 0
+    for action_configuration, agents in action_requests.items():
+      self.__environment_agent_service.execute_action_batch(agents, environment, action_configuration)
+      actions += len(agents)
+      goals_reached += sum(agent.is_at_finish_position() for agent in agents)
+
+    self.__tick += 1
+    return TickReport(self.__tick, active_agents, actions, len(sensor_requests), goals_reached)
+
+  def run(self, ticks: int) -> list[TickReport]:
+    """
+    Runs several ticks, stopping early when no agent is active.
+
+    Args:
+      ticks (int): The maximum number of ticks.
+
+    Returns:
+      list[TickReport]: The summary of every tick run.
+    """
+    reports: list[TickReport] = []
+    for _ in range(ticks):
+      report: TickReport = self.tick()
+      reports.append(report)
+      if report.get_active_agents() == 0:
+        break
+    return reports
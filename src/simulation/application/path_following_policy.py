@@ -0,0 +1,107 @@
+from collections import deque
+from typing import Optional, Union
+
+from src.agent.domain.action.action import Action
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.action_repository import ActionRepository
+from src.agent.domain.action.move_action import MoveAction, MoveActionNewCoordinates
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.application.path_planning_service import PathPlanningService, PlannedPath
+from src.environment.domain.environment import Environment
+from src.position.domain.position import Position
+from src.simulation.domain.policy import Policy
+
+
+class PathFollowingPolicy(Policy):
+  """
+  Policy that plans the least-cost path to the finish position at the start of the episode and follows it, using the
+  sensor whenever the next cell of the path is still unknown to the agent.
+
+  Attributes:
+    IDENTIFIER (str): The identifier of the path following policy.
+    __action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+    __path_planning_service (PathPlanningService): Service for planning the path.
+    __remaining_positions (deque[Position]): The positions of the path not reached yet, starting with the current one.
+    __sensed_position (Optional[Position]): The position the sensor was last used for.
+    __sensor_identifier (str): The identifier of the sensor used to reveal the path.
+  """
+  IDENTIFIER: str = 'path_following'
+
+  def __init__(self, action_repository: ActionRepository, path_planning_service: PathPlanningService, sensor_identifier: str = 'every_direction'):
+    """
+    Initializes a PathFollowingPolicy instance.
+
+    Args:
+      action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+      path_planning_service (PathPlanningService): Service for planning the path.
+      sensor_identifier (str): The identifier of the sensor used to reveal the path.
+    """
+    super().__init__(PathFollowingPolicy.IDENTIFIER)
+    self.__action_repository: ActionRepository = action_repository
+    self.__path_planning_service: PathPlanningService = path_planning_service
+    self.__remaining_positions: deque[Position] = deque()
+    self.__sensed_position: Optional[Position] = None
+    self.__sensor_identifier: str = sensor_identifier
+
+  def start_episode(self, agent: Agent, environment: Environment, seed: int) -> None:
+    """
+    Plans the path of the episode.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+      seed (int): The seed of the episode, unused because the policy is deterministic.
+    """
+    planned_path: Optional[PlannedPath] = self.__path_planning_service.plan_for_agent(agent, environment)
+    self.__remaining_positions = deque(planned_path.get_positions() if planned_path is not None else [])
+    self.__sensed_position = None
+
+  def decide(self, agent: Agent, environment: Environment) -> Optional[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Decides the next action or sensor of the agent.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[Union[ActionConfiguration, SensorConfiguration]]: The sensor, the move towards the next position of the path,
+      or None if there is no path or the agent left it.
+    """
+    current_position: Position = Position(agent.get_x(), agent.get_y())
+    while len(self.__remaining_positions) > 0 and self.__remaining_positions[0] != current_position:
+      self.__remaining_positions.popleft()
+    if len(self.__remaining_positions) < 2:
+      return None
+    next_position: Position = self.__remaining_positions[1]
+
+    if not agent.is_known(next_position.get_x(), next_position.get_y()):
+      if self.__sensed_position is not None and self.__sensed_position == next_position:
+        return None
+      self.__sensed_position = next_position
+      return agent.get_sensor(self.__sensor_identifier)
+    return PathFollowingPolicy.get_move_to(self.__action_repository, agent, next_position)
+
+  @staticmethod
+  def get_move_to(action_repository: ActionRepository, agent: Agent, position: Position) -> Optional[ActionConfiguration]:
+    """
+    Finds the move action of the agent that reaches a position from its current one.
+
+    Args:
+      action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+      agent (Agent): The agent to move.
+      position (Position): The position to reach.
+
+    Returns:
+      Optional[ActionConfiguration]: The move action, or None if no action of the agent reaches the position.
+    """
+    current_position: Position = Position(agent.get_x(), agent.get_y())
+    for action_configuration in agent.list_actions():
+      action: Optional[Action] = action_repository.get_action(action_configuration.get_identifier())
+      if not isinstance(action, MoveAction):
+        continue
+      new_coordinates: Optional[MoveActionNewCoordinates] = action.get_new_coordinates(agent, action_configuration.get_property('steps'))
+      if new_coordinates is not None and current_position + Position(new_coordinates.get_dx(), new_coordinates.get_dy()) == position:
+        return action_configuration
+    return None
@@ -0,0 +1,76 @@
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.action_repository import ActionRepository
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.application.incremental_path_planner import IncrementalPathPlanner
+from src.environment.domain.environment import Environment
+from src.position.domain.position import Position
+from src.simulation.application.path_following_policy import PathFollowingPolicy
+from src.simulation.domain.policy import Policy
+
+
+class ReplanningPolicy(Policy):
+  """
+  Policy that only trusts the cells the agent knows: it replans the path to the finish position before every decision,
+  assuming the unknown cells are cheap, and uses the sensor whenever the next cell of the path is still unknown. The
+  planner is incremental, so every replan only repairs the part of the search affected by the cells just revealed.
+
+  Attributes:
+    IDENTIFIER (str): The identifier of the replanning policy.
+    __action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+    __planner (Optional[IncrementalPathPlanner]): The planner of the episode.
+    __sensed_position (Optional[Position]): The position the sensor was last used for.
+    __sensor_identifier (str): The identifier of the sensor used to reveal the path.
+  """
+  IDENTIFIER: str = 'replanning'
+
+  def __init__(self, action_repository: ActionRepository, sensor_identifier: str = 'every_direction'):
+    """
+    Initializes a ReplanningPolicy instance.
+
+    Args:
+      action_repository (ActionRepository): Repository for resolving the move actions of the agent.
+      sensor_identifier (str): The identifier of the sensor used to reveal the path.
+    """
+    super().__init__(ReplanningPolicy.IDENTIFIER)
+    self.__action_repository: ActionRepository = action_repository
+    self.__planner: Optional[IncrementalPathPlanner] = None
+    self.__sensed_position: Optional[Position] = None
+    self.__sensor_identifier: str = sensor_identifier
+
+  def start_episode(self, agent: Agent, environment: Environment, seed: int) -> None:
+    """
+    Creates the planner of the episode.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+      seed (int): The seed of the episode, unused because the policy is deterministic.
+    """
+    self.__planner = IncrementalPathPlanner(agent, environment)
+    self.__sensed_position = None
+
+  def decide(self, agent: Agent, environment: Environment) -> Optional[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Decides the next action or sensor of the agent.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[Union[ActionConfiguration, SensorConfiguration]]: The sensor, the move towards the next position of the path,
+      or None if the finish cannot be reached or the sensor does not reveal the next position.
+    """
+    next_position: Optional[Position] = self.__planner.plan_next_position()
+    if next_position is None or agent.is_in_position(next_position.get_x(), next_position.get_y()):
+      return None
+
+    if not agent.is_known(next_position.get_x(), next_position.get_y()):
+      if self.__sensed_position is not None and self.__sensed_position == next_position:
+        return None
+      self.__sensed_position = next_position
+      return agent.get_sensor(self.__sensor_identifier)
+    return PathFollowingPolicy.get_move_to(self.__action_repository, agent, next_position)
@@ -0,0 +1,473 @@
+from array import array
+from typing import Callable, Iterable, Optional, Union
+
+from src.agent.domain.action.action import Action, ActionResult
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.action.move_action import MoveAction, MoveActionNewCoordinates
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.directional_sensor import DirectionalSensor
+from src.agent.domain.sensor.merged_sensor import MergedSensor
+from src.agent.domain.sensor.sensor import Sensor, SensorResult
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.agent.domain.sensor.sensor_sweep import SensorSweep
+from src.environment.application.environment_agent_service import EnvironmentAgentService
+from src.environment.domain.environment import Environment
+
+
+class VectorObservation:
+  """
+  Observation of every copy of a vectorized environment: the position of its agent and the cells the agent knows.
+
+  The arrays are views of the state of the environment, they are updated in place by the next step or reset.
+
+  Attributes:
+    __bytes_per_copy (int): The number of bytes of the bitset of the known cells of a copy.
+    __columns (int): The number of columns of the map.
+    __known (memoryview): The bitsets of the known cells of every copy, one after the other.
+    __x_coordinates (array): The x-coordinate of the agent of every copy.
+    __y_coordinates (array): The y-coordinate of the agent of every copy.
+  """
+
+  def __init__(self, x_coordinates: array, y_coordinates: array, known: memoryview, bytes_per_copy: int, columns: int):
+    """
+    Initializes a VectorObservation instance.
+
+    Args:
+      x_coordinates (array): The x-coordinate of the agent of every copy.
+      y_coordinates (array): The y-coordinate of the agent of every copy.
+      known (memoryview): The bitsets of the known cells of every copy, one after the other.
+      bytes_per_copy (int): The number of bytes of the bitset of the known cells of a copy.
+      columns (int): The number of columns of the map.
+    """
+    self.__bytes_per_copy: int = bytes_per_copy
+    self.__columns: int = columns
+    self.__known: memoryview = known
+    self.__x_coordinates: array = x_coordinates
+    self.__y_coordinates: array = y_coordinates
+
+  def get_x_coordinates(self) -> array:
+    """
+    Returns the x-coordinate of the agent of every copy.
+
+    Returns:
+      array: The x-coordinates, by copy.
+    """
+    return self.__x_coordinates
+
+  def get_y_coordinates(self) -> array:
+    """
+    Returns the y-coordinate of the agent of every copy.
+
+    Returns:
+      array: The y-coordinates, by copy.
+    """
+    return self.__y_coordinates
+
+  def get_known(self) -> memoryview:
+    """
+    Returns the bitsets of the known cells of every copy. The bit index & 7 of the byte
+    copy * bytes_per_copy + (index >> 3) is set when the cell index = y * columns + x is known.
+
+    Returns:
+      memoryview: The read-only bitsets, one after the other.
+    """
+    return self.__known
+
+  def get_bytes_per_copy(self) -> int:
+    """
+    Returns the number of bytes of the bitset of the known cells of a copy.
+
+    Returns:
+      int: The number of bytes.
+    """
+    return self.__bytes_per_copy
+
+  def is_known(self, copy: int, x: int, y: int) -> bool:
+    """
+    Checks if the agent of a copy knows a cell inside the map.
+
+    Args:
+      copy (int): The index of the copy.
+      x (int): The x-coordinate of the cell.
+      y (int): The y-coordinate of the cell.
+
+    Returns:
+      bool: True if the cell is known, False otherwise.
+    """
+    index: int = y * self.__columns + x
+    return (self.__known[copy * self.__bytes_per_copy + (index >> 3)] >> (index & 7)) & 1 == 1
+
+
+class VectorStep:
+  """
+  Result of a step of a vectorized environment.
+
+  Attributes:
+    __observation (VectorObservation): The observation after the step.
+    __results (list[Optional[Union[ActionResult, SensorResult]]]): The result of the decision of every copy, None for
+      the copies that had already finished.
+    __rewards (array): The reward of every copy.
+    __terminated (bytearray): Whether the agent of every copy is at its finish position.
+    __truncated (bytearray): Whether every copy ran out of steps without reaching the finish position.
+  """
+
+  def __init__(self, observation: VectorObservation, rewards: array, terminated: bytearray, truncated: bytearray, results: list[Optional[Union[ActionResult, SensorResult]]]):
+    """
+    Initializes a VectorStep instance.
+
+    Args:
+      observation (VectorObservation): The observation after the step.
+      rewards (array): The reward of every copy.
+      terminated (bytearray): Whether the agent of every copy is at its finish position.
+      truncated (bytearray): Whether every copy ran out of steps without reaching the finish position.
+      results (list[Optional[Union[ActionResult, SensorResult]]]): The result of the decision of every copy.
+    """
+    self.__observation: VectorObservation = observation
+    self.__results: list[Optional[Union[ActionResult, SensorResult]]] = results
+    self.__rewards: array = rewards
+    self.__terminated: bytearray = terminated
+    self.__truncated: bytearray = truncated
+
+  def get_observation(self) -> VectorObservation:
+    """
+    Returns the observation after the step.
+
+    Returns:
+      VectorObservation: The observation.
+    """
+    return self.__observation
+
+  def get_rewards(self) -> array:
+    """
+    Returns the reward of every copy.
+
+    Returns:
+      array: The rewards, by copy.
+    """
+    return self.__rewards
+
+  def get_terminated(self) -> bytearray:
+    """
+    Returns whether the agent of every copy is at its finish position.
+
+    Returns:
+      bytearray: 1 for the terminated copies, 0 otherwise.
+    """
+    return self.__terminated
+
+  def get_truncated(self) -> bytearray:
+    """
+    Returns whether every copy ran out of steps without reaching the finish position.
+
+    Returns:
+      bytearray: 1 for the truncated copies, 0 otherwise.
+    """
+    return self.__truncated
+
+  def get_results(self) -> list[Optional[Union[ActionResult, SensorResult]]]:
+    """
+    Returns the result of the decision of every copy.
+
+    Returns:
+      list[Optional[Union[ActionResult, SensorResult]]]: The results, by copy, None for the copies that had already
+      finished.
+    """
+    return self.__results
+
+
+class VectorEnvironment:
+  """
+  Runs independent copies of an agent over the same environment, for training policies.
+
+  The decisions available to every copy are the actions of the agent followed by its sensors, and a step takes the
+  index of the decision of every copy. The state of all the copies lives in stacked arrays instead of agents: the
+  positions, the accumulated movement costs, the steps and one bitset of known cells per copy. The moves are resolved
+  over these arrays with MoveAction.resolve_destination and the directional sensors with SensorSweep.trace, apart from
+  the flags of the visited cells, which are not tracked.
+
+  The reward of a move is minus its movement cost, plus the goal reward when it reaches the finish position. The other
+  decisions have no reward. A copy that terminates or is truncated ignores its decisions until it is reset.
+
+  Attributes:
+    __accumulated_movement_costs (array): The accumulated movement cost of every copy.
+    __bytes_per_copy (int): The number of bytes of the bitset of the known cells of a copy.
+    __columns (int): The number of columns of the map.
+    __copies (int): The number of copies.
+    __decisions (list[Union[ActionConfiguration, SensorConfiguration]]): The decisions available to the copies.
+    __decision_count (array): The number of decisions taken by every copy since its reset.
+    __finish_x (int): The x-coordinate of the finish position.
+    __finish_y (int): The y-coordinate of the finish position.
+    __goal_reward (float): The reward of reaching the finish position.
+    __known (bytearray): The bitsets of the known cells of every copy, one after the other.
+    __max_steps (int): The number of decisions after which a copy is truncated.
+    __movement_costs (array): The movement costs of the agent, indexed by y * columns + x.
+    __moves (list[Optional[tuple[int, int]]]): The (dx, dy) of every decision that is a move, None for the sensors.
+    __observation (VectorObservation): The observation over the state of the copies.
+    __rows (int): The number of rows of the map.
+    __sweeps (list[Optional[tuple[list[tuple[int, int]], int, bool]]]): The directions, radius and pass-through of
+      every decision that is a sensor, None for the moves.
+    __start_x (int): The x-coordinate of the start position.
+    __start_y (int): The y-coordinate of the start position.
+    __steps (array): The number of moves of every copy.
+    __terminated (bytearray): Whether the agent of every copy is at its finish position.
+    __truncated (bytearray): Whether every copy ran out of steps without reaching the finish position.
+    __x_coordinates (array): The x-coordinate of the agent of every copy.
+    __y_coordinates (array): The y-coordinate of the agent of every copy.
+  """
+
+  def __init__(self, environment_agent_service: EnvironmentAgentService, environment: Environment, agent: Agent, copies: int, max_steps: int, goal_reward: float = 100.0):
+    """
+    Initializes a VectorEnvironment instance and resets every copy.
+
+    Args:
+      environment_agent_service (EnvironmentAgentService): Service whose repositories resolve the actions and sensors.
+      environment (Environment): The environment shared by the copies, only its grid is read.
+      agent (Agent): The agent copied, at its start position and with its finish position set.
+      copies (int): The number of copies.
+      max_steps (int): The number of decisions after which a copy is truncated.
+      goal_reward (float): The reward of reaching the finish position.
+
+    Raises:
+      ValueError: If there are no copies, a position of the agent is out of bounds, or an action or sensor of the agent
+        is not a move or a directional sensor.
+    """
+    if copies < 1:
+      raise ValueError('The number of copies must be greater than 0')
+    self.__columns: int = environment.get_columns()
+    self.__rows: int = environment.get_rows()
+    self.__finish_x, self.__finish_y = agent.get_finish_position()
+    self.__start_x: int = agent.get_x()
+    self.__start_y: int = agent.get_y()
+    for x, y in ((self.__start_x, self.__start_y), (self.__finish_x, self.__finish_y)):
+      if not environment.contains(x, y):
+        raise ValueError(f'Position ({x}, {y}) is out of bounds.')
+
+    self.__decisions: list[Union[ActionConfiguration, SensorConfiguration]] = [*agent.list_actions(), *agent.list_sensors()]
+    self.__moves: list[Optional[tuple[int, int]]] = []
+    self.__sweeps: list[Optional[tuple[list[tuple[int, int]], int, bool]]] = []
+    for action_configuration in agent.list_actions():
+      self.__moves.append(VectorEnvironment.compile_move(environment_agent_service, agent, action_configuration))
+      self.__sweeps.append(None)
+    for sensor_configuration in agent.list_sensors():
+      self.__moves.append(None)
+      self.__sweeps.append(VectorEnvironment.compile_sweep(environment_agent_service, sensor_configuration))
+
+    self.__copies: int = copies
+    self.__goal_reward: float = goal_reward
+    self.__max_steps: int = max_steps
+    self.__movement_costs: array = environment.get_movement_costs_for(agent.get_name())
+    self.__bytes_per_copy: int = (self.__rows * self.__columns + 7) // 8
+    self.__known: bytearray = bytearray(self.__bytes_per_copy * copies)
+    self.__x_coordinates: array = array('i', [self.__start_x]) * copies
+    self.__y_coordinates: array = array('i', [self.__start_y]) * copies
+    self.__accumulated_movement_costs: array = array('q', [0]) * copies
+    self.__steps: array = array('q', [0]) * copies
+    self.__decision_count: array = array('q', [0]) * copies
+    self.__terminated: bytearray = bytearray(copies)
+    self.__truncated: bytearray = bytearray(copies)
+    self.__observation: VectorObservation = VectorObservation(self.__x_coordinates, self.__y_coordinates, memoryview(self.__known).toreadonly(), self.__bytes_per_copy, self.__columns)
+    self.reset()
+
+  @staticmethod
+  def compile_move(environment_agent_service: EnvironmentAgentService, agent: Agent, action_configuration: ActionConfiguration) -> tuple[int, int]:
+    """
+    Resolves the displacement of a move action.
+
+    Args:
+      environment_agent_service (EnvironmentAgentService): Service whose repository resolves the action.
+      agent (Agent): The agent copied.
+      action_configuration (ActionConfiguration): The configuration of the action.
+
+    Returns:
+      tuple[int, int]: The displacement as (dx, dy).
+
+    Raises:
+      ValueError: If the action is not a move with a valid number of steps.
+    """
+    action: Optional[Action] = environment_agent_service.get_action_repository().get_action(action_configuration.get_identifier())
+    steps: int = action_configuration.get_property('steps')
+    if not isinstance(action, MoveAction) or type(steps) is not int or steps < 1:
+      raise ValueError(f'Action {action_configuration.get_identifier()} is not a valid move.')
+    new_coordinates: Optional[MoveActionNewCoordinates] = action.get_new_coordinates(agent, steps)
+    if new_coordinates is None:
+      raise ValueError(f'Action {action_configuration.get_identifier()} has no direction.')
+    return new_coordinates.get_dx(), new_coordinates.get_dy()
+
+  @staticmethod
+  def compile_sweep(environment_agent_service: EnvironmentAgentService, sensor_configuration: SensorConfiguration) -> tuple[list[tuple[int, int]], int, bool]:
+    """
+    Resolves the rays of a directional sensor.
+
+    Args:
+      environment_agent_service (EnvironmentAgentService): Service whose repository resolves the sensor.
+      sensor_configuration (SensorConfiguration): The configuration of the sensor.
+
+    Returns:
+      tuple[list[tuple[int, int]], int, bool]: The step of every ray as (dx, dy), the radius and the pass-through.
+
+    Raises:
+      ValueError: If the sensor is not directional or a merge of directional sensors.
+    """
+    sensor: Optional[Sensor] = environment_agent_service.get_sensor_repository().get_sensor(sensor_configuration.get_identifier())
+    directions: Optional[list[tuple[int, int]]] = None
+    if isinstance(sensor, DirectionalSensor):
+      directions = [sensor.get_direction()]
+    elif isinstance(sensor, MergedSensor):
+      directions = sensor.get_directions()
+    if directions is None:
+      raise ValueError(f'Sensor {sensor_configuration.get_identifier()} is not directional.')
+    return directions, sensor_configuration.get_radius(), sensor_configuration.can_pass_trough()
+
+  def get_copies(self) -> int:
+    """
+    Returns the number of copies.
+
+    Returns:
+      int: The number of copies.
+    """
+    return self.__copies
+
+  def get_decisions(self) -> list[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Returns the decisions available to the copies, the actions of the agent followed by its sensors.
+
+    Returns:
+      list[Union[ActionConfiguration, SensorConfiguration]]: The decisions, by index.
+    """
+    return self.__decisions
+
+  def get_accumulated_movement_costs(self) -> array:
+    """
+    Returns the accumulated movement cost of every copy.
+
+    Returns:
+      array: The accumulated movement costs, by copy.
+    """
+    return self.__accumulated_movement_costs
+
+  def get_steps(self) -> array:
+    """
+    Returns the number of moves of every copy.
+
+    Returns:
+      array: The steps, by copy.
+    """
+    return self.__steps
+
+  def reset(self, copies: Optional[Iterable[int]] = None) -> VectorObservation:
+    """
+    Moves the agent of some copies back to the start position, forgetting everything but the start position.
+
+    Args:
+      copies (Optional[Iterable[int]]): The indices of the copies to reset. Defaults to every copy.
+
+    Returns:
+      VectorObservation: The observation of every copy.
+    """
+    bytes_per_copy: int = self.__bytes_per_copy
+    start_index: int = self.__start_y * self.__columns + self.__start_x
+    start_byte: int = start_index >> 3
+    start_mask: int = 1 << (start_index & 7)
+    known: bytearray = self.__known
+    if copies is None:
+      known[:] = bytes(len(known))
+      copies = range(self.__copies)
+    else:
+      copies = list(copies)
+      empty: bytes = bytes(bytes_per_copy)
+      for copy in copies:
+        known[copy * bytes_per_copy:(copy + 1) * bytes_per_copy] = empty
+    for copy in copies:
+      known[copy * bytes_per_copy + start_byte] |= start_mask
+      self.__x_coordinates[copy] = self.__start_x
+      self.__y_coordinates[copy] = self.__start_y
+      self.__accumulated_movement_costs[copy] = 0
+      self.__steps[copy] = 0
+      self.__decision_count[copy] = 0
+      self.__terminated[copy] = self.__start_x == self.__finish_x and self.__start_y == self.__finish_y
+      self.__truncated[copy] = 0
+    return self.__observation
+
+  def step(self, decisions: Iterable[int]) -> VectorStep:
+    """
+    Takes a decision in every copy.
+
+    Args:
+      decisions (Iterable[int]): The index of the decision of every copy, in the list returned by get_decisions.
+
+    Returns:
+      VectorStep: The observation, rewards, terminations, truncations and results of the step.
+
+    Raises:
+      ValueError: If the number of decisions is not the number of copies.
+      IndexError: If the index of a decision is out of range.
+    """
+    decisions = list(decisions)
+    if len(decisions) != self.__copies:
+      raise ValueError(f'Expected {self.__copies} decisions, got {len(decisions)}.')
+
+    columns: int = self.__columns
+    rows: int = self.__rows
+    bytes_per_copy: int = self.__bytes_per_copy
+    known: bytearray = self.__known
+    movement_costs: array = self.__movement_costs
+    moves: list[Optional[tuple[int, int]]] = self.__moves
+    sweeps: list[Optional[tuple[list[tuple[int, int]], int, bool]]] = self.__sweeps
+    x_coordinates: array = self.__x_coordinates
+    y_coordinates: array = self.__y_coordinates
+    terminated: bytearray = self.__terminated
+    truncated: bytearray = self.__truncated
+    decision_count: array = self.__decision_count
+    finish_x: int = self.__finish_x
+    finish_y: int = self.__finish_y
+    max_steps: int = self.__max_steps
+    trace: Callable[..., tuple[range, SensorResult]] = SensorSweep.trace
+    resolve_destination: Callable[[bool, int, int, int, int, array], ActionResult] = MoveAction.resolve_destination
+    rewards: array = array('d', bytes(8 * self.__copies))
+    results: list[Optional[Union[ActionResult, SensorResult]]] = [None] * self.__copies
+
+    for copy, decision in enumerate(decisions):
+      if terminated[copy] or truncated[copy]:
+        continue
+      base: int = copy * bytes_per_copy
+      x: int = x_coordinates[copy]
+      y: int = y_coordinates[copy]
+      move: Optional[tuple[int, int]] = moves[decision]
+      if move is not None:
+        x += move[0]
+        y += move[1]
+        index: int = y * columns + x
+        is_known: bool = 0 <= y < rows and 0 <= x < columns and (known[base + (index >> 3)] >> (index & 7)) & 1 == 1
+        result: ActionResult = resolve_destination(is_known, x, y, rows, columns, movement_costs)
+        if result is not ActionResult.SUCCESS:
+          results[copy] = result
+        else:
+          movement_cost: int = movement_costs[index]
+          x_coordinates[copy] = x
+          y_coordinates[copy] = y
+          self.__accumulated_movement_costs[copy] += movement_cost
+          self.__steps[copy] += 1
+          if x == finish_x and y == finish_y:
+            rewards[copy] = self.__goal_reward - movement_cost
+            terminated[copy] = 1
+            results[copy] = ActionResult.GOAL_REACHED
+          else:
+            rewards[copy] = -movement_cost
+            results[copy] = ActionResult.SUCCESS
+      else:
+        directions, radius, pass_trough = sweeps[decision]
+        sensor_result: SensorResult = SensorResult.SUCCESS
+        is_known: Callable[[int], bool] = lambda index, base=base: (known[base + (index >> 3)] >> (index & 7)) & 1 == 1
+        for dx, dy in directions:
+          cells, sensor_result = trace(x, y, dx, dy, radius, rows, columns, movement_costs, pass_trough, is_known)
+          for index in cells:
+            known[base + (index >> 3)] |= 1 << (index & 7)
+          if sensor_result == SensorResult.HIT_OBSTACLE:
+            break
+        results[copy] = sensor_result
+
+      decision_count[copy] += 1
+      if decision_count[copy] >= max_steps and not terminated[copy]:
+        truncated[copy] = 1
+
+    return VectorStep(self.__observation, rewards, bytearray(terminated), bytearray(truncated), results)
@@ -0,0 +1,112 @@
+from src.position.domain.position import Position
+
+
+class EpisodeConfiguration:
+  """
+  Describes an episode of a batch simulation: the world the agent runs in and the policy that drives it.
+
+  Attributes:
+    __agent_name (str): The name of the agent type, which selects its movement costs.
+    __finish (Position): The finish position of the agent.
+    __map_name (str): The name of the map file.
+    __max_steps (int): The maximum number of decisions before the episode is cut.
+    __policy_identifier (str): The identifier of the policy that drives the agent.
+    __seed (int): The seed of the episode, for the policies with random decisions.
+    __start (Position): The start position of the agent.
+    __terrain_name (str): The name of the terrain file.
+  """
+
+  def __init__(self, map_name: str, terrain_name: str, agent_name: str, start: Position, finish: Position, policy_identifier: str, max_steps: int, seed: int):
+    """
+    Initializes an EpisodeConfiguration instance.
+
+    Args:
+      map_name (str): The name of the map file.
+      terrain_name (str): The name of the terrain file.
+      agent_name (str): The name of the agent type, which selects its movement costs.
+      start (Position): The start position of the agent.
+      finish (Position): The finish position of the agent.
+      policy_identifier (str): The identifier of the policy that drives the agent.
+      max_steps (int): The maximum number of decisions before the episode is cut.
+      seed (int): The seed of the episode, for the policies with random decisions.
+    """
+    self.__agent_name: str = agent_name
+    self.__finish: Position = finish
+    self.__map_name: str = map_name
+    self.__max_steps: int = max_steps
+    self.__policy_identifier: str = policy_identifier
+    self.__seed: int = seed
+    self.__start: Position = start
+    self.__terrain_name: str = terrain_name
+
+  def get_map_name(self) -> str:
+    """
+    Returns the name of the map file.
+
+    Returns:
+      str: The name of the map file.
+    """
+    return self.__map_name
+
+  def get_terrain_name(self) -> str:
+    """
+    Returns the name of the terrain file.
+
+    Returns:
+      str: The name of the terrain file.
+    """
+    return self.__terrain_name
+
+  def get_agent_name(self) -> str:
+    """
+    Returns the name of the agent type.
+
+    Returns:
+      str: The name of the agent type.
+    """
+    return self.__agent_name
+
+  def get_start(self) -> Position:
+    """
+    Returns the start position of the agent.
+
+    Returns:
+      Position: The start position.
+    """
+    return self.__start
+
+  def get_finish(self) -> Position:
+    """
+    Returns the finish position of the agent.
+
+    Returns:
+      Position: The finish position.
+    """
+    return self.__finish
+
+  def get_policy_identifier(self) -> str:
+    """
+    Returns the identifier of the policy that drives the agent.
+
+    Returns:
+      str: The policy identifier.
+    """
+    return self.__policy_identifier
+
+  def get_max_steps(self) -> int:
+    """
+    Returns the maximum number of decisions of the episode.
+
+    Returns:
+      int: The maximum number of decisions.
+    """
+    return self.__max_steps
+
+  def get_seed(self) -> int:
+    """
+    Returns the seed of the episode.
+
+    Returns:
+      int: The seed.
+    """
+    return self.__seed
@@ -0,0 +1,76 @@
+from src.simulation.domain.episode_configuration import EpisodeConfiguration
+
+
+class EpisodeResult:
+  """
+  Outcome of an episode of a batch simulation.
+
+  Attributes:
+    __accumulated_movement_cost (int): The movement cost accumulated by the agent.
+    __configuration (EpisodeConfiguration): The configuration of the episode.
+    __decisions (int): The number of actions and sensors the policy decided.
+    __goal_reached (bool): Whether the agent ended at its finish position.
+    __steps (int): The number of steps the agent took.
+  """
+
+  def __init__(self, configuration: EpisodeConfiguration, steps: int, accumulated_movement_cost: int, goal_reached: bool, decisions: int):
+    """
+    Initializes an EpisodeResult instance.
+
+    Args:
+      configuration (EpisodeConfiguration): The configuration of the episode.
+      steps (int): The number of steps the agent took.
+      accumulated_movement_cost (int): The movement cost accumulated by the agent.
+      goal_reached (bool): Whether the agent ended at its finish position.
+      decisions (int): The number of actions and sensors the policy decided.
+    """
+    self.__accumulated_movement_cost: int = accumulated_movement_cost
+    self.__configuration: EpisodeConfiguration = configuration
+    self.__decisions: int = decisions
+    self.__goal_reached: bool = goal_reached
+    self.__steps: int = steps
+
+  def get_configuration(self) -> EpisodeConfiguration:
+    """
+    Returns the configuration of the episode.
+
+    Returns:
+      EpisodeConfiguration: The configuration of the episode.
+    """
+    return self.__configuration
+
+  def get_steps(self) -> int:
+    """
+    Returns the number of steps the agent took.
+
+    Returns:
+      int: The number of steps.
+    """
+    return self.__steps
+
+  def get_accumulated_movement_cost(self) -> int:
+    """
+    Returns the movement cost accumulated by the agent.
+
+    Returns:
+      int: The accumulated movement cost.
+    """
+    return self.__accumulated_movement_cost
+
+  def is_goal_reached(self) -> bool:
+    """
+    Checks if the agent ended at its finish position.
+
+    Returns:
+      bool: True if the goal was reached, False otherwise.
+    """
+    return self.__goal_reached
+
+  def get_decisions(self) -> int:
+    """
+    Returns the number of actions and sensors the policy decided.
+
+    Returns:
+      int: The number of decisions.
+    """
+    return self.__decisions
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.domain.environment import Environment
+
+
+class Policy(ABC):
+  """
+  Represents a policy that decides, step by step, which action or sensor an agent uses.
+
+  Attributes:
+    __identifier (str): The identifier of the policy.
+  """
+
+  def __init__(self, identifier: str):
+    """
+    Initializes a Policy instance.
+
+    Args:
+      identifier (str): The identifier of the policy.
+    """
+    self.__identifier: str = identifier
+
+  def get_identifier(self) -> str:
+    """
+    Returns the policy identifier.
+
+    Returns:
+      str: The policy identifier.
+    """
+    return self.__identifier
+
+  def start_episode(self, agent: Agent, environment: Environment, seed: int) -> None:
+    """
+    Prepares the policy for a new episode, the agent is already at its start position.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+      seed (int): The seed of the episode, for the policies with random decisions.
+    """
+    pass
+
+  @abstractmethod
+  def decide(self, agent: Agent, environment: Environment) -> Optional[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Decides the next action or sensor of the agent.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[Union[ActionConfiguration, SensorConfiguration]]: The configuration to execute, or None to end the episode.
+    """
+    raise NotImplementedError('This method should be implemented by the subclass.')
@@ -0,0 +1,58 @@
+from typing import Optional
+
+from src.simulation.domain.policy import Policy
+
+
+class PolicyRepository:
+  """
+  Repository for managing policies.
+
+  Attributes:
+    __policies (dict[str, Policy]): A dictionary of policies, where the key is the policy identifier.
+  """
+
+  def __init__(self):
+    """
+    Initializes a PolicyRepository instance.
+    """
+    self.__policies: dict[str, Policy] = {}
+
+  def add_policy(self, policy: Policy):
+    """
+    Adds a policy to the repository.
+
+    Args:
+      policy (Policy): The policy to be added.
+    """
+    self.__policies[policy.get_identifier()] = policy
+
+  def add_policies(self, *policies: Policy):
+    """
+    Adds multiple policies to the repository.
+
+    Args:
+      *policies (Policy): The policies to be added.
+    """
+    for policy in policies:
+      self.add_policy(policy)
+
+  def get_policy(self, identifier: str) -> Optional[Policy]:
+    """
+    Returns the policy with the specified identifier.
+
+    Args:
+      identifier (str): The identifier of the policy.
+
+    Returns:
+      Optional[Policy]: The policy with the specified identifier, or None if it does not exist.
+    """
+    return self.__policies.get(identifier)
+
+  def get_policies(self) -> list[Policy]:
+    """
+    Returns a list of all policies in the repository.
+
+    Returns:
+      list[Policy]: A list of all policies in the repository.
+    """
+    return list(self.__policies.values())
@@ -0,0 +1,66 @@
+from random import Random
+from typing import Optional, Union
+
+from src.agent.domain.action.action_configuration import ActionConfiguration
+from src.agent.domain.agent import Agent
+from src.agent.domain.sensor.sensor_configuration import SensorConfiguration
+from src.environment.domain.environment import Environment
+from src.simulation.domain.policy import Policy
+
+
+class RandomWalkPolicy(Policy):
+  """
+  Policy that alternates a sensor reading with a random action of the agent.
+
+  Attributes:
+    IDENTIFIER (str): The identifier of the random walk policy.
+    __random (Random): The random generator of the current episode.
+    __sensed (bool): Whether the last decision was the sensor.
+    __sensor_identifier (str): The identifier of the sensor used before every action.
+  """
+  IDENTIFIER: str = 'random_walk'
+
+  def __init__(self, sensor_identifier: str = 'every_direction'):
+    """
+    Initializes a RandomWalkPolicy instance.
+
+    Args:
+      sensor_identifier (str): The identifier of the sensor used before every action.
+    """
+    super().__init__(RandomWalkPolicy.IDENTIFIER)
+    self.__random: Random = Random()
+    self.__sensed: bool = False
+    self.__sensor_identifier: str = sensor_identifier
+
+  def start_episode(self, agent: Agent, environment: Environment, seed: int) -> None:
+    """
+    Prepares the policy for a new episode.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+      seed (int): The seed of the random decisions of the episode.
+    """
+    self.__random = Random(seed)
+    self.__sensed = False
+
+  def decide(self, agent: Agent, environment: Environment) -> Optional[Union[ActionConfiguration, SensorConfiguration]]:
+    """
+    Decides the next action or sensor of the agent.
+
+    Args:
+      agent (Agent): The agent driven by the policy.
+      environment (Environment): The environment in which the agent operates.
+
+    Returns:
+      Optional[Union[ActionConfiguration, SensorConfiguration]]: The sensor, a random action, or None if the agent has no actions.
+    """
+    sensor: Optional[SensorConfiguration] = agent.get_sensor(self.__sensor_identifier)
+    if not self.__sensed and sensor is not None:
+      self.__sensed = True
+      return sensor
+    self.__sensed = False
+    actions: list[ActionConfiguration] = agent.list_actions()
+    if len(actions) == 0:
+      return None
+    return self.__random.choice(actions)
@@ -0,0 +1,178 @@
+from src.simulation.domain.episode_result import EpisodeResult
+
+
+class SimulationSummaryRow:
+  """
+  Aggregated results of the episodes of a batch simulation that share map, agent type and policy.
+
+  Attributes:
+    __agent_name (str): The name of the agent type.
+    __episodes (int): The number of episodes.
+    __goals_reached (int): The number of episodes where the agent reached its finish position.
+    __map_name (str): The name of the map file.
+    __movement_costs (list[int]): The accumulated movement cost of every episode.
+    __policy_identifier (str): The identifier of the policy.
+    __steps (list[int]): The number of steps of every episode.
+  """
+
+  def __init__(self, map_name: str, agent_name: str, policy_identifier: str):
+    """
+    Initializes a SimulationSummaryRow instance without episodes.
+
+    Args:
+      map_name (str): The name of the map file.
+      agent_name (str): The name of the agent type.
+      policy_identifier (str): The identifier of the policy.
+    """
+    self.__agent_name: str = agent_name
+    self.__episodes: int = 0
+    self.__goals_reached: int = 0
+    self.__map_name: str = map_name
+    self.__movement_costs: list[int] = []
+    self.__policy_identifier: str = policy_identifier
+    self.__steps: list[int] = []
+
+  def add_result(self, result: EpisodeResult) -> None:
+    """
+    Adds the result of an episode to the row.
+
+    Args:
+      result (EpisodeResult): The result of the episode.
+    """
+    self.__episodes += 1
+    self.__goals_reached += result.is_goal_reached()
+    self.__movement_costs.append(result.get_accumulated_movement_cost())
+    self.__steps.append(result.get_steps())
+
+  def get_map_name(self) -> str:
+    """
+    Returns the name of the map file.
+
+    Returns:
+      str: The name of the map file.
+    """
+    return self.__map_name
+
+  def get_agent_name(self) -> str:
+    """
+    Returns the name of the agent type.
+
+    Returns:
+      str: The name of the agent type.
+    """
+    return self.__agent_name
+
+  def get_policy_identifier(self) -> str:
+    """
+    Returns the identifier of the policy.
+
+    Returns:
+      str: The policy identifier.
+    """
+    return self.__policy_identifier
+
+  def get_episodes(self) -> int:
+    """
+    Returns the number of episodes.
+
+    Returns:
+      int: The number of episodes.
+    """
+    return self.__episodes
+
+  def get_goal_rate(self) -> float:
+    """
+    Returns the fraction of episodes where the agent reached its finish position.
+
+    Returns:
+      float: The goal rate, between 0 and 1.
+    """
+    return self.__goals_reached / self.__episodes if self.__episodes > 0 else 0.0
+
+  def get_steps(self) -> list[int]:
+    """
+    Returns the number of steps of every episode.
+
+    Returns:
+      list[int]: The number of steps of every episode.
+    """
+    return self.__steps
+
+  def get_movement_costs(self) -> list[int]:
+    """
+    Returns the accumulated movement cost of every episode.
+
+    Returns:
+      list[int]: The accumulated movement cost of every episode.
+    """
+    return self.__movement_costs
+
+
+class SimulationSummary:
+  """
+  Summary of the results of a batch simulation, with a row per map, agent type and policy.
+
+  Attributes:
+    __rows (dict[tuple[str, str, str], SimulationSummaryRow]): The rows, by map name, agent name and policy identifier.
+  """
+
+  HEADERS: tuple[str, ...] = ('Map', 'Agent', 'Policy', 'Episodes', 'Goal rate', 'Steps (mean/min/max)', 'Cost (mean/min/max)')
+
+  def __init__(self, results: list[EpisodeResult]):
+    """
+    Initializes a SimulationSummary instance, aggregating the results of the episodes.
+
+    Args:
+      results (list[EpisodeResult]): The results of the episodes.
+    """
+    self.__rows: dict[tuple[str, str, str], SimulationSummaryRow] = {}
+    for result in results:
+      self.add_result(result)
+
+  def add_result(self, result: EpisodeResult) -> None:
+    """
+    Adds the result of an episode to its row.
+
+    Args:
+      result (EpisodeResult): The result of the episode.
+    """
+    configuration = result.get_configuration()
+    key: tuple[str, str, str] = (configuration.get_map_name(), configuration.get_agent_name(), configuration.get_policy_identifier())
+    row: SimulationSummaryRow = self.__rows.get(key)
+    if row is None:
+      row = SimulationSummaryRow(*key)
+      self.__rows[key] = row
+    row.add_result(result)
+
+  def get_rows(self) -> list[SimulationSummaryRow]:
+    """
+    Returns the rows of the summary, sorted by map name, agent name and policy identifier.
+
+    Returns:
+      list[SimulationSummaryRow]: The rows of the summary.
+    """
+    return [self.__rows[key] for key in sorted(self.__rows)]
+
+  def format_table(self) -> str:
+    """
+    Formats the summary as a plain text table.
+
+    Returns:
+      str: The table, one line per row after the header.
+    """
+    lines: list[tuple[str, ...]] = [self.HEADERS]
+    for row in self.get_rows():
+      steps: list[int] = row.get_steps()
+      costs: list[int] = row.get_movement_costs()
+      lines.append((
+        row.get_map_name(),
+        row.get_agent_name(),
+        row.get_policy_identifier(),
+        str(row.get_episodes()),
+        f'{row.get_goal_rate():.1%}',
+        f'{sum(steps) / len(steps):.1f}/{min(steps)}/{max(steps)}',
+        f'{sum(costs) / len(costs):.1f}/{min(costs)}/{max(costs)}'))
+    widths: list[int] = [max(len(line[column]) for line in lines) for column in range(len(self.HEADERS))]
+    table: list[str] = [' | '.join(value.ljust(width) for value, width in zip(line, widths)).rstrip() for line in lines]
+    table.insert(1, '-+-'.join('-' * width for width in widths))
+    return '\n'.join(table)
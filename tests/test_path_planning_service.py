@@ -0,0 +1,42 @@
+import unittest
+
+from src.environment.application.environment_service import EnvironmentService
+from src.environment.application.path_planning_service import PathPlanningAlgorithm, PathPlanningService
+from src.environment.domain.environment import Environment
+from src.environment.domain.terrain.terrain_repository import TerrainRepository
+from src.map.domain.map_repository import MapRepository
+from src.position.domain.position import Position
+
+
+class PathPlanningServiceTest(unittest.TestCase):
+
+  def setUp(self):
+    map_repository: MapRepository = MapRepository('resources/map')
+    map_repository.load('maze.csv')
+    terrain_repository: TerrainRepository = TerrainRepository('resources/terrain')
+    terrain_repository.load('maze.json')
+    environment_service: EnvironmentService = EnvironmentService(map_repository, terrain_repository)
+    environment_service.set_environment()
+    self.environment: Environment = environment_service.get_environment()
+
+  def test_hierarchical_leaves_an_impassable_start_across_a_cluster_border(self):
+    for cluster_size in (4, 8):
+      path_planning_service: PathPlanningService = PathPlanningService(cluster_size)
+      path = path_planning_service.plan(self.environment, 'human', Position(8, 14), Position(6, 8), PathPlanningAlgorithm.HIERARCHICAL)
+      self.assertIsNotNone(path)
+      self.assertEqual(path.get_cost(), 8)
+
+  def test_hierarchical_reaches_the_same_finishes_as_a_star(self):
+    rows: int = self.environment.get_rows()
+    columns: int = self.environment.get_columns()
+    for cluster_size in (2, 8):
+      path_planning_service: PathPlanningService = PathPlanningService(cluster_size)
+      for start in (Position(x, y) for y in range(rows) for x in range(columns)):
+        for finish in (Position(x, y) for y in range(0, rows, 4) for x in range(0, columns, 4)):
+          a_star = path_planning_service.plan(self.environment, 'human', start, finish)
+          hierarchical = path_planning_service.plan(self.environment, 'human', start, finish, PathPlanningAlgorithm.HIERARCHICAL)
+          self.assertEqual(a_star is None, hierarchical is None, f'{start} to {finish} with clusters of {cluster_size}')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -1,33 +1,25 @@
+import importlib
+
 import flet
 
 from src.environment.application.environment_agent_service import EnvironmentAgentService
 from src.environment.application.environment_service import EnvironmentService
 from src.environment.domain.terrain.terrain_repository import TerrainRepository
 from src.map.domain.map_repository import MapRepository
-from ui.creation.creation_main_screen_view_ui import CreationMainScreenViewUi
-from ui.creation.creation_terrain_selection_view_ui import CreationTerrainSelectionViewUi
-from ui.edition.edition_main_screen_view_ui import EditionMainScreenViewUi
-from ui.edition.edition_map_selection_view_ui import EditionMapSelectionViewUi
+from src.profiling.application.profiling_service import ProfilingService
 from ui.main_screen_view_ui import MainScreenViewUi
-from ui.play.play_agent_finish_position_selection_view_ui import PlayAgentFinishPositionSelectionViewUi
-from ui.play.play_agent_position_selection_view_ui import PlayAgentPositionSelectionViewUi
-from ui.play.play_agent_selection_view_ui import PlayAgentSelectionViewUi
-from ui.play.play_game_actions_view_ui import PlayGameActionsViewUi
-from ui.play.play_game_sensors_view_ui import PlayGameSensorsViewUi
-from ui.play.play_game_view_ui import PlayGameViewUi
-from ui.play.play_main_screen_view_ui import PlayMainScreenViewUi
-from ui.play.play_map_selection_view_ui import PlayMapSelectionViewUi
-from ui.play.play_terrain_selection_view_ui import PlayTerrainSelectionViewUi
+from ui.view.view_ui import ViewUi
 from ui.view.view_ui_constants import ViewUiConstants
 from ui.view.view_ui_repository import ViewUiService
 
 
 class AppUi:
-  def __init__(self, environment_agent_service: EnvironmentAgentService, environment_service: EnvironmentService, map_repository: MapRepository, terrain_repository: TerrainRepository):
+  def __init__(self, environment_agent_service: EnvironmentAgentService, environment_service: EnvironmentService, map_repository: MapRepository, terrain_repository: TerrainRepository, profiling_service: ProfilingService):
     self.__environment_agent_service = environment_agent_service
     self.__environment_service = environment_service
     self.__map_repository = map_repository
     self.__terrain_repository = terrain_repository
+    self.__profiling_service = profiling_service
 
   def start(self, page: flet.Page):
     page.title = "Menú Principal"
@@ -38,18 +30,44 @@ class AppUi:
     view_service: ViewUiService = ViewUiService(page)
 
     view_service.register(MainScreenViewUi(view_service))
-    view_service.register(PlayMainScreenViewUi(view_service))
-    view_service.register(PlayMapSelectionViewUi(self.__map_repository, view_service))
-    view_service.register(PlayTerrainSelectionViewUi(self.__environment_service, self.__terrain_repository, view_service))
-    view_service.register(PlayAgentSelectionViewUi(self.__environment_service, view_service))
-    view_service.register(PlayAgentPositionSelectionViewUi(self.__environment_service, view_service))
-    view_service.register(PlayAgentFinishPositionSelectionViewUi(self.__environment_service, view_service))
-    view_service.register(PlayGameViewUi(self.__environment_service, view_service))
-    view_service.register(PlayGameSensorsViewUi(self.__environment_agent_service, self.__environment_service, view_service))
-    view_service.register(PlayGameActionsViewUi(self.__environment_agent_service, self.__environment_service, view_service))
-    view_service.register(EditionMainScreenViewUi(view_service))
-    view_service.register(EditionMapSelectionViewUi(self.__map_repository, view_service))
-    view_service.register(CreationMainScreenViewUi(view_service))
-    view_service.register(CreationTerrainSelectionViewUi(self.__terrain_repository, view_service))
+
+    # F9 switches profiling while the app runs.
+    page.on_keyboard_event = lambda event: self.__switch_profiling(event, view_service)
+
+    # The rest of the views are imported and built on their first navigation, so the main screen shows right away. The
+    # methods listed with a view are profiled once its class is imported.
+    lazy_views: list[tuple[str, str, str, tuple, tuple[str, ...]]] = [
+      (ViewUiConstants.PLAY_MAIN_SCREEN_IDENTIFIER, 'ui.play.play_main_screen_view_ui', 'PlayMainScreenViewUi', (view_service,), ()),
+      (ViewUiConstants.PLAY_MAP_SELECTION_SCREEN_IDENTIFIER, 'ui.play.play_map_selection_view_ui', 'PlayMapSelectionViewUi', (self.__map_repository, view_service), ()),
+      (ViewUiConstants.PLAY_TERRAIN_SELECTION_SCREEN_IDENTIFIER, 'ui.play.play_terrain_selection_view_ui', 'PlayTerrainSelectionViewUi', (self.__environment_service, self.__terrain_repository, view_service), ()),
+      (ViewUiConstants.PLAY_AGENT_SELECTION_SCREEN_IDENTIFIER, 'ui.play.play_agent_selection_view_ui', 'PlayAgentSelectionViewUi', (self.__environment_service, view_service), ()),
+      (ViewUiConstants.PLAY_AGENT_POSITION_SELECTION_SCREEN_IDENTIFIER, 'ui.play.play_agent_position_selection_view_ui', 'PlayAgentPositionSelectionViewUi', (self.__environment_service, view_service), ('generate_visible_cells',)),
+      (ViewUiConstants.PLAY_AGENT_FINISH_POSITION_SELECTION_SCREEN_IDENTIFIER, 'ui.play.play_agent_finish_position_selection_view_ui', 'PlayAgentFinishPositionSelectionViewUi', (self.__environment_service, view_service), ('generate_visible_cells',)),
+      (ViewUiConstants.PLAY_GAME_SCREEN_IDENTIFIER, 'ui.play.play_game_view_ui', 'PlayGameViewUi', (self.__environment_service, view_service), ('refresh_visible_cells',)),
+      (ViewUiConstants.PLAY_GAME_SENSORS_SCREEN_IDENTIFIER, 'ui.play.play_game_sensors_view_ui', 'PlayGameSensorsViewUi', (self.__environment_agent_service, self.__environment_service, view_service), ()),
+      (ViewUiConstants.PLAY_GAME_ACTIONS_SCREEN_IDENTIFIER, 'ui.play.play_game_actions_view_ui', 'PlayGameActionsViewUi', (self.__environment_agent_service, self.__environment_service, view_service), ()),
+      (ViewUiConstants.EDITION_MAIN_SCREEN_IDENTIFIER, 'ui.edition.edition_main_screen_view_ui', 'EditionMainScreenViewUi', (view_service,), ()),
+      (ViewUiConstants.EDITION_MAP_SELECTION_SCREEN_IDENTIFIER, 'ui.edition.edition_map_selection_view_ui', 'EditionMapSelectionViewUi', (self.__map_repository, view_service), ()),
+      (ViewUiConstants.CREATION_MAIN_SCREEN_IDENTIFIER, 'ui.creation.creation_main_screen_view_ui', 'CreationMainScreenViewUi', (view_service,), ()),
+      (ViewUiConstants.CREATION_TERRAIN_SELECTION_SCREEN_IDENTIFIER, 'ui.creation.creation_terrain_selection_view_ui', 'CreationTerrainSelectionViewUi', (self.__terrain_repository, view_service), ())
+    ]
+    for identifier, module_name, class_name, arguments, profiled_methods in lazy_views:
+      view_service.register_factory(identifier, lambda module_name=module_name, class_name=class_name, arguments=arguments, profiled_methods=profiled_methods: self.create_view(module_name, class_name, arguments, profiled_methods))
 
     view_service.navigate_to(ViewUiConstants.MAIN_SCREEN_IDENTIFIER)
+
+  def create_view(self, module_name: str, class_name: str, arguments: tuple, profiled_methods: tuple[str, ...] = ()) -> ViewUi:
+    view_class: type[ViewUi] = getattr(importlib.import_module(module_name), class_name)
+    for method_name in profiled_methods:
+      self.__profiling_service.add_target(view_class, method_name, f"{module_name.rsplit('.', 1)[-1]}.{method_name}")
+    return view_class(*arguments)
+
+  def __switch_profiling(self, event: flet.KeyboardEvent, view_service: ViewUiService) -> None:
+    if event.key != 'F9':
+      return
+    if self.__profiling_service.is_enabled():
+      self.__profiling_service.disable()
+      view_service.show_alert('Perfilado desactivado')
+    else:
+      self.__profiling_service.enable()
+      view_service.show_alert('Perfilado activado')
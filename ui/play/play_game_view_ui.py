@@ -19,6 +19,8 @@ class PlayGameViewUi(ViewUi):
   SPACING = 5
   VISIBLE_COLUMNS = 26
   VISIBLE_ROWS = 26
+  AGENT_BORDER = flet.border.all(color='#00ff00', width=4)
+  SELECTED_BORDER = flet.border.all(color='#ff0000', width=4)
 
   def __init__(self, environment_service: EnvironmentService, view_service: ViewUiService):
     super().__init__(ViewUiConstants.PLAY_GAME_SCREEN_IDENTIFIER)
@@ -29,7 +31,10 @@ class PlayGameViewUi(ViewUi):
     self.cell_position_control: Optional[flet.Text] = None
     self.cell_cost_control: Optional[flet.Text] = None
     self.cell_flags_control: Optional[flet.Text] = None
-    self.last_selected_cell_control: Optional[flet.Control] = None
+    self.column_header_controls: list[flet.Text] = []
+    self.row_header_controls: list[flet.Text] = []
+    self.cell_controls: list[list[flet.Container]] = []
+    self.cell_states: list[list[Optional[tuple[str, Optional[flet.Border]]]]] = []
     self.start_row: int = 0
     self.start_col: int = 0
     self.selected_cell_row: int = 0
@@ -62,92 +67,60 @@ class PlayGameViewUi(ViewUi):
     else:
       self.cell_flags_control.value = f'Marcas: {', '.join(flags)}'
 
-  def on_click_cell(self, event: flet.ControlEvent, row: int, col: int):
+  def on_click_cell(self, event: flet.ControlEvent, pool_row: int, pool_col: int):
+    environment: Optional[Environment] = self.__environment_service.get_environment()
+    selected_agent: Optional[Agent] = environment.get_selected_agent() if environment is not None else None
+    row: int = self.start_row + pool_row
+    col: int = self.start_col + pool_col
+    if selected_agent is None or environment.get_cell(row, col) is None or not selected_agent.is_known(row, col):
+      return
     self.update_cell_information(row, col)
     self.cell_position_control.update()
     self.cell_terrain_control.update()
     self.cell_cost_control.update()
     self.cell_flags_control.update()
-    self.set_selected_cell(event.control, row, col)
-    event.control.update()
-
-  def set_selected_cell(self, control: flet.Control, row: int, col: int):
-    if self.last_selected_cell_control is not None:
-      self.last_selected_cell_control.border = None
-      self.last_selected_cell_control.update()
-    self.last_selected_cell_control = control
     self.selected_cell_row = row
     self.selected_cell_col = col
-    control.border = flet.border.all(color='#ff0000', width=4)
-
-  def generate_top_row(self, start_col: int) -> flet.Row:
-    return flet.Row(
-      controls=[
-                 flet.Container(width=self.CELL_SIZE, height=self.CELL_SIZE)  # Empty top-left corner
-               ] + [
-                 flet.Container(
-                   width=self.CELL_SIZE,
-                   height=self.CELL_SIZE,
-                   content=flet.Text(str(col), style=UiConstants.SMALL_TEXT_STYLE, text_align=flet.TextAlign.CENTER)
-                 ) for col in range(start_col, start_col + self.VISIBLE_COLUMNS)
-               ],
-      alignment=flet.MainAxisAlignment.CENTER,
-      spacing=self.SPACING,
-      run_spacing=self.SPACING
-    )
-
-  def generate_row_containers(self, row: int, start_col: int) -> list[flet.Container]:
-    row_containers: list[flet.Container] = [
-      flet.Container(
-        width=self.CELL_SIZE,
-        height=self.CELL_SIZE,
-        content=flet.Text(str(row), style=UiConstants.SMALL_TEXT_STYLE, text_align=flet.TextAlign.CENTER)
-      )
+    self.update_grid_view()
+
+  def create_grid_pool(self) -> list[flet.Row]:
+    """
+    Creates the fixed pool of controls of the viewport: the column headers, the row headers and one container per
+    visible cell. The controls are reused while scrolling, only their properties change.
+
+    Returns:
+      list[flet.Row]: The rows of the grid, starting with the column headers.
+    """
+    self.column_header_controls = [flet.Text(style=UiConstants.SMALL_TEXT_STYLE, text_align=flet.TextAlign.CENTER) for _ in range(self.VISIBLE_COLUMNS)]
+    self.row_header_controls = [flet.Text(style=UiConstants.SMALL_TEXT_STYLE, text_align=flet.TextAlign.CENTER) for _ in range(self.VISIBLE_ROWS)]
+    self.cell_controls = [
+      [
+        flet.Container(
+          width=self.CELL_SIZE,
+          height=self.CELL_SIZE,
+          visible=False,
+          on_click=lambda event, pool_row=pool_row, pool_col=pool_col: self.on_click_cell(event, pool_row, pool_col)
+        ) for pool_col in range(self.VISIBLE_COLUMNS)
+      ] for pool_row in range(self.VISIBLE_ROWS)
     ]
+    self.cell_states = [[None for _ in range(self.VISIBLE_COLUMNS)] for _ in range(self.VISIBLE_ROWS)]
 
-    selected_agent: Optional[Agent] = self.__environment_service.get_environment().get_selected_agent()
-    if selected_agent is None:
-      return row_containers
-
-    for col in range(start_col, start_col + self.VISIBLE_COLUMNS):
-      cell: Optional[Cell] = self.__environment_service.get_environment().get_cell(row, col)
-      if cell is None:
-        continue
-      if not selected_agent.is_known(row, col):
-        row_containers.append(
-          flet.Container(
-            width=self.CELL_SIZE,
-            height=self.CELL_SIZE,
-            bgcolor='#000000'
-          )
-        )
-        continue
-      cell_control: flet.Container = flet.Container(
-        width=self.CELL_SIZE,
-        height=self.CELL_SIZE,
-        bgcolor=cell.get_terrain().get_color(),
-        on_click=lambda event, selected_row=row, selected_col=col: self.on_click_cell(event, selected_row, selected_col)
+    grid_items: list[flet.Row] = [
+      flet.Row(
+        controls=[
+                   flet.Container(width=self.CELL_SIZE, height=self.CELL_SIZE)  # Empty top-left corner
+                 ] + [
+                   flet.Container(width=self.CELL_SIZE, height=self.CELL_SIZE, content=header_control) for header_control in self.column_header_controls
+                 ],
+        alignment=flet.MainAxisAlignment.CENTER,
+        spacing=self.SPACING,
+        run_spacing=self.SPACING
       )
-      if row == self.selected_cell_row and col == self.selected_cell_col:
-        self.set_selected_cell(cell_control, row, col)
-      if selected_agent.is_in_position(row, col):
-        cell_control.border = flet.border.all(color='#00ff00', width=4)
-        self.update_cell_information(row, col)
-      row_containers.append(cell_control)
-    return row_containers
-
-  def generate_visible_cells(self, start_row: int, start_col: int) -> list[flet.Row]:
-    grid_items: list[flet.Row] = []
-    self.last_selected_cell_control = None
-
-    # Add the top row with numbers starting from start_col
-    grid_items.append(self.generate_top_row(start_col))
-
-    for row in range(start_row, start_row + self.VISIBLE_ROWS):
-      row_containers = self.generate_row_containers(row, start_col)
+    ]
+    for pool_row in range(self.VISIBLE_ROWS):
       grid_items.append(
         flet.Row(
-          controls=row_containers,
+          controls=[flet.Container(width=self.CELL_SIZE, height=self.CELL_SIZE, content=self.row_header_controls[pool_row])] + self.cell_controls[pool_row],
           alignment=flet.MainAxisAlignment.CENTER,
           spacing=self.SPACING,
           run_spacing=self.SPACING
@@ -155,6 +128,46 @@ class PlayGameViewUi(ViewUi):
       )
     return grid_items
 
+  def refresh_visible_cells(self):
+    """
+    Updates the pool of the viewport to show the cells from the start row and column. Only the controls whose content
+    changed are modified, so the next update of the grid sends a diff of those controls to the client.
+    """
+    for pool_col, header_control in enumerate(self.column_header_controls):
+      value: str = str(self.start_col + pool_col)
+      if header_control.value != value:
+        header_control.value = value
+    for pool_row, header_control in enumerate(self.row_header_controls):
+      value: str = str(self.start_row + pool_row)
+      if header_control.value != value:
+        header_control.value = value
+
+    environment: Environment = self.__environment_service.get_environment()
+    selected_agent: Optional[Agent] = environment.get_selected_agent()
+    for pool_row in range(self.VISIBLE_ROWS):
+      row: int = self.start_row + pool_row
+      for pool_col in range(self.VISIBLE_COLUMNS):
+        col: int = self.start_col + pool_col
+        state: Optional[tuple[str, Optional[flet.Border]]] = None
+        cell: Optional[Cell] = environment.get_cell(row, col) if selected_agent is not None else None
+        if cell is not None and not selected_agent.is_known(row, col):
+          state = ('#000000', None)
+        elif cell is not None:
+          border: Optional[flet.Border] = None
+          if selected_agent.is_in_position(row, col):
+            border = self.AGENT_BORDER
+          elif row == self.selected_cell_row and col == self.selected_cell_col:
+            border = self.SELECTED_BORDER
+          state = (cell.get_terrain().get_color(), border)
+
+        if state == self.cell_states[pool_row][pool_col]:
+          continue
+        self.cell_states[pool_row][pool_col] = state
+        cell_control: flet.Container = self.cell_controls[pool_row][pool_col]
+        cell_control.visible = state is not None
+        if state is not None:
+          cell_control.bgcolor, cell_control.border = state
+
   def create_navigation_buttons(self) -> flet.Row:
     up_button = flet.ElevatedButton('⬆', style=UiConstants.BUTTON_STYLE, on_click=self.on_up_click)
     down_button = flet.ElevatedButton('⬇', style=UiConstants.BUTTON_STYLE, on_click=self.on_down_click)
@@ -188,7 +201,9 @@ class PlayGameViewUi(ViewUi):
     self.start_col = selected_agent.get_y() if selected_agent.get_y() - self.VISIBLE_COLUMNS >= 0 else 0
 
     # Inicializar las celdas visibles
-    grid_items: list[flet.Row] = self.generate_visible_cells(self.start_row, self.start_col)
+    grid_items: list[flet.Row] = self.create_grid_pool()
+    self.refresh_visible_cells()
+    self.update_cell_information(selected_agent.get_x(), selected_agent.get_y())
     self.grid_view = flet.Column(
       controls=grid_items,
       spacing=self.SPACING,
@@ -266,8 +281,7 @@ class PlayGameViewUi(ViewUi):
     self.__view_service.navigate_to(ViewUiConstants.PLAY_GAME_ACTIONS_SCREEN_IDENTIFIER)
 
   def update_grid_view(self):
-    new_grid_items = self.generate_visible_cells(self.start_row, self.start_col)
-    self.grid_view.controls = new_grid_items
+    self.refresh_visible_cells()
     self.grid_view.update()
 
   def on_up_click(self, e):
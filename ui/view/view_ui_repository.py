@@ -1,3 +1,5 @@
+from typing import Callable, Optional
+
 import flet
 
 from ui.ui_constants import UiConstants
@@ -8,13 +10,18 @@ class ViewUiService:
   def __init__(self, page: flet.Page):
     self.__page: flet.Page = page
     self.__views: dict[str, ViewUi] = {}
+    # Views registered by factory are built, and their modules imported, the first time they are requested.
+    self.__view_factories: dict[str, Callable[[], ViewUi]] = {}
 
   def register(self, view: ViewUi) -> None:
     self.__views[view.get_identifier()] = view
 
+  def register_factory(self, identifier: str, view_factory: Callable[[], ViewUi]) -> None:
+    self.__view_factories[identifier] = view_factory
+
   def create_control(self, identifier: str) -> list[flet.Control]:
-    if identifier in self.__views:
-      view_instance: ViewUi = self.__views[identifier]
+    view_instance: Optional[ViewUi] = self.__get_view(identifier)
+    if view_instance is not None:
       return view_instance.create_control()
     else:
       raise ValueError(f"View '{identifier}' not registered.")
@@ -25,11 +32,16 @@ class ViewUiService:
     self.__page.update()
 
   def navigate_to(self, identifier: str) -> None:
-    if identifier in self.__views:
-      view_instance: ViewUi = self.__views[identifier]
+    view_instance: Optional[ViewUi] = self.__get_view(identifier)
+    if view_instance is not None:
       view_instance.render(self.__page)
     else:
       raise ValueError(f"View '{identifier}' not registered.")
 
   def close(self) -> None:
     self.__page.window.close()
+
+  def __get_view(self, identifier: str) -> Optional[ViewUi]:
+    if identifier not in self.__views and identifier in self.__view_factories:
+      self.register(self.__view_factories.pop(identifier)())
+    return self.__views.get(identifier)